@@ -69,13 +69,47 @@ CREATE TABLE IF NOT EXISTS {schema}.podcasts (
 );
 
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_podcasts_status ON {schema}.podcasts(status);
+-- (status, id) also serves status-only lookups, so the old single-column index is dropped
+CREATE INDEX IF NOT EXISTS idx_podcasts_status_id ON {schema}.podcasts(status, id);
+DROP INDEX IF EXISTS {schema}.idx_podcasts_status;
+-- Episodes that can be transcribed (batch jobs only look at rows with an audio file)
+CREATE INDEX IF NOT EXISTS idx_podcasts_status_with_audio ON {schema}.podcasts(status) WHERE audio_file_path IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_podcasts_processed_at ON {schema}.podcasts(processed_at);
 CREATE INDEX IF NOT EXISTS idx_podcasts_published_at ON {schema}.podcasts(published_at);
 CREATE INDEX IF NOT EXISTS idx_podcasts_feed_name ON {schema}.podcasts(podcast_feed_name);
+CREATE INDEX IF NOT EXISTS idx_podcasts_feed_url ON {schema}.podcasts(feed_url);
 CREATE INDEX IF NOT EXISTS idx_podcasts_transcript_gin ON {schema}.podcasts USING GIN(transcript);
 CREATE INDEX IF NOT EXISTS idx_podcasts_summary_gin ON {schema}.podcasts USING GIN(summary);
 
+-- Unique episode_url lets save_podcast upsert with INSERT ... ON CONFLICT (episode_url)
+-- and makes the plain episode_url index redundant, so that one is dropped
+-- Skipped if duplicates already exist; save_podcast then keeps its select-then-write path
+-- and lookups use the plain index instead
+DO $$
+BEGIN
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_podcasts_episode_url_unique ON {schema}.podcasts(episode_url);
+    DROP INDEX IF EXISTS {schema}.idx_podcasts_episode_url;
+EXCEPTION
+    WHEN unique_violation THEN
+        RAISE NOTICE 'Duplicate episode_url values found, unique index not created';
+        CREATE INDEX IF NOT EXISTS idx_podcasts_episode_url ON {schema}.podcasts(episode_url);
+END
+$$;
+
+-- Compress large transcript/summary values with lz4 instead of pglz (PostgreSQL 14+ built with lz4)
+-- Only affects newly written values; skipped on servers without lz4 support
+DO $$
+BEGIN
+    IF current_setting('server_version_num')::int >= 140000 THEN
+        ALTER TABLE {schema}.podcasts ALTER COLUMN transcript SET COMPRESSION lz4;
+        ALTER TABLE {schema}.podcasts ALTER COLUMN summary SET COMPRESSION lz4;
+    END IF;
+EXCEPTION
+    WHEN feature_not_supported THEN
+        RAISE NOTICE 'lz4 compression not available, keeping default pglz';
+END
+$$;
+
 -- Function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -85,13 +119,16 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
--- Triggers to auto-update updated_at
+-- Triggers to auto-update updated_at (dropped first so re-running this file succeeds)
+DROP TRIGGER IF EXISTS update_users_updated_at ON {schema}.users;
 CREATE TRIGGER update_users_updated_at BEFORE UPDATE ON {schema}.users
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+DROP TRIGGER IF EXISTS update_feeds_updated_at ON {schema}.feeds;
 CREATE TRIGGER update_feeds_updated_at BEFORE UPDATE ON {schema}.feeds
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+DROP TRIGGER IF EXISTS update_podcasts_updated_at ON {schema}.podcasts;
 CREATE TRIGGER update_podcasts_updated_at BEFORE UPDATE ON {schema}.podcasts
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
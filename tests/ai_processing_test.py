@@ -3,11 +3,16 @@ Test AI processing (transcription and summarization) with real data.
 Tests transcriber and processor with actual episodes from config/feeds.yaml
 """
 
-import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
+# Close the test database in the background while results are written
+CLOSE_ASYNC = True
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -18,6 +23,83 @@ from utils.cleaner_xai import TranscriptCleaner
 from utils.download import load_feeds_config
 from utils.audio import check_ffmpeg_installed
 from utils.downloader import PodcastDownloader
+from utils.console import write_json_report
+
+
+def _probe_ffmpeg():
+    """Test 1: Check ffmpeg installation"""
+    test_result = {
+        "name": "ffmpeg_check",
+        "status": "pending",
+        "message": ""
+    }
+    
+    try:
+        is_installed, version_info = check_ffmpeg_installed()
+        if is_installed:
+            test_result["status"] = "passed"
+            test_result["message"] = "ffmpeg is installed"
+            test_result["version_info"] = version_info[:50] if version_info else None
+        else:
+            test_result["status"] = "failed"
+            test_result["message"] = "ffmpeg is not installed or not in PATH"
+    except Exception as e:
+        test_result["status"] = "failed"
+        test_result["message"] = f"Failed to check ffmpeg: {str(e)}"
+    
+    return test_result
+
+
+def _probe_api_key():
+    """Test 2: Check API key. Returns (test_result, api_key or None)."""
+    test_result = {
+        "name": "api_key_check",
+        "status": "pending",
+        "message": ""
+    }
+    
+    try:
+        api_key = get_api_key()
+        test_result["status"] = "passed"
+        test_result["message"] = "API key found"
+    except ValueError as e:
+        test_result["status"] = "skipped"
+        test_result["message"] = f"API key not found: {str(e)}"
+        api_key = None
+    except Exception as e:
+        test_result["status"] = "failed"
+        test_result["message"] = f"Failed to get API key: {str(e)}"
+        api_key = None
+    
+    return test_result, api_key
+
+
+def _probe_feeds():
+    """Test 3: Load feeds and get actual feed. Returns (test_result, feeds)."""
+    test_result = {
+        "name": "load_actual_feeds",
+        "status": "pending",
+        "message": ""
+    }
+    
+    try:
+        config = load_feeds_config()
+        feeds = config.get('feeds', [])
+        
+        if not feeds:
+            test_result["status"] = "skipped"
+            test_result["message"] = "No feeds configured in config/feeds.yaml"
+        else:
+            test_result["status"] = "passed"
+            test_result["message"] = f"Loaded {len(feeds)} feeds from config"
+            test_result["feed_count"] = len(feeds)
+            test_result["first_feed"] = feeds[0].get('name')
+    except Exception as e:
+        test_result["status"] = "failed"
+        test_result["message"] = f"Failed to load feeds: {str(e)}"
+        feeds = []
+    
+    return test_result, feeds
 
 
 def test_ai_processing():
@@ -29,52 +111,22 @@ def test_ai_processing():
     }
     
     test_db_path = "data/test_ai_processing.duckdb"
+    close_thread = None
     
     try:
         db = P3Database(db_path=test_db_path)
         
-        # Test 1: Check ffmpeg installation
-        test_result = {
-            "name": "ffmpeg_check",
-            "status": "pending",
-            "message": ""
-        }
+        # Tests 1-3 are independent probes, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            fut_ffmpeg = ex.submit(_probe_ffmpeg)
+            fut_key = ex.submit(_probe_api_key)
+            fut_feeds = ex.submit(_probe_feeds)
         
-        try:
-            is_installed, version_info = check_ffmpeg_installed()
-            if is_installed:
-                test_result["status"] = "passed"
-                test_result["message"] = "ffmpeg is installed"
-                test_result["version_info"] = version_info[:50] if version_info else None
-            else:
-                test_result["status"] = "failed"
-                test_result["message"] = "ffmpeg is not installed or not in PATH"
-        except Exception as e:
-            test_result["status"] = "failed"
-            test_result["message"] = f"Failed to check ffmpeg: {str(e)}"
-        
-        results["tests"].append(test_result)
+        # Test 1: Check ffmpeg installation
+        results["tests"].append(fut_ffmpeg.result())
         
         # Test 2: Check API key
-        test_result = {
-            "name": "api_key_check",
-            "status": "pending",
-            "message": ""
-        }
-        
-        try:
-            api_key = get_api_key()
-            test_result["status"] = "passed"
-            test_result["message"] = "API key found"
-        except ValueError as e:
-            test_result["status"] = "skipped"
-            test_result["message"] = f"API key not found: {str(e)}"
-            api_key = None
-        except Exception as e:
-            test_result["status"] = "failed"
-            test_result["message"] = f"Failed to get API key: {str(e)}"
-            api_key = None
-        
+        test_result, api_key = fut_key.result()
         results["tests"].append(test_result)
         
         if not api_key:
@@ -83,29 +135,7 @@ def test_ai_processing():
             return results
         
         # Test 3: Load feeds and get actual feed
-        test_result = {
-            "name": "load_actual_feeds",
-            "status": "pending",
-            "message": ""
-        }
-        
-        try:
-            config = load_feeds_config()
-            feeds = config.get('feeds', [])
-            
-            if not feeds:
-                test_result["status"] = "skipped"
-                test_result["message"] = "No feeds configured in config/feeds.yaml"
-            else:
-                test_result["status"] = "passed"
-                test_result["message"] = f"Loaded {len(feeds)} feeds from config"
-                test_result["feed_count"] = len(feeds)
-                test_result["first_feed"] = feeds[0].get('name')
-        except Exception as e:
-            test_result["status"] = "failed"
-            test_result["message"] = f"Failed to load feeds: {str(e)}"
-            feeds = []
-        
+        test_result, feeds = fut_feeds.result()
         results["tests"].append(test_result)
         
         if not feeds:
@@ -120,7 +150,6 @@ def test_ai_processing():
             "message": ""
         }
         
-        episode_id = None
         try:
             downloader = PodcastDownloader(db, data_dir="data/test_audio", max_episodes=1)
             first_feed = feeds[0]
@@ -137,13 +166,12 @@ def test_ai_processing():
             
             if count > 0:
                 # Get the downloaded episode
-                episodes = db.get_episodes_by_status('downloaded')
-                if episodes:
-                    episode_id = episodes[0]['id']
+                row = db.get_first_episode_by_status('downloaded')
+                if row:
                     test_result["status"] = "passed"
                     test_result["message"] = f"Downloaded {count} episode(s) for testing"
-                    test_result["episode_id"] = episode_id
-                    test_result["episode_title"] = episodes[0]['title']
+                    test_result["episode_id"] = row['id']
+                    test_result["episode_title"] = row['title']
                 else:
                     test_result["status"] = "skipped"
                     test_result["message"] = "No episodes downloaded"
@@ -168,19 +196,26 @@ def test_ai_processing():
             test_result["status"] = "passed"
             test_result["message"] = "Transcriber initialized successfully"
             
-            # If we have an episode, try to transcribe it
-            if episode_id:
-                try:
-                    success = transcriber.transcribe_episode(episode_id)
-                    if success:
-                        test_result["message"] += " - Successfully transcribed test episode"
-                        test_result["transcription_success"] = True
-                    else:
-                        test_result["message"] += " - Transcription attempted but failed"
-                        test_result["transcription_success"] = False
-                except Exception as e:
-                    test_result["message"] += f" - Transcription error: {str(e)[:50]}"
-                    test_result["transcription_error"] = str(e)[:100]
+            # If we have episodes, transcribe them in parallel (API calls are I/O-bound)
+            episodes = db.get_episodes_by_status('downloaded')
+            if episodes:
+                transcribed_ids = []
+                errors = {}
+                with ThreadPoolExecutor(max_workers=5) as ex:
+                    futs = {ex.submit(transcriber.transcribe_episode, e['id']): e for e in episodes}
+                    for fut in as_completed(futs):
+                        episode = futs[fut]
+                        try:
+                            if fut.result():
+                                transcribed_ids.append(episode['id'])
+                        except Exception as e:
+                            errors[episode['id']] = str(e)[:100]
+                
+                test_result["message"] += f" - Transcribed {len(transcribed_ids)}/{len(episodes)} episode(s)"
+                test_result["transcription_success"] = len(transcribed_ids) == len(episodes)
+                test_result["transcribed_ids"] = transcribed_ids
+                if errors:
+                    test_result["transcription_errors"] = errors
         except Exception as e:
             test_result["status"] = "failed"
             test_result["message"] = f"Failed to initialize transcriber: {str(e)}"
@@ -202,19 +237,25 @@ def test_ai_processing():
             # Check if we have transcribed episodes
             transcribed = db.get_episodes_by_status('transcribed')
             if transcribed:
-                episode_id_to_summarize = transcribed[0]['id']
-                try:
-                    summary = cleaner.generate_summary(episode_id_to_summarize)
-                    if summary:
-                        test_result["message"] += " - Successfully generated summary"
-                        test_result["summary_success"] = True
-                        test_result["summary_keys"] = list(summary.keys())
-                    else:
-                        test_result["message"] += " - Summary generation attempted but returned None"
-                        test_result["summary_success"] = False
-                except Exception as e:
-                    test_result["message"] += f" - Summary error: {str(e)[:50]}"
-                    test_result["summary_error"] = str(e)[:100]
+                summarized_ids = []
+                errors = {}
+                with ThreadPoolExecutor(max_workers=5) as ex:
+                    futs = {ex.submit(cleaner.generate_summary, e['id']): e for e in transcribed}
+                    for fut in as_completed(futs):
+                        episode = futs[fut]
+                        try:
+                            summary = fut.result()
+                            if summary:
+                                summarized_ids.append(episode['id'])
+                                test_result["summary_keys"] = list(summary.keys())
+                        except Exception as e:
+                            errors[episode['id']] = str(e)[:100]
+                
+                test_result["message"] += f" - Generated {len(summarized_ids)}/{len(transcribed)} summary(ies)"
+                test_result["summary_success"] = len(summarized_ids) == len(transcribed)
+                test_result["summarized_ids"] = summarized_ids
+                if errors:
+                    test_result["summary_errors"] = errors
             else:
                 test_result["message"] += " - No transcribed episodes available for summarization"
         except Exception as e:
@@ -224,13 +265,18 @@ def test_ai_processing():
         results["tests"].append(test_result)
         
         # Cleanup
-        db.close()
+        if CLOSE_ASYNC:
+            close_thread = threading.Thread(target=db.close, daemon=True)
+            close_thread.start()
+        else:
+            db.close()
         
         # Calculate summary
         total_tests = len(results["tests"])
-        passed_tests = sum(1 for t in results["tests"] if t["status"] == "passed")
-        failed_tests = sum(1 for t in results["tests"] if t["status"] == "failed")
-        skipped_tests = sum(1 for t in results["tests"] if t["status"] == "skipped")
+        status_counts = Counter(t["status"] for t in results["tests"])
+        passed_tests = status_counts["passed"]
+        failed_tests = status_counts["failed"]
+        skipped_tests = status_counts["skipped"]
         
         results["summary"] = {
             "total": total_tests,
@@ -243,17 +289,20 @@ def test_ai_processing():
     except Exception as e:
         results["error"] = str(e)
     
-    # Save results
-    output_dir = Path("test-results")
-    output_dir.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = output_dir / f"ai_processing_test_{timestamp}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
-    
-    print(f"AI processing test results saved to {output_file}")
-    print(f"Summary: {results.get('summary', {})}")
+    try:
+        # Save results
+        output_dir = Path("test-results")
+        output_dir.mkdir(exist_ok=True)
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = output_dir / f"ai_processing_test_{timestamp}.json"
+        write_json_report(output_file, results)
+        
+        print(f"AI processing test results saved to {output_file}")
+        print(f"Summary: {results.get('summary', {})}")
+    finally:
+        if close_thread is not None:
+            close_thread.join(timeout=10)
     
     return results
 
@@ -2,11 +2,12 @@
 Test database module functionality
 """
 
-import json
 import os
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from utils.database import P3Database
+from utils.console import write_json_report
 
 
 def test_database():
@@ -158,8 +159,9 @@ def test_database():
         
         # Calculate summary
         total_tests = len(results["tests"])
-        passed_tests = sum(1 for t in results["tests"] if t["status"] == "passed")
-        failed_tests = sum(1 for t in results["tests"] if t["status"] == "failed")
+        status_counts = Counter(t["status"] for t in results["tests"])
+        passed_tests = status_counts["passed"]
+        failed_tests = status_counts["failed"]
         
         results["summary"] = {
             "total": total_tests,
@@ -177,8 +179,7 @@ def test_database():
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = output_dir / f"database_test_{timestamp}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    write_json_report(output_file, results)
     
     print(f"Database test results saved to {output_file}")
     print(f"Summary: {results.get('summary', {})}")
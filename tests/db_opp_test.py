@@ -3,8 +3,8 @@ Test db/opp.duckdb database schema and operations.
 Verifies that the database is created correctly and basic operations work.
 """
 
-import json
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
@@ -22,6 +22,7 @@ from utils.db_util import (
     test_database_operations
 )
 from utils.download import load_feeds_config, download_feeds
+from utils.console import write_json_report
 
 
 def test_db_opp():
@@ -216,9 +217,10 @@ def test_db_opp():
         
         # Calculate summary
         total_tests = len(results["tests"])
-        passed_tests = sum(1 for t in results["tests"] if t["status"] == "passed")
-        failed_tests = sum(1 for t in results["tests"] if t["status"] == "failed")
-        skipped_tests = sum(1 for t in results["tests"] if t["status"] == "skipped")
+        status_counts = Counter(t["status"] for t in results["tests"])
+        passed_tests = status_counts["passed"]
+        failed_tests = status_counts["failed"]
+        skipped_tests = status_counts["skipped"]
         
         results["summary"] = {
             "total": total_tests,
@@ -237,8 +239,7 @@ def test_db_opp():
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = output_dir / f"db_opp_test_{timestamp}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    write_json_report(output_file, results)
     
     print(f"DB OPP test results saved to {output_file}")
     print(f"Summary: {results.get('summary', {})}")
@@ -3,6 +3,7 @@
 Test script to download episodes from the first 5 trading podcasts.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -11,7 +12,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.postgres_db import PostgresDB
 from utils.download import load_feeds_config
-from utils.downloader import PodcastDownloader
+from utils.downloader import PodcastDownloader, sanitize_title
+
+
+def _stat_or_none(path):
+    """Return os.stat() for path, or None if it is missing/unreadable."""
+    if not path:
+        return None
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
 def test_download_first_5_feeds():
@@ -60,6 +71,9 @@ def test_download_first_5_feeds():
         'feed_results': {}
     }
     
+    # (feed_name, podcast row) for downloaded episodes, saved in one batch after the loop
+    pending_saves = []
+    
     for idx, feed_config in enumerate(first_5_feeds, 1):
         feed_name = feed_config['name']
         feed_url = feed_config['url']
@@ -94,32 +108,28 @@ def test_download_first_5_feeds():
             episode_data = episodes[0]
             print(f"  ✓ Found episode: {episode_data['title'][:70]}...")
             
-            # Check if episode already exists in database
-            if db.episode_exists(episode_data['url']):
+            # Check if episode already exists in database (indexed lookup by episode URL)
+            episode = db.get_episode_by_url(episode_data['url'])
+            if episode:
                 print(f"  ℹ️  Episode already exists in database, checking file...")
-                all_episodes = db.get_episodes_by_status('downloaded')
-                episode = next((e for e in all_episodes if e.get('episode_url') == episode_data['url']), None)
-                if episode:
-                    # Check if file actually exists on disk
-                    file_path = episode.get('audio_file_path') or episode.get('file_path')
-                    if file_path and Path(file_path).exists():
-                        print(f"  ✓ Using existing episode (ID: {episode['id']})")
-                        print(f"     File: {file_path}")
-                        results['feed_results'][feed_name] = {'downloaded': 0, 'episode_id': episode['id'], 'existing': True}
-                    else:
-                        print(f"  ⚠️  Episode in DB but file missing, will re-download")
-                        # Continue to download below
-                    if file_path and Path(file_path).exists():
-                        continue
-                else:
-                    print(f"  ⚠️  Episode marked as existing but not found, will download")
-                    # Continue to download below
+                # Check if file actually exists on disk
+                file_path = episode.get('audio_file_path') or episode.get('file_path')
+                if _stat_or_none(file_path) is not None:
+                    print(f"  ✓ Using existing episode (ID: {episode['id']})")
+                    print(f"     File: {file_path}")
+                    results['feed_results'][feed_name] = {
+                        'downloaded': 0, 'episode_id': episode['id'], 'existing': True,
+                        'title': episode['title'], 'file_path': file_path
+                    }
+                    continue
+                print(f"  ⚠️  Episode in DB but file missing, will re-download")
+                # Continue to download below
             
             # Download episode
             print(f"  📥 Downloading episode...")
             from datetime import datetime
-            safe_title = "".join(c for c in episode_data['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename = f"{podcast_id}_{safe_title[:50]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            safe_title = sanitize_title(episode_data['title'])[:50]
+            filename = f"{podcast_id}_{safe_title}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
             file_path = downloader.download_episode(episode_data['url'], filename)
             
@@ -130,29 +140,20 @@ def test_download_first_5_feeds():
             
             print(f"  ✓ Episode downloaded: {file_path}")
             
-            # Add to database using PostgreSQL save_podcast method
-            print(f"  💾 Saving to PostgreSQL...")
-            # Calculate file size
-            file_size_bytes = None
-            if Path(file_path).exists():
-                file_size_bytes = Path(file_path).stat().st_size
-            
-            episode_id = db.save_podcast(
-                title=episode_data['title'],
-                description=episode_data.get('description'),
-                feed_url=feed_url,
-                episode_url=episode_data['url'],
-                published_at=episode_data['date'],
-                audio_file_path=file_path,
-                file_size_bytes=file_size_bytes,
-                status='downloaded',
-                podcast_feed_name=feed_name,
-                podcast_category=feed_category
-            )
-            
-            print(f"  ✅ Episode saved (ID: {episode_id})")
-            results['feed_results'][feed_name] = {'downloaded': 1, 'episode_id': episode_id}
-            results['total_downloaded'] += 1
+            # Queue for a single bulk save after all downloads
+            st = _stat_or_none(file_path)
+            pending_saves.append((feed_name, {
+                'title': episode_data['title'],
+                'description': episode_data.get('description'),
+                'feed_url': feed_url,
+                'episode_url': episode_data['url'],
+                'published_at': episode_data['date'],
+                'audio_file_path': file_path,
+                'file_size_bytes': st.st_size if st is not None else None,
+                'status': 'downloaded',
+                'podcast_feed_name': feed_name,
+                'podcast_category': feed_category
+            }))
             
         except Exception as e:
             print(f"  ❌ Error processing feed: {e}")
@@ -160,6 +161,25 @@ def test_download_first_5_feeds():
             traceback.print_exc()
             results['feed_results'][feed_name] = {'downloaded': 0, 'error': str(e)}
     
+    # Save all downloaded episodes in one round-trip
+    if pending_saves:
+        print(f"\n💾 Saving {len(pending_saves)} episode(s) to PostgreSQL...")
+        try:
+            episode_ids = db.save_podcasts_bulk([row for _, row in pending_saves])
+            for (feed_name, row), episode_id in zip(pending_saves, episode_ids):
+                print(f"  ✅ {feed_name}: Episode saved (ID: {episode_id})")
+                results['feed_results'][feed_name] = {
+                    'downloaded': 1, 'episode_id': episode_id,
+                    'title': row['title'], 'file_path': row['audio_file_path']
+                }
+                results['total_downloaded'] += 1
+        except Exception as e:
+            print(f"  ❌ Error saving episodes: {e}")
+            import traceback
+            traceback.print_exc()
+            for feed_name, _ in pending_saves:
+                results['feed_results'][feed_name] = {'downloaded': 0, 'error': str(e)}
+    
     # Summary
     print("\n" + "=" * 70)
     print("DOWNLOAD SUMMARY")
@@ -178,24 +198,33 @@ def test_download_first_5_feeds():
     print("\n" + "=" * 70)
     print("EPISODES READY FOR TRANSCRIPTION")
     print("=" * 70)
-    downloaded_episodes = db.get_episodes_by_status('downloaded')
-    
-    if downloaded_episodes:
+    # Episodes touched by this run are already known; only hit the DB for a full listing on request
+    just_added = [(name, r) for name, r in results['feed_results'].items() if 'episode_id' in r]
+    
+    if just_added:
+        print(f"\nFound {len(just_added)} episode(s) from this run:\n")
+        for feed_name, feed_result in just_added:
+            print(f"  ID: {feed_result['episode_id']} - {feed_result['title'][:60]}...")
+            print(f"      Podcast: {feed_name}")
+            print(f"      File: {feed_result.get('file_path', 'N/A')}")
+            print()
+    elif os.getenv('VERBOSE'):
+        downloaded_episodes = db.get_episodes_by_status('downloaded')
         print(f"\nFound {len(downloaded_episodes)} episode(s) with status 'downloaded':\n")
         for ep in downloaded_episodes[:10]:  # Show first 10
             print(f"  ID: {ep['id']} - {ep['title'][:60]}...")
-            print(f"      Podcast: {ep.get('podcast_title', 'Unknown')}")
-            print(f"      File: {ep.get('file_path', 'N/A')}")
+            print(f"      Podcast: {ep.get('podcast_feed_name', 'Unknown')}")
+            print(f"      File: {ep.get('audio_file_path', 'N/A')}")
             print()
     else:
-        print("\n⚠️  No episodes with 'downloaded' status found")
+        print("\n⚠️  No episodes from this run (set VERBOSE=1 to list all 'downloaded' episodes)")
     
     db.close()
     
     print("=" * 70)
     if results['total_downloaded'] > 0:
         print("✅ Download test completed successfully!")
-        print(f"   Ready to transcribe {len(downloaded_episodes)} episode(s)")
+        print(f"   Ready to transcribe {len(just_added)} episode(s)")
     else:
         print("ℹ️  Download test completed (no new episodes downloaded)")
     print("=" * 70)
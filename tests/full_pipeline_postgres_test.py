@@ -3,30 +3,155 @@
 Full pipeline test for one podcast episode using PostgreSQL only.
 Tests: Download -> Transcribe -> Summarize
 Verifies each step and ensures data is saved to PostgreSQL.
+
+Set PIPELINE_ALL_FEEDS=1 to instead run the latest episode of every configured
+feed, overlapping downloads with transcription/summarization.
 """
 
+import os
 import sys
+import queue
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional
 import time
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.postgres_db import PostgresDB
 from utils.download import load_feeds_config
-from utils.downloader import PodcastDownloader
+from utils.downloader import PodcastDownloader, sanitize_title
+from utils.audio_chunking import get_audio_duration
 from utils.processing import transcribe_episode, summarize_episode
 from utils.config import get_groq_api_key
+from utils.console import buffer_stdout
 
+# Episode downloads in flight during the pipelined multi-feed run
+MAX_PARALLEL_DOWNLOADS = 4
 
-def verify_postgres_episode(pg_db: PostgresDB, episode_url: str, step: str) -> dict:
-    """Verify episode exists in PostgreSQL."""
-    episode = pg_db.get_podcast_by_url(episode_url)
-    if episode:
-        print(f"  ✅ Found in PostgreSQL (ID: {episode['id']}, Status: {episode['status']})")
-        return episode
-    else:
-        print(f"  ❌ Not found in PostgreSQL")
+
+def file_info(path) -> Optional[os.stat_result]:
+    """Stat a file once, returning None if it doesn't exist (instead of a racy exists() check)."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def download_latest_episode(pg_db: PostgresDB, downloader: PodcastDownloader, feed_config: dict, episode_data: dict):
+    """Download one feed's latest episode (reusing an existing file) and return its PostgreSQL ID."""
+    from datetime import datetime
+    feed_name = feed_config.get('name', 'Unknown')
+    feed_url = feed_config.get('url')
+    feed_category = feed_config.get('category', 'trading')
+    
+    podcast_id = downloader.add_feed(feed_name, feed_url, feed_category)
+    
+    existing = pg_db.get_podcast_by_url(episode_data['url'])
+    if existing and existing.get('audio_file_path') and file_info(existing['audio_file_path']):
+        return existing['id']
+    
+    safe_title = sanitize_title(episode_data['title'])
+    filename = f"{podcast_id}_{safe_title[:50]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    file_path, file_size_bytes = downloader.download_episode_with_size(episode_data['url'], filename)
+    if not file_path:
         return None
+    
+    return pg_db.save_podcast(
+        title=episode_data['title'],
+        feed_url=feed_url,
+        episode_url=episode_data['url'],
+        published_at=episode_data.get('date'),
+        audio_file_path=file_path,
+        file_size_bytes=file_size_bytes,
+        status='downloaded',
+        podcast_feed_name=feed_name,
+        podcast_category=feed_category
+    )
+
+
+def run_pipelined_feeds(pg_db: PostgresDB, downloader: PodcastDownloader, feeds: list, feed_episodes: list) -> bool:
+    """
+    Run the pipeline for the latest episode of every feed, overlapping steps.
+    
+    Downloads run concurrently (capped per podcast host by the downloader) while
+    a processing thread transcribes and summarizes finished downloads in
+    completion order. The queue is bounded so only a couple of downloaded but
+    unprocessed files wait on disk.
+    """
+    print("\n" + "=" * 70)
+    print(f"PIPELINED RUN: {len(feeds)} feeds (download overlaps transcribe/summarize)")
+    print("=" * 70)
+    
+    work = queue.Queue(maxsize=2)
+    results = {}  # feed_name -> (episode_id, success, error)
+    
+    def produce():
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as download_pool:
+                futures = {}
+                for feed_config, episodes in zip(feeds, feed_episodes):
+                    feed_name = feed_config.get('name', 'Unknown')
+                    if not episodes:
+                        results[feed_name] = (None, False, 'No episodes found')
+                        continue
+                    print(f"\n📥 [{feed_name}] Downloading latest episode...")
+                    future = download_pool.submit(download_latest_episode, pg_db, downloader, feed_config, episodes[0])
+                    futures[future] = feed_name
+                
+                for future in as_completed(futures):
+                    feed_name = futures[future]
+                    try:
+                        episode_id = future.result()
+                    except Exception as e:
+                        results[feed_name] = (None, False, f'Download failed: {e}')
+                        continue
+                    if episode_id is None:
+                        results[feed_name] = (None, False, 'Download failed')
+                        continue
+                    work.put((feed_name, episode_id))
+        finally:
+            work.put(None)
+    
+    def consume():
+        while True:
+            item = work.get()
+            if item is None:
+                break
+            feed_name, episode_id = item
+            # Keep draining until the sentinel so a failure can't leave the producer blocked on put()
+            try:
+                status = (pg_db.get_episode_by_id(episode_id) or {}).get('status')
+                success, error = True, None
+                if status not in ('transcribed', 'processed'):
+                    print(f"\n🎙️  [{feed_name}] Transcribing episode {episode_id}...")
+                    success, error = transcribe_episode(episode_id, pg_db)
+                if success and status != 'processed':
+                    print(f"\n🧠 [{feed_name}] Summarizing episode {episode_id}...")
+                    success, error, _ = summarize_episode(episode_id, pg_db)
+            except Exception as e:
+                success, error = False, str(e)
+            results[feed_name] = (episode_id, success, error)
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        producer = executor.submit(produce)
+        consumer = executor.submit(consume)
+        producer.result()
+        consumer.result()
+    
+    print("\n" + "=" * 70)
+    print("PIPELINED RUN SUMMARY")
+    print("=" * 70)
+    for feed_config in feeds:
+        feed_name = feed_config.get('name', 'Unknown')
+        episode_id, success, error = results.get(feed_name, (None, False, 'Not processed'))
+        if success:
+            print(f"  ✅ {feed_name}: episode {episode_id} processed")
+        else:
+            print(f"  ❌ {feed_name}: {error}")
+    
+    return all(success for _, success, _ in results.values())
 
 
 def test_full_pipeline():
@@ -44,21 +169,17 @@ def test_full_pipeline():
         print("❌ No feeds configured")
         return False
     
-    # Get first trading podcast (should be at index 0)
-    feed_config = feeds[0]
-    feed_name = feed_config.get('name', 'Unknown')
-    feed_url = feed_config.get('url')
-    feed_category = feed_config.get('category', 'trading')
+    print(f"✅ Loaded {len(feeds)} feed(s)")
     
-    print(f"✅ Using first feed: {feed_name}")
-    print(f"   URL: {feed_url}")
-    print(f"   Category: {feed_category}")
-    
-    # Initialize PostgreSQL database
+    # Initialize PostgreSQL database; closing() releases it on every exit path
     print("\n[STEP 1] Initializing PostgreSQL database...")
-    pg_db = PostgresDB()
-    print("✅ PostgreSQL database initialized")
-    
+    with closing(PostgresDB()) as pg_db:
+        print("✅ PostgreSQL database initialized")
+        return run_full_pipeline(pg_db, feeds)
+
+
+def run_full_pipeline(pg_db: PostgresDB, feeds: list) -> bool:
+    """Steps 2-6 of the full pipeline test, run against an open PostgreSQL database."""
     # Initialize downloader
     print("\n[STEP 2] Initializing downloader...")
     downloader = PodcastDownloader(
@@ -69,6 +190,25 @@ def test_full_pipeline():
     )
     print("✅ Downloader initialized")
     
+    # Fetch latest episode from all feeds concurrently, use the first feed (in config order) that has one
+    print(f"\n[2.1] Fetching episodes from {len(feeds)} RSS feed(s)...")
+    feed_episodes = downloader.fetch_all_episodes([f.get('url') for f in feeds], limit=1)
+    feed_config, episodes = next(
+        ((f, eps) for f, eps in zip(feeds, feed_episodes) if eps),
+        (feeds[0], [])
+    )
+    feed_name = feed_config.get('name', 'Unknown')
+    feed_url = feed_config.get('url')
+    feed_category = feed_config.get('category', 'trading')
+    
+    # Opt-in: run every feed, overlapping downloads with transcription/summarization
+    if os.getenv('PIPELINE_ALL_FEEDS'):
+        return run_pipelined_feeds(pg_db, downloader, feeds, feed_episodes)
+    
+    print(f"✅ Using feed: {feed_name}")
+    print(f"   URL: {feed_url}")
+    print(f"   Category: {feed_category}")
+    
     # ========================================================================
     # STEP 3: DOWNLOAD
     # ========================================================================
@@ -78,21 +218,15 @@ def test_full_pipeline():
     
     # Add feed to PostgreSQL
     print(f"\n[3.1] Adding feed to PostgreSQL...")
-    existing_podcast = pg_db.get_podcast_by_feed_url(feed_url)
-    if existing_podcast:
-        podcast_id = existing_podcast['id']
-        print(f"  ✅ Feed already exists in PostgreSQL (ID: {podcast_id})")
-    else:
-        podcast_id = downloader.add_feed(feed_name, feed_url, feed_category)
-        print(f"  ✅ Feed added to PostgreSQL (ID: {podcast_id})")
+    # add_feed returns the existing entry's ID if the feed is already tracked
+    podcast_id = downloader.add_feed(feed_name, feed_url, feed_category)
+    print(f"  ✅ Feed registered in PostgreSQL (ID: {podcast_id})")
     
-    # Fetch episodes
-    print(f"\n[3.2] Fetching episodes from RSS feed...")
-    episodes = downloader.fetch_episodes(feed_url, limit=1)
+    # Episodes were fetched in step 2.1
+    print(f"\n[3.2] Selecting latest episode...")
     
     if not episodes:
         print("  ❌ No episodes found in feed")
-        pg_db.close()
         return False
     
     episode_data = episodes[0]
@@ -102,11 +236,15 @@ def test_full_pipeline():
     
     # Check if already downloaded
     print(f"\n[3.3] Checking if episode already downloaded...")
-    if pg_db.episode_exists(episode_url):
+    audio_stat = None
+    # One indexed lookup both answers "does it exist" and returns the row
+    existing_episode = pg_db.get_podcast_by_url(episode_url)
+    if existing_episode:
         print(f"  ℹ️  Episode exists in PostgreSQL, checking file...")
-        downloaded_episodes = pg_db.get_episodes_by_status('downloaded')
-        episode = next((e for e in downloaded_episodes if e.get('episode_url') == episode_url), None)
-        if episode and episode.get('audio_file_path') and Path(episode['audio_file_path']).exists():
+        episode = existing_episode if existing_episode.get('status') == 'downloaded' else None
+        if episode and episode.get('audio_file_path'):
+            audio_stat = file_info(episode['audio_file_path'])
+        if audio_stat is not None:
             print(f"  ✅ Episode already downloaded")
             print(f"     File: {episode['audio_file_path']}")
             episode_id = episode['id']
@@ -120,21 +258,20 @@ def test_full_pipeline():
         file_path = None
     
     # Download if needed
-    if not file_path or not Path(file_path).exists():
+    if audio_stat is None:
         print(f"\n[3.4] Downloading episode...")
         from datetime import datetime
-        safe_title = "".join(c for c in episode_data['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        safe_title = sanitize_title(episode_data['title'])
         filename = f"{podcast_id}_{safe_title[:50]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         file_path = downloader.download_episode(episode_data['url'], filename)
         
         if not file_path:
             print("  ❌ Download failed")
-            duckdb.close()
-            pg_db.close()
             return False
         
         print(f"  ✅ Download complete: {file_path}")
+        audio_stat = file_info(file_path)
         
         # Save to PostgreSQL (already done in downloader.process_feed, but we'll do it here for clarity)
         print(f"\n[3.5] Saving to PostgreSQL...")
@@ -144,35 +281,30 @@ def test_full_pipeline():
     # Verify file exists and get info
     print(f"\n[3.6] Verifying downloaded file...")
     audio_path = Path(file_path)
-    if audio_path.exists():
-        file_size_mb = audio_path.stat().st_size / (1024 * 1024)
+    if audio_stat is not None:
+        file_size_mb = audio_stat.st_size / (1024 * 1024)
         print(f"  ✅ File exists: {file_size_mb:.2f} MB")
         
-        # Get duration using ffprobe if available
-        duration_seconds = None
-        try:
-            import subprocess
-            result = subprocess.run(
-                ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                 '-of', 'default=noprint_wrappers=1:nokey=1', str(audio_path)],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                duration_seconds = int(float(result.stdout.strip()))
-                minutes = duration_seconds // 60
-                seconds = duration_seconds % 60
-                print(f"  ✅ Duration: {minutes}m{seconds}s ({duration_seconds}s)")
-        except:
-            print(f"  ⚠️  Could not get duration (ffprobe not available)")
+        # Reuse the stored duration on re-runs, otherwise read it from the file header
+        duration_seconds = existing_episode.get('duration_seconds') if existing_episode else None
+        if duration_seconds is None:
+            duration = get_audio_duration(audio_path)
+            duration_seconds = int(duration) if duration is not None else None
+        if duration_seconds is not None:
+            minutes = duration_seconds // 60
+            seconds = duration_seconds % 60
+            print(f"  ✅ Duration: {minutes}m{seconds}s ({duration_seconds}s)")
+        else:
+            print(f"  ⚠️  Could not get duration (mutagen and ffprobe not available)")
     else:
         print(f"  ❌ File not found: {file_path}")
-        pg_db.close()
         return False
     
     # Save to PostgreSQL
     print(f"\n[3.7] Saving to PostgreSQL...")
     try:
-        pg_episode_id = pg_db.save_podcast(
+        # The saved row comes back from INSERT/UPDATE ... RETURNING, so 3.8 needs no extra read
+        pg_episode = pg_db.save_podcast(
             title=episode_data['title'],
             description=None,
             feed_url=feed_url,
@@ -180,28 +312,27 @@ def test_full_pipeline():
             published_at=episode_data.get('date'),
             duration_seconds=duration_seconds,
             audio_file_path=file_path,
-            file_size_bytes=audio_path.stat().st_size if audio_path.exists() else None,
+            file_size_bytes=audio_stat.st_size,
             status='downloaded',
             transcript=None,
             summary=None,
             podcast_feed_name=feed_name,
-            podcast_category=feed_category
+            podcast_category=feed_category,
+            return_episode=True
         )
-        print(f"  ✅ Saved to PostgreSQL (ID: {pg_episode_id})")
+        print(f"  ✅ Saved to PostgreSQL (ID: {pg_episode['id']})")
     except Exception as e:
         print(f"  ❌ Failed to save to PostgreSQL: {e}")
         import traceback
         traceback.print_exc()
-        pg_db.close()
         return False
     
     # Verify in PostgreSQL
     print(f"\n[3.8] Verifying in PostgreSQL...")
-    pg_episode = verify_postgres_episode(pg_db, episode_url, "download")
-    if not pg_episode:
-        print("  ❌ Episode not found in PostgreSQL after download")
-        pg_db.close()
+    if pg_episode.get('episode_url') != episode_url or pg_episode.get('status') != 'downloaded':
+        print("  ❌ Saved episode does not match the download")
         return False
+    print(f"  ✅ Found in PostgreSQL (ID: {pg_episode['id']}, Status: {pg_episode['status']})")
     
     episode_id = pg_episode['id']  # Use PostgreSQL ID
     
@@ -220,23 +351,21 @@ def test_full_pipeline():
     print(f"\n[4.1] Starting transcription...")
     print(f"      Using PostgreSQL episode ID: {episode_id}")
     
-    # Transcribe using PostgreSQL episode ID
-    success, error = transcribe_episode(episode_id, pg_db)
+    # Transcribe using PostgreSQL episode ID (returns the row as written)
+    success, error, transcribed_episode = transcribe_episode(episode_id, pg_db, return_episode=True)
     
     if not success:
         print(f"  ❌ Transcription failed: {error}")
-        pg_db.close()
         return False
     
     print(f"  ✅ Transcription complete")
     
     # Verify in PostgreSQL
     print(f"\n[4.2] Verifying transcript in PostgreSQL...")
-    pg_episode = pg_db.get_podcast_by_url(episode_url)
+    pg_episode = transcribed_episode or pg_db.get_podcast_by_url(episode_url)
     
     if not pg_episode:
         print("  ❌ Episode not found in PostgreSQL")
-        pg_db.close()
         return False
     
     if pg_episode['status'] != 'transcribed':
@@ -259,7 +388,6 @@ def test_full_pipeline():
             print(f"  ⚠️  Transcript exists but is not a dict (type: {type(transcript)})")
     else:
         print(f"  ❌ No transcript found in PostgreSQL")
-        pg_db.close()
         return False
     
     print(f"\n✅ TRANSCRIPTION COMPLETE")
@@ -277,23 +405,21 @@ def test_full_pipeline():
     print(f"\n[5.1] Starting summarization...")
     print(f"      Using PostgreSQL episode ID: {episode_id}")
     
-    # Summarize using PostgreSQL episode ID
-    success, error, summary = summarize_episode(episode_id, pg_db)
+    # Summarize using PostgreSQL episode ID (returns the row as written)
+    success, error, summary, summarized_episode = summarize_episode(episode_id, pg_db, return_episode=True)
     
     if not success:
         print(f"  ❌ Summarization failed: {error}")
-        pg_db.close()
         return False
     
     print(f"  ✅ Summarization complete")
     
     # Verify in PostgreSQL
     print(f"\n[5.2] Verifying summary in PostgreSQL...")
-    pg_episode = pg_db.get_podcast_by_url(episode_url)
+    pg_episode = summarized_episode or pg_db.get_podcast_by_url(episode_url)
     
     if not pg_episode:
         print("  ❌ Episode not found in PostgreSQL")
-        pg_db.close()
         return False
     
     if pg_episode['status'] != 'processed':
@@ -317,7 +443,6 @@ def test_full_pipeline():
             print(f"  ⚠️  Summary exists but is not a dict (type: {type(summary_data)})")
     else:
         print(f"  ❌ No summary found in PostgreSQL")
-        pg_db.close()
         return False
     
     print(f"\n✅ SUMMARIZATION COMPLETE")
@@ -332,7 +457,8 @@ def test_full_pipeline():
     print("=" * 70)
     
     print(f"\n[6.1] Final PostgreSQL check...")
-    final_episode = pg_db.get_podcast_by_id(pg_episode['id'])
+    # Sizes are computed server-side; the transcript/summary JSON isn't re-fetched
+    final_episode = pg_db.get_episode_stats(pg_episode['id'])
     
     if final_episode:
         print(f"  ✅ Episode found in PostgreSQL")
@@ -345,21 +471,13 @@ def test_full_pipeline():
         print(f"     Size: {final_episode.get('file_size_bytes', 0) / (1024*1024):.2f} MB" if final_episode.get('file_size_bytes') else "     Size: Unknown")
         print(f"     Duration: {final_episode.get('duration_seconds', 0) // 60}m{final_episode.get('duration_seconds', 0) % 60}s" if final_episode.get('duration_seconds') else "     Duration: Unknown")
         
-        if final_episode.get('transcript'):
-            transcript = final_episode['transcript']
-            if isinstance(transcript, dict):
-                print(f"     Transcript: ✅ ({len(transcript.get('segments', []))} segments)")
-            else:
-                print(f"     Transcript: ⚠️  (present but not dict)")
+        if final_episode['segment_count'] is not None:
+            print(f"     Transcript: ✅ ({final_episode['segment_count']} segments, {final_episode['transcript_chars'] or 0:,} characters)")
         else:
             print(f"     Transcript: ❌")
         
-        if final_episode.get('summary'):
-            summary = final_episode['summary']
-            if isinstance(summary, dict):
-                print(f"     Summary: ✅ ({len(summary.get('key_topics', []))} topics)")
-            else:
-                print(f"     Summary: ⚠️  (present but not dict)")
+        if final_episode['key_topic_count'] is not None:
+            print(f"     Summary: ✅ ({final_episode['key_topic_count']} topics, {final_episode['theme_count'] or 0} themes)")
         else:
             print(f"     Summary: ❌")
         
@@ -368,9 +486,6 @@ def test_full_pipeline():
     else:
         print(f"  ❌ Episode not found in PostgreSQL")
     
-    duckdb.close()
-    pg_db.close()
-    
     print("\n" + "=" * 70)
     print("✅ FULL PIPELINE TEST COMPLETE")
     print("=" * 70)
@@ -385,6 +500,7 @@ def test_full_pipeline():
 
 
 if __name__ == "__main__":
+    buffer_stdout()
     try:
         success = test_full_pipeline()
         sys.exit(0 if success else 1)
@@ -5,6 +5,7 @@ Tests: Download -> Transcribe -> Summarize
 """
 
 import sys
+from contextlib import closing
 from pathlib import Path
 
 # Add parent directory to path so we can import utils
@@ -12,8 +13,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.postgres_db import PostgresDB
 from utils.download import load_feeds_config
-from utils.downloader import PodcastDownloader
+from utils.downloader import PodcastDownloader, sanitize_title
 from utils.processing import transcribe_episode, summarize_episode
+from utils.console import buffer_stdout
 
 
 def test_database_connection():
@@ -25,21 +27,22 @@ def test_database_connection():
     try:
         # Test PostgreSQL connection
         print("\n[1.1] Testing PostgreSQL connection...")
-        db = PostgresDB()
-        print("✓ PostgreSQL connection successful")
-        
-        # Initialize PostgreSQL schema if needed
-        print("\n[1.2] Initializing PostgreSQL schema...")
-        schema_path = Path(__file__).parent.parent / "sql" / "schema.sql"
-        if schema_path.exists():
-            db.execute_sql_file(str(schema_path))
-            print("✓ PostgreSQL schema initialized")
-        else:
-            print("⚠️  Schema file not found, skipping schema initialization")
-        
-        db.close()
-        print("\n✅ TEST 1 PASSED: Database connection working")
-        return True
+        with closing(PostgresDB()) as db:
+            print("✓ PostgreSQL connection successful")
+            
+            # Initialize PostgreSQL schema if needed
+            print("\n[1.2] Initializing PostgreSQL schema...")
+            schema_path = Path(__file__).parent.parent / "sql" / "schema.sql"
+            if schema_path.exists():
+                if db.execute_sql_file(str(schema_path), skip_if_unchanged=True):
+                    print("✓ PostgreSQL schema initialized")
+                else:
+                    print("✓ PostgreSQL schema already up to date")
+            else:
+                print("⚠️  Schema file not found, skipping schema initialization")
+            
+            print("\n✅ TEST 1 PASSED: Database connection working")
+            return True
     except Exception as e:
         print(f"\n❌ TEST 1 FAILED: {e}")
         import traceback
@@ -63,114 +66,108 @@ def test_download_one_episode():
             print("❌ No feeds configured in config/feeds.yaml")
             return None
         
-        # Use first feed
-        feed_config = feeds[0]
-        feed_name = feed_config.get('name', 'Unknown')
-        feed_url = feed_config.get('url')
-        
-        print(f"✓ Using feed: {feed_name}")
-        print(f"  URL: {feed_url}")
-        
         # Initialize database and downloader
         print("\n[2.2] Initializing downloader...")
-        db = PostgresDB()
-        downloader = PodcastDownloader(
-            db=db,
-            data_dir="data",
-            max_episodes=1,  # Only download 1 episode
-            audio_format="mp3"
-        )
-        
-        # Add feed to database (or get existing)
-        print("\n[2.3] Adding feed to database...")
-        existing_podcast = db.get_podcast_by_feed_url(feed_url)
-        if existing_podcast:
-            podcast_id = existing_podcast['id']
-            print(f"✓ Feed already exists (ID: {podcast_id})")
-        else:
+        with closing(PostgresDB()) as db:
+            downloader = PodcastDownloader(
+                db=db,
+                data_dir="data",
+                max_episodes=1,  # Only download 1 episode
+                audio_format="mp3"
+            )
+            
+            # Fetch latest episode from all feeds concurrently, use the first feed that has one
+            print(f"\n[2.3] Fetching episodes from {len(feeds)} RSS feed(s)...")
+            feed_episodes = downloader.fetch_all_episodes([f.get('url') for f in feeds], limit=1)
+            feed_config, episodes = next(
+                ((f, eps) for f, eps in zip(feeds, feed_episodes) if eps),
+                (feeds[0], [])
+            )
+            
+            if not episodes:
+                print("❌ No episodes found in any feed")
+                return None
+            
+            feed_name = feed_config.get('name', 'Unknown')
+            feed_url = feed_config.get('url')
+            
+            print(f"✓ Using feed: {feed_name}")
+            print(f"  URL: {feed_url}")
+            
+            # Add feed to database (or get existing)
+            print("\n[2.4] Adding feed to database...")
             podcast_id = downloader.add_feed(
                 name=feed_name,
                 url=feed_url,
                 category=feed_config.get('category', 'general')
             )
-            print(f"✓ Feed added (ID: {podcast_id})")
-        
-        # Fetch episodes
-        print("\n[2.4] Fetching episodes from RSS feed...")
-        episodes = downloader.fetch_episodes(feed_url, limit=1)
-        
-        if not episodes:
-            print("❌ No episodes found in feed")
-            db.close()
-            return None
-        
-        episode_data = episodes[0]
-        episode_url = episode_data['url']
-        print(f"✓ Found episode: {episode_data['title']}")
-        
-        # Check if episode already exists in database
-        existing_episode = db.get_podcast_by_url(episode_url)
-        if existing_episode:
-            print("\n⚠️  Episode already exists in database, checking file...")
-            file_path = existing_episode.get('audio_file_path') or existing_episode.get('file_path')
-            
-            # Check if file exists on disk
-            if file_path and Path(file_path).exists():
-                print(f"✓ Using existing episode (ID: {existing_episode['id']})")
-                print(f"   File: {file_path}")
-                print(f"   Status: {existing_episode.get('status', 'unknown')}")
-                db.close()
-                return existing_episode
-            else:
-                print(f"⚠️  Episode in database but file missing: {file_path}")
-                print("   Will re-download...")
-        
-        # Download episode
-        print("\n[2.5] Downloading episode...")
-        safe_title = "".join(c for c in episode_data['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        filename = f"{podcast_id}_{safe_title[:50]}"
-        
-        file_path = downloader.download_episode(episode_url, filename)
-        
-        if not file_path:
-            print("❌ Failed to download episode")
-            db.close()
-            return None
-        
-        print(f"✓ Episode downloaded to: {file_path}")
-        
-        # Add to database (or update if exists)
-        print("\n[2.6] Saving episode to database...")
-        # Calculate file size
-        file_size_bytes = None
-        if Path(file_path).exists():
-            file_size_bytes = Path(file_path).stat().st_size
-        
-        episode_id = db.save_podcast(
-            title=episode_data['title'],
-            description=episode_data.get('description'),
-            feed_url=feed_url,
-            episode_url=episode_url,
-            published_at=episode_data['date'],
-            audio_file_path=file_path,
-            file_size_bytes=file_size_bytes,
-            status='downloaded',
-            podcast_feed_name=feed_name,
-            podcast_category=feed_config.get('category', 'general')
-        )
-        print(f"✓ Episode saved (ID: {episode_id})")
-        
-        # Get episode info
-        episode = db.get_podcast_by_id(episode_id)
-        db.close()
-        
-        print("\n✅ TEST 2 PASSED: Episode downloaded successfully")
-        print(f"   Episode ID: {episode_id}")
-        print(f"   Title: {episode['title']}")
-        print(f"   File: {episode.get('audio_file_path') or episode.get('file_path')}")
-        
-        return episode
-        
+            print(f"✓ Feed registered (ID: {podcast_id})")
+            
+            episode_data = episodes[0]
+            episode_url = episode_data['url']
+            print(f"✓ Found episode: {episode_data['title']}")
+            
+            # Check if episode already exists in database
+            existing_episode = db.get_podcast_by_url(episode_url)
+            if existing_episode:
+                print("\n⚠️  Episode already exists in database, checking file...")
+                file_path = existing_episode.get('audio_file_path') or existing_episode.get('file_path')
+                
+                # Check if file exists on disk
+                if file_path and Path(file_path).exists():
+                    print(f"✓ Using existing episode (ID: {existing_episode['id']})")
+                    print(f"   File: {file_path}")
+                    print(f"   Status: {existing_episode.get('status', 'unknown')}")
+                    return existing_episode
+                else:
+                    print(f"⚠️  Episode in database but file missing: {file_path}")
+                    print("   Will re-download...")
+            
+            # Download episode
+            print("\n[2.5] Downloading episode...")
+            safe_title = sanitize_title(episode_data['title'])
+            filename = f"{podcast_id}_{safe_title[:50]}"
+            
+            file_path = downloader.download_episode(episode_url, filename)
+            
+            if not file_path:
+                print("❌ Failed to download episode")
+                return None
+            
+            print(f"✓ Episode downloaded to: {file_path}")
+            
+            # Add to database (or update if exists)
+            print("\n[2.6] Saving episode to database...")
+            # Calculate file size (one stat call; a missing file just leaves it unset)
+            try:
+                file_size_bytes = Path(file_path).stat().st_size
+            except FileNotFoundError:
+                file_size_bytes = None
+            
+            episode_id = db.save_podcast(
+                title=episode_data['title'],
+                description=episode_data.get('description'),
+                feed_url=feed_url,
+                episode_url=episode_url,
+                published_at=episode_data['date'],
+                audio_file_path=file_path,
+                file_size_bytes=file_size_bytes,
+                status='downloaded',
+                podcast_feed_name=feed_name,
+                podcast_category=feed_config.get('category', 'general')
+            )
+            print(f"✓ Episode saved (ID: {episode_id})")
+            
+            # Get episode info
+            episode = db.get_podcast_by_id(episode_id)
+            
+            print("\n✅ TEST 2 PASSED: Episode downloaded successfully")
+            print(f"   Episode ID: {episode_id}")
+            print(f"   Title: {episode['title']}")
+            print(f"   File: {episode.get('audio_file_path') or episode.get('file_path')}")
+            
+            return episode
+            
     except Exception as e:
         print(f"\n❌ TEST 2 FAILED: {e}")
         import traceback
@@ -194,57 +191,52 @@ def test_transcribe_episode(episode):
         print(f"      Title: {episode['title']}")
         
         # Initialize database
-        db = PostgresDB()
-        
-        # Check episode status
-        episode_check = db.get_episode_by_id(episode_id)
-        if not episode_check:
-            print(f"❌ Episode {episode_id} not found in database")
-            db.close()
-            return None
-        
-        # Check if already transcribed
-        if episode_check.get('status') == 'transcribed' or episode_check.get('status') == 'processed':
-            print(f"⚠️  Episode already transcribed (status: {episode_check.get('status')})")
-            print("   Skipping transcription...")
-            db.close()
-            return episode_check
-        
-        print(f"      Status: {episode_check['status']}")
-        file_path = episode_check.get('audio_file_path') or episode_check.get('file_path')
-        print(f"      File: {file_path}")
-        
-        # Transcribe (detailed output is handled by transcriber)
-        print("\n[3.2] Starting transcription...")
-        success, error = transcribe_episode(episode_id, db)
-        
-        if not success:
-            print(f"\n❌ Transcription failed: {error}")
-            db.close()
-            return None
-        
-        # Verify transcription
-        print("\n[3.3] Verifying transcription results...")
-        episode_updated = db.get_episode_by_id(episode_id)
-        
-        if episode_updated['status'] != 'transcribed':
-            print(f"⚠️  Status is '{episode_updated['status']}', expected 'transcribed'")
-        
-        transcripts = db.get_transcripts_for_episode(episode_id)
-        transcript_count = len(transcripts)
-        
-        print(f"✓ Verification complete:")
-        print(f"  Status: {episode_updated['status']}")
-        print(f"  Transcript segments: {transcript_count}")
-        
-        if transcripts:
-            print(f"  Sample segment: {transcripts[0]['text'][:100]}...")
-        
-        db.close()
-        
-        print("\n✅ TEST 3 PASSED: Episode transcribed successfully")
-        return episode_updated
-        
+        with closing(PostgresDB()) as db:
+            # Check episode status
+            episode_check = db.get_episode_by_id(episode_id)
+            if not episode_check:
+                print(f"❌ Episode {episode_id} not found in database")
+                return None
+            
+            # Check if already transcribed
+            if episode_check.get('status') == 'transcribed' or episode_check.get('status') == 'processed':
+                print(f"⚠️  Episode already transcribed (status: {episode_check.get('status')})")
+                print("   Skipping transcription...")
+                return episode_check
+            
+            print(f"      Status: {episode_check['status']}")
+            file_path = episode_check.get('audio_file_path') or episode_check.get('file_path')
+            print(f"      File: {file_path}")
+            
+            # Transcribe (detailed output is handled by transcriber)
+            print("\n[3.2] Starting transcription...")
+            success, error, episode_updated = transcribe_episode(episode_id, db, return_episode=True)
+            
+            if not success:
+                print(f"\n❌ Transcription failed: {error}")
+                return None
+            
+            # Verify transcription (the write returns the updated row, so no re-read is needed)
+            print("\n[3.3] Verifying transcription results...")
+            if episode_updated is None:
+                episode_updated = db.get_episode_by_id(episode_id)
+            
+            if episode_updated['status'] != 'transcribed':
+                print(f"⚠️  Status is '{episode_updated['status']}', expected 'transcribed'")
+            
+            transcript = episode_updated.get('transcript')
+            segments = transcript.get('segments', []) if isinstance(transcript, dict) else []
+            
+            print(f"✓ Verification complete:")
+            print(f"  Status: {episode_updated['status']}")
+            print(f"  Transcript segments: {len(segments)}")
+            
+            if segments:
+                print(f"  Sample segment: {segments[0].get('text', '')[:100]}...")
+            
+            print("\n✅ TEST 3 PASSED: Episode transcribed successfully")
+            return episode_updated
+            
     except Exception as e:
         print(f"\n❌ TEST 3 FAILED: {e}")
         import traceback
@@ -268,62 +260,56 @@ def test_summarize_episode(episode):
         print(f"      Title: {episode['title']}")
         
         # Initialize database
-        db = PostgresDB()
-        
-        # Check episode status
-        episode_check = db.get_episode_by_id(episode_id)
-        if not episode_check:
-            print(f"❌ Episode {episode_id} not found in database")
-            db.close()
-            return None
-        
-        # Check if already processed
-        if episode_check.get('status') == 'processed':
-            if episode_check.get('summary'):
-                print(f"⚠️  Episode already processed (status: processed)")
-                print("   Skipping summarization...")
-                db.close()
-                return episode_check
-        
-        print(f"      Status: {episode_check['status']}")
-        
-        # Summarize
-        print("\n[4.2] Starting summarization...")
-        success, error, summary = summarize_episode(episode_id, db)
-        
-        if not success:
-            print(f"❌ Summarization failed: {error}")
-            db.close()
-            return None
-        
-        # Verify summary
-        print("\n[4.3] Verifying summary...")
-        episode_updated = db.get_episode_by_id(episode_id)
-        
-        if episode_updated['status'] != 'processed':
-            print(f"⚠️  Status is '{episode_updated['status']}', expected 'processed'")
-        
-        # Get summary from database (PostgreSQL stores summary in episode record)
-        episode_summary = episode_updated.get('summary')
-        
-        if episode_summary:
-            print(f"✓ Summarization complete")
-            print(f"  Status: {episode_updated['status']}")
-            print(f"  Key topics: {len(episode_summary.get('key_topics', []))}")
-            print(f"  Themes: {len(episode_summary.get('themes', []))}")
-            print(f"  Quotes: {len(episode_summary.get('quotes', []))}")
-            print(f"  Companies: {len(episode_summary.get('startups', []))}")
-            
-            if episode_summary.get('key_topics'):
-                print(f"\n  Sample topics: {', '.join(episode_summary['key_topics'][:5])}")
-        else:
-            print("⚠️  Summary not found in database, but API call succeeded")
-        
-        db.close()
-        
-        print("\n✅ TEST 4 PASSED: Episode summarized successfully")
-        return episode_updated
-        
+        with closing(PostgresDB()) as db:
+            # Check episode status
+            episode_check = db.get_episode_by_id(episode_id)
+            if not episode_check:
+                print(f"❌ Episode {episode_id} not found in database")
+                return None
+            
+            # Check if already processed
+            if episode_check.get('status') == 'processed':
+                if episode_check.get('summary'):
+                    print(f"⚠️  Episode already processed (status: processed)")
+                    print("   Skipping summarization...")
+                    return episode_check
+            
+            print(f"      Status: {episode_check['status']}")
+            
+            # Summarize
+            print("\n[4.2] Starting summarization...")
+            success, error, summary = summarize_episode(episode_id, db)
+            
+            if not success:
+                print(f"❌ Summarization failed: {error}")
+                return None
+            
+            # Verify summary
+            print("\n[4.3] Verifying summary...")
+            episode_updated = db.get_episode_by_id(episode_id)
+            
+            if episode_updated['status'] != 'processed':
+                print(f"⚠️  Status is '{episode_updated['status']}', expected 'processed'")
+            
+            # Get summary from database (PostgreSQL stores summary in episode record)
+            episode_summary = episode_updated.get('summary')
+            
+            if episode_summary:
+                print(f"✓ Summarization complete")
+                print(f"  Status: {episode_updated['status']}")
+                print(f"  Key topics: {len(episode_summary.get('key_topics', []))}")
+                print(f"  Themes: {len(episode_summary.get('themes', []))}")
+                print(f"  Quotes: {len(episode_summary.get('quotes', []))}")
+                print(f"  Companies: {len(episode_summary.get('startups', []))}")
+                
+                if episode_summary.get('key_topics'):
+                    print(f"\n  Sample topics: {', '.join(episode_summary['key_topics'][:5])}")
+            else:
+                print("⚠️  Summary not found in database, but API call succeeded")
+            
+            print("\n✅ TEST 4 PASSED: Episode summarized successfully")
+            return episode_updated
+            
     except Exception as e:
         print(f"\n❌ TEST 4 FAILED: {e}")
         import traceback
@@ -373,5 +359,6 @@ def main():
 
 
 if __name__ == "__main__":
+    buffer_stdout()
     main()
 
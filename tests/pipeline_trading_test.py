@@ -5,20 +5,42 @@ Tests: Download -> Transcribe -> Summarize
 Skips steps that are already complete.
 """
 
+import os
 import sys
+from contextlib import closing
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.postgres_db import PostgresDB
 from utils.download import load_feeds_config
-from utils.downloader import PodcastDownloader
-from utils.processing import transcribe_episode, summarize_episode
+from utils.downloader import PodcastDownloader, sanitize_title
+from utils.processing import transcribe_episodes_batch, summarize_episode
+from utils.console import buffer_stdout
 
+# Feeds fetched/downloaded concurrently in Test 2
+MAX_PARALLEL_FEEDS = 8
 
-def test_database_connection():
+
+def file_info(path) -> Optional[os.stat_result]:
+    """Stat a file once, returning None if it doesn't exist (instead of exists() followed by stat())."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def transcript_segments(episode: dict) -> list:
+    """Return the transcript segments stored on an episode row (empty if none)."""
+    transcript = episode.get('transcript') if episode else None
+    return transcript.get('segments', []) if isinstance(transcript, dict) else []
+
+
+def test_database_connection(db: PostgresDB):
     """Test 1: Database connection and schema initialization."""
     print("\n" + "="*70)
     print("TEST 1: Database Connection & Schema")
@@ -27,19 +49,21 @@ def test_database_connection():
     try:
         # Test PostgreSQL connection
         print("\n[1.1] Testing PostgreSQL connection...")
-        db = PostgresDB()
+        with db.engine.connect():
+            pass
         print("✓ PostgreSQL connection successful")
         
         # Initialize PostgreSQL schema if needed
         print("\n[1.2] Initializing PostgreSQL schema...")
         schema_path = Path(__file__).parent.parent / "sql" / "schema.sql"
         if schema_path.exists():
-            db.execute_sql_file(str(schema_path))
-            print("✓ PostgreSQL schema initialized")
+            if db.execute_sql_file(str(schema_path), skip_if_unchanged=True):
+                print("✓ PostgreSQL schema initialized")
+            else:
+                print("✓ PostgreSQL schema already up to date")
         else:
             print("⚠️  Schema file not found, skipping schema initialization")
         
-        db.close()
         print("\n✅ TEST 1 PASSED: Database connection working")
         return True
     except Exception as e:
@@ -49,7 +73,107 @@ def test_database_connection():
         return False
 
 
-def test_download_episodes(num_feeds: int = 5):
+def download_feed_episode(db: PostgresDB, downloader: PodcastDownloader, feed_config: dict, tag: str,
+                          known_rows: dict):
+    """
+    Download the latest episode of one feed, reusing an existing download.
+    
+    Runs in a worker thread, so every line printed is prefixed with the feed's tag.
+    known_rows maps episode_url to the feed's rows already in PostgreSQL (loaded
+    for all feeds in one query), so no per-feed lookups are needed.
+    
+    New downloads are not saved here: their podcast row is returned so the caller
+    can insert every new episode in one batch.
+    
+    Returns:
+        Tuple of (outcome, feed_result, episode) where outcome is 'downloaded',
+        'existing', 'failed' or None (feed had no episodes); episode is the existing
+        episode dict, or the unsaved podcast row for 'downloaded'
+    """
+    feed_name = feed_config['name']
+    feed_url = feed_config['url']
+    feed_category = feed_config.get('category', 'general')
+    
+    print(f"\n{tag} Processing: {feed_name}")
+    
+    try:
+        # Add feed to database (or get existing; prefer the feed's placeholder row)
+        existing_podcast = known_rows.get(f"__feed__:{feed_url}") or next(iter(known_rows.values()), None)
+        if existing_podcast:
+            podcast_id = existing_podcast['id']
+            print(f"  {tag} ✓ Feed already exists (ID: {podcast_id})")
+        else:
+            podcast_id = downloader.add_feed(
+                name=feed_name,
+                url=feed_url,
+                category=feed_category
+            )
+            print(f"  {tag} ✓ Feed added (ID: {podcast_id})")
+        
+        # Fetch episodes
+        print(f"  {tag} 📡 Fetching episodes from RSS feed...")
+        episodes = downloader.fetch_episodes(feed_url, limit=1)
+        
+        if not episodes:
+            print(f"  {tag} ⚠️  No episodes found in feed")
+            return None, {'downloaded': 0, 'error': 'No episodes found'}, None
+        
+        episode_data = episodes[0]
+        episode_url = episode_data['url']
+        print(f"  {tag} ✓ Found episode: {episode_data['title'][:70]}...")
+        
+        # Check if episode already exists in database
+        existing_episode = known_rows.get(episode_url)
+        if existing_episode:
+            print(f"  {tag} ℹ️  Episode already exists in database, checking file...")
+            file_path = existing_episode.get('audio_file_path') or existing_episode.get('file_path')
+            
+            # Check if file actually exists on disk (one stat; FileNotFoundError means absent)
+            if file_path and file_info(file_path):
+                print(f"  {tag} ✓ Using existing episode (ID: {existing_episode['id']})")
+                print(f"     File: {file_path}")
+                print(f"     Status: {existing_episode.get('status', 'unknown')}")
+                return 'existing', {'downloaded': 0, 'episode_id': existing_episode['id'], 'existing': True}, existing_episode
+            else:
+                print(f"  {tag} ⚠️  Episode in DB but file missing: {file_path}")
+                print(f"     Will re-download...")
+        
+        # Download episode
+        print(f"  {tag} 📥 Downloading episode...")
+        safe_title = sanitize_title(episode_data['title'])
+        filename = f"{podcast_id}_{safe_title[:50]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
+        file_path, file_size_bytes = downloader.download_episode_with_size(episode_url, filename)
+        
+        if not file_path:
+            print(f"  {tag} ❌ Failed to download episode")
+            return 'failed', {'downloaded': 0, 'error': 'Download failed'}, None
+        
+        print(f"  {tag} ✓ Episode downloaded: {file_path}")
+        
+        # Row for save_podcasts_bulk once all feeds are done
+        podcast_row = {
+            'title': episode_data['title'],
+            'description': episode_data.get('description'),
+            'feed_url': feed_url,
+            'episode_url': episode_url,
+            'published_at': episode_data['date'],
+            'audio_file_path': file_path,
+            'file_size_bytes': file_size_bytes,
+            'status': 'downloaded',
+            'podcast_feed_name': feed_name,
+            'podcast_category': feed_category
+        }
+        return 'downloaded', {'downloaded': 1}, podcast_row
+    
+    except Exception as e:
+        print(f"  {tag} ❌ Error processing feed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 'failed', {'downloaded': 0, 'error': str(e)}, None
+
+
+def test_download_episodes(db: PostgresDB, num_feeds: int = 5):
     """Test 2: Download episodes from trading podcasts."""
     print("\n" + "="*70)
     print("TEST 2: Download Episodes from Trading Podcasts")
@@ -80,8 +204,7 @@ def test_download_episodes(num_feeds: int = 5):
             print(f"     URL: {feed['url']}")
         
         # Initialize database and downloader
-        print("\n[2.2] Initializing database and downloader...")
-        db = PostgresDB()
+        print("\n[2.2] Initializing downloader...")
         downloader = PodcastDownloader(
             db=db,
             data_dir="data",
@@ -89,7 +212,7 @@ def test_download_episodes(num_feeds: int = 5):
             audio_format="mp3"  # Use mp3 for faster processing
         )
         
-        print("✅ PostgreSQL database and downloader initialized")
+        print("✅ Downloader initialized")
         
         # Process each feed
         print("\n[2.3] Downloading episodes...")
@@ -103,107 +226,50 @@ def test_download_episodes(num_feeds: int = 5):
             'feed_results': {}
         }
         
-        for idx, feed_config in enumerate(feeds_to_process, 1):
-            feed_name = feed_config['name']
-            feed_url = feed_config['url']
-            feed_category = feed_config.get('category', 'general')
-            
-            print(f"\n[{idx}/{len(feeds_to_process)}] Processing: {feed_name}")
-            print("-" * 70)
-            
-            try:
-                # Add feed to database (or get existing)
-                existing_podcast = db.get_podcast_by_feed_url(feed_url)
-                if existing_podcast:
-                    podcast_id = existing_podcast['id']
-                    print(f"  ✓ Feed already exists (ID: {podcast_id})")
-                else:
-                    podcast_id = downloader.add_feed(
-                        name=feed_name,
-                        url=feed_url,
-                        category=feed_category
-                    )
-                    print(f"  ✓ Feed added (ID: {podcast_id})")
-                
-                # Fetch episodes
-                print(f"  📡 Fetching episodes from RSS feed...")
-                episodes = downloader.fetch_episodes(feed_url, limit=1)
-                
-                if not episodes:
-                    print(f"  ⚠️  No episodes found in feed")
-                    results['feed_results'][feed_name] = {'downloaded': 0, 'error': 'No episodes found'}
-                    continue
-                
-                episode_data = episodes[0]
-                episode_url = episode_data['url']
-                print(f"  ✓ Found episode: {episode_data['title'][:70]}...")
-                
-                # Check if episode already exists in database
-                existing_episode = db.get_podcast_by_url(episode_url)
-                if existing_episode:
-                    print(f"  ℹ️  Episode already exists in database, checking file...")
-                    file_path = existing_episode.get('audio_file_path') or existing_episode.get('file_path')
-                    
-                    # Check if file actually exists on disk
-                    if file_path and Path(file_path).exists():
-                        print(f"  ✓ Using existing episode (ID: {existing_episode['id']})")
-                        print(f"     File: {file_path}")
-                        print(f"     Status: {existing_episode.get('status', 'unknown')}")
-                        downloaded_episodes.append(existing_episode)
-                        results['total_existing'] += 1
-                        results['feed_results'][feed_name] = {'downloaded': 0, 'episode_id': existing_episode['id'], 'existing': True}
-                        continue
-                    else:
-                        print(f"  ⚠️  Episode in DB but file missing: {file_path}")
-                        print(f"     Will re-download...")
-                
-                # Download episode
-                print(f"  📥 Downloading episode...")
-                safe_title = "".join(c for c in episode_data['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                filename = f"{podcast_id}_{safe_title[:50]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                
-                file_path = downloader.download_episode(episode_url, filename)
-                
-                if not file_path:
-                    print(f"  ❌ Failed to download episode")
-                    results['total_failed'] += 1
-                    results['feed_results'][feed_name] = {'downloaded': 0, 'error': 'Download failed'}
-                    continue
-                
-                print(f"  ✓ Episode downloaded: {file_path}")
-                
-                # Add to database using PostgreSQL save_podcast method
-                print(f"  💾 Saving to PostgreSQL...")
-                # Calculate file size
-                file_size_bytes = None
-                if Path(file_path).exists():
-                    file_size_bytes = Path(file_path).stat().st_size
-                
-                episode_id = db.save_podcast(
-                    title=episode_data['title'],
-                    description=episode_data.get('description'),
-                    feed_url=feed_url,
-                    episode_url=episode_url,
-                    published_at=episode_data['date'],
-                    audio_file_path=file_path,
-                    file_size_bytes=file_size_bytes,
-                    status='downloaded',
-                    podcast_feed_name=feed_name,
-                    podcast_category=feed_category
-                )
-                
-                print(f"  ✅ Episode saved (ID: {episode_id})")
-                episode = db.get_podcast_by_id(episode_id)
+        # Everything already stored for these feeds, in one query
+        known_rows_by_feed = {}
+        for row in db.get_episodes_by_feed_urls([f['url'] for f in feeds_to_process]):
+            known_rows_by_feed.setdefault(row['feed_url'], {})[row['episode_url']] = row
+        
+        # Register feeds seen for the first time together, in one transaction
+        new_feeds = [f for f in feeds_to_process if f['url'] not in known_rows_by_feed]
+        if new_feeds:
+            placeholders = downloader.add_feeds(
+                [{**f, 'category': f.get('category', 'general')} for f in new_feeds]
+            )
+            for feed, placeholder in zip(new_feeds, placeholders):
+                known_rows_by_feed[feed['url']] = {placeholder['episode_url']: placeholder}
+                print(f"  ✓ Feed added: {feed['name']} (ID: {placeholder['id']})")
+        
+        # Feeds are I/O bound (RSS fetch + audio download), so process them concurrently;
+        # the downloader still caps simultaneous downloads per host
+        total_feeds = len(feeds_to_process)
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_FEEDS, total_feeds)) as executor:
+            feed_outcomes = list(executor.map(
+                lambda job: download_feed_episode(
+                    db, downloader, job[1], f"[{job[0]}/{total_feeds}]",
+                    known_rows_by_feed.get(job[1]['url'], {})
+                ),
+                enumerate(feeds_to_process, 1)
+            ))
+        
+        # Save all new downloads to PostgreSQL in one transaction
+        new_rows = [episode for outcome, _, episode in feed_outcomes if outcome == 'downloaded']
+        saved_episodes = iter([])
+        if new_rows:
+            print(f"\n💾 Saving {len(new_rows)} new episode(s) to PostgreSQL...")
+            saved_episodes = iter(db.save_podcasts_bulk(new_rows, return_episodes=True))
+        
+        for feed_config, (outcome, feed_result, episode) in zip(feeds_to_process, feed_outcomes):
+            results['feed_results'][feed_config['name']] = feed_result
+            if outcome:
+                results[f'total_{outcome}'] += 1
+            if outcome == 'downloaded':
+                episode = next(saved_episodes)
+                feed_result['episode_id'] = episode['id']
+                print(f"  ✅ Episode saved (ID: {episode['id']}): {episode['title'][:60]}")
+            if episode:
                 downloaded_episodes.append(episode)
-                results['total_downloaded'] += 1
-                results['feed_results'][feed_name] = {'downloaded': 1, 'episode_id': episode_id}
-            
-            except Exception as e:
-                print(f"  ❌ Error processing feed: {e}")
-                import traceback
-                traceback.print_exc()
-                results['total_failed'] += 1
-                results['feed_results'][feed_name] = {'downloaded': 0, 'error': str(e)}
         
         # Summary
         print("\n" + "=" * 70)
@@ -221,19 +287,12 @@ def test_download_episodes(num_feeds: int = 5):
             else:
                 print(f"  ⚠️  {feed_name}: {feed_result.get('error', 'Unknown error')}")
         
-        # Filter episodes with valid files
-        valid_episodes = []
-        for ep in downloaded_episodes:
-            file_path = ep.get('audio_file_path') or ep.get('file_path')
-            if file_path and Path(file_path).exists():
-                valid_episodes.append(ep)
-        
-        db.close()
-        
+        # Every episode here has a file on disk: existing ones were checked with
+        # file_info() and new ones were just written by the downloader
         print("\n✅ TEST 2 PASSED: Episodes downloaded successfully")
-        print(f"   {len(valid_episodes)} episode(s) ready for transcription")
+        print(f"   {len(downloaded_episodes)} episode(s) ready for transcription")
         
-        return valid_episodes
+        return downloaded_episodes
         
     except Exception as e:
         print(f"\n❌ TEST 2 FAILED: {e}")
@@ -242,8 +301,13 @@ def test_download_episodes(num_feeds: int = 5):
         return []
 
 
-def test_transcribe_episodes(episodes):
-    """Test 3: Transcribe downloaded episodes."""
+def test_transcribe_episodes(db: PostgresDB, episodes, validated: bool = False):
+    """
+    Test 3: Transcribe downloaded episodes.
+    
+    Pass validated=True for episodes whose audio files were already checked
+    (as Test 2 returns them) to skip re-checking every file.
+    """
     print("\n" + "="*70)
     print("TEST 3: Transcribe Episodes")
     print("="*70)
@@ -253,11 +317,14 @@ def test_transcribe_episodes(episodes):
         return []
     
     # Filter episodes with valid files
-    valid_episodes = []
-    for ep in episodes:
-        file_path = ep.get('audio_file_path') or ep.get('file_path')
-        if file_path and Path(file_path).exists():
-            valid_episodes.append(ep)
+    if validated:
+        valid_episodes = list(episodes)
+    else:
+        valid_episodes = []
+        for ep in episodes:
+            file_path = ep.get('audio_file_path') or ep.get('file_path')
+            if file_path and file_info(file_path):
+                valid_episodes.append(ep)
     
     if not valid_episodes:
         print("❌ No episodes with valid audio files found")
@@ -280,8 +347,8 @@ def test_transcribe_episodes(episodes):
             seconds = ep['duration_seconds'] % 60
             print(f"   Duration: {minutes}m{seconds}s")
     
-    # Initialize database
-    db = PostgresDB()
+    # Current state of every episode in one query; updated in place as episodes are transcribed
+    episode_map = {ep['id']: ep for ep in db.get_episodes_by_ids([ep['id'] for ep in valid_episodes])}
     
     results = {
         'total_transcribed': 0,
@@ -290,46 +357,41 @@ def test_transcribe_episodes(episodes):
         'episode_results': []
     }
     
-    for idx, episode in enumerate(valid_episodes, 1):
-        episode_id = episode['id']
-        episode_title = episode['title']
-        file_path = episode.get('audio_file_path') or episode.get('file_path')
-        
-        print(f"\n{'='*70}")
-        print(f"[{idx}/{len(valid_episodes)}] TRANSCRIBING EPISODE")
-        print(f"{'='*70}")
-        print(f"Episode ID: {episode_id}")
-        print(f"Title: {episode_title}")
-        print(f"File: {file_path}")
-        print(f"{'='*70}\n")
-        
-        try:
-            # Check if already transcribed
-            episode_check = db.get_episode_by_id(episode_id)
-            if episode_check.get('status') == 'transcribed' or episode_check.get('status') == 'processed':
-                print(f"⚠️  Episode already transcribed (status: {episode_check.get('status')})")
-                print("   Skipping transcription...")
-                transcripts = db.get_transcripts_for_episode(episode_id)
-                results['total_skipped'] += 1
-                results['episode_results'].append({
-                    'episode_id': episode_id,
-                    'title': episode_title,
-                    'status': 'skipped',
-                    'segments': len(transcripts)
-                })
-                continue
-            
-            # Transcribe using the processing utility
-            success, error = transcribe_episode(episode_id, db)
+    # Skip episodes that are already transcribed
+    pending_episodes = []
+    for episode in valid_episodes:
+        episode_check = episode_map.get(episode['id'], episode)
+        if episode_check.get('status') == 'transcribed' or episode_check.get('status') == 'processed':
+            print(f"⚠️  Episode {episode['id']} already transcribed (status: {episode_check.get('status')}), skipping")
+            results['total_skipped'] += 1
+            results['episode_results'].append({
+                'episode_id': episode['id'],
+                'title': episode['title'],
+                'status': 'skipped',
+                'segments': len(transcript_segments(episode_check))
+            })
+        else:
+            pending_episodes.append(episode)
+    
+    # Transcribe the rest through one shared transcriber
+    titles = {ep['id']: ep['title'] for ep in pending_episodes}
+    idx = 0
+    try:
+        batch = transcribe_episodes_batch(list(titles), db)
+        for idx, (episode_id, success, error, episode_updated) in enumerate(batch, 1):
+            episode_title = titles[episode_id]
             
             if success:
-                # Verify transcription
-                episode_updated = db.get_episode_by_id(episode_id)
-                transcripts = db.get_transcripts_for_episode(episode_id)
+                # Verify transcription (the write returns the updated row, so no re-read is needed)
+                if episode_updated is None:
+                    episode_updated = db.get_episode_by_id(episode_id)
+                episode_map[episode_id] = episode_updated
+                transcripts = transcript_segments(episode_updated)
                 
                 print(f"\n{'='*70}")
-                print(f"✅ TRANSCRIPTION SUCCESSFUL")
+                print(f"[{idx}/{len(pending_episodes)}] ✅ TRANSCRIPTION SUCCESSFUL")
                 print(f"{'='*70}")
+                print(f"Episode ID: {episode_id}")
                 print(f"Status: {episode_updated.get('status', 'unknown')}")
                 print(f"Transcript segments: {len(transcripts)}")
                 
@@ -346,8 +408,9 @@ def test_transcribe_episodes(episodes):
                 })
             else:
                 print(f"\n{'='*70}")
-                print(f"❌ TRANSCRIPTION FAILED")
+                print(f"[{idx}/{len(pending_episodes)}] ❌ TRANSCRIPTION FAILED")
                 print(f"{'='*70}")
+                print(f"Episode ID: {episode_id}")
                 print(f"Error: {error}")
                 
                 results['total_failed'] += 1
@@ -357,26 +420,9 @@ def test_transcribe_episodes(episodes):
                     'status': 'failed',
                     'error': error
                 })
-        
-        except KeyboardInterrupt:
-            print(f"\n\n⚠️  Transcription interrupted by user")
-            print(f"   Processed {idx-1}/{len(valid_episodes)} episodes")
-            break
-        except Exception as e:
-            print(f"\n{'='*70}")
-            print(f"❌ UNEXPECTED ERROR")
-            print(f"{'='*70}")
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            results['total_failed'] += 1
-            results['episode_results'].append({
-                'episode_id': episode_id,
-                'title': episode_title,
-                'status': 'error',
-                'error': str(e)
-            })
+    except KeyboardInterrupt:
+        print(f"\n\n⚠️  Transcription interrupted by user")
+        print(f"   Processed {idx}/{len(pending_episodes)} episodes")
     
     # Summary
     print("\n" + "=" * 70)
@@ -400,19 +446,17 @@ def test_transcribe_episodes(episodes):
     # Get transcribed episodes
     transcribed_episodes = []
     for ep in valid_episodes:
-        episode_check = db.get_episode_by_id(ep['id'])
+        episode_check = episode_map.get(ep['id'], ep)
         if episode_check.get('status') == 'transcribed' or episode_check.get('status') == 'processed':
             transcribed_episodes.append(episode_check)
     
-    db.close()
-    
     print("\n✅ TEST 3 PASSED: Transcription completed")
     print(f"   {len(transcribed_episodes)} episode(s) ready for summarization")
     
     return transcribed_episodes
 
 
-def test_summarize_episodes(episodes):
+def test_summarize_episodes(db: PostgresDB, episodes):
     """Test 4: Summarize transcribed episodes."""
     print("\n" + "="*70)
     print("TEST 4: Summarize Episodes")
@@ -424,8 +468,8 @@ def test_summarize_episodes(episodes):
     
     print(f"\n✅ Found {len(episodes)} episode(s) ready for summarization\n")
     
-    # Initialize database
-    db = PostgresDB()
+    # Current state of every episode in one query
+    episode_map = {ep['id']: ep for ep in db.get_episodes_by_ids([ep['id'] for ep in episodes])}
     
     results = {
         'total_summarized': 0,
@@ -447,7 +491,7 @@ def test_summarize_episodes(episodes):
         
         try:
             # Check if already processed
-            episode_check = db.get_episode_by_id(episode_id)
+            episode_check = episode_map.get(episode_id, episode)
             if episode_check.get('status') == 'processed':
                 if episode_check.get('summary'):
                     print(f"⚠️  Episode already processed (status: processed)")
@@ -463,7 +507,7 @@ def test_summarize_episodes(episodes):
                     continue
             
             # Summarize
-            success, error, summary = summarize_episode(episode_id, db)
+            success, error, summary, episode_updated = summarize_episode(episode_id, db, return_episode=True)
             
             if not success:
                 print(f"❌ Summarization failed: {error}")
@@ -476,8 +520,9 @@ def test_summarize_episodes(episodes):
                 })
                 continue
             
-            # Verify summary
-            episode_updated = db.get_episode_by_id(episode_id)
+            # Verify summary (the write returns the updated row, so no re-read is needed)
+            if episode_updated is None:
+                episode_updated = db.get_episode_by_id(episode_id)
             episode_summary = episode_updated.get('summary')
             
             if episode_summary:
@@ -540,8 +585,6 @@ def test_summarize_episodes(episodes):
             else:
                 print(f"  ❌ {result['title'][:60]}... (Error: {result.get('error', 'Unknown')})")
     
-    db.close()
-    
     print("\n✅ TEST 4 PASSED: Summarization completed")
     
     return results
@@ -554,39 +597,49 @@ def main():
     print("Testing: Download -> Transcribe -> Summarize")
     print("="*70)
     
+    # One PostgresDB (and connection pool) shared by every test
+    try:
+        db = PostgresDB()
+    except Exception as e:
+        print(f"\n❌ Pipeline test aborted: Could not connect to PostgreSQL: {e}")
+        sys.exit(1)
+    
+    with closing(db):
+        run_pipeline(db)
+
+
+def run_pipeline(db: PostgresDB):
+    """Run Tests 1-4 against a shared database and print the final summary."""
     # Test 1: Database connection
-    if not test_database_connection():
+    if not test_database_connection(db):
         print("\n❌ Pipeline test aborted: Database connection failed")
         sys.exit(1)
     
     # Test 2: Download episodes
-    episodes = test_download_episodes(num_feeds=5)
+    episodes = test_download_episodes(db, num_feeds=5)
+    episodes_validated = bool(episodes)
     if not episodes:
         print("\n⚠️  No episodes downloaded or found")
         print("   Pipeline test will continue with existing episodes...")
         # Try to get existing episodes
-        db = PostgresDB()
         episodes = db.get_episodes_by_status('downloaded')
-        db.close()
         if not episodes:
             print("\n❌ Pipeline test aborted: No episodes available")
             sys.exit(1)
     
     # Test 3: Transcribe episodes
-    transcribed_episodes = test_transcribe_episodes(episodes)
+    transcribed_episodes = test_transcribe_episodes(db, episodes, validated=episodes_validated)
     if not transcribed_episodes:
         print("\n⚠️  No episodes transcribed")
         print("   Pipeline test will continue with existing transcribed episodes...")
         # Try to get existing transcribed episodes
-        db = PostgresDB()
         transcribed_episodes = db.get_episodes_by_status('transcribed')
-        db.close()
         if not transcribed_episodes:
             print("\n⚠️  Pipeline test completed: No episodes available for summarization")
             sys.exit(0)
     
     # Test 4: Summarize episodes
-    summarize_results = test_summarize_episodes(transcribed_episodes)
+    summarize_results = test_summarize_episodes(db, transcribed_episodes)
     
     # Final summary
     print("\n" + "="*70)
@@ -602,6 +655,7 @@ def main():
 
 
 if __name__ == "__main__":
+    buffer_stdout()
     try:
         main()
     except KeyboardInterrupt:
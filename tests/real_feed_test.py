@@ -2,12 +2,13 @@
 Test with real RSS feed from feeds.yaml
 """
 
-import json
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from utils.database import P3Database
 from utils.downloader import PodcastDownloader
 from utils.download import load_feeds_config
+from utils.console import write_json_report
 import feedparser
 
 
@@ -215,10 +216,11 @@ def test_real_feed():
         
         # Calculate summary
         total_tests = len(results["tests"])
-        passed_tests = sum(1 for t in results["tests"] if t["status"] == "passed")
-        failed_tests = sum(1 for t in results["tests"] if t["status"] == "failed")
-        skipped_tests = sum(1 for t in results["tests"] if t["status"] == "skipped")
-        warning_tests = sum(1 for t in results["tests"] if t["status"] == "warning")
+        status_counts = Counter(t["status"] for t in results["tests"])
+        passed_tests = status_counts["passed"]
+        failed_tests = status_counts["failed"]
+        skipped_tests = status_counts["skipped"]
+        warning_tests = status_counts["warning"]
         
         results["summary"] = {
             "total": total_tests,
@@ -238,8 +240,7 @@ def test_real_feed():
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = output_dir / f"real_feed_test_{timestamp}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    write_json_report(output_file, results)
     
     print(f"Real feed test results saved to {output_file}")
     print(f"Summary: {results.get('summary', {})}")
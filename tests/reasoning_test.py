@@ -4,6 +4,8 @@ Test Groq reasoning models via LangChain.
 
 import json
 import sys
+from functools import lru_cache
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
@@ -11,31 +13,103 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.config import get_groq_api_key, get_groq_model
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from utils.console import write_json_report
+from utils.llm_cache import enable_llm_cache
+
+# Static system-prompt prefix shared by every prompt so repeated runs start with identical tokens
+SYSTEM_PREFIX = "You are a helpful assistant.\n"
+
+# Large prompt for the context window test; identical bytes on every run
+LARGE_CONTEXT_TEXT = " ".join([f"Topic {i}: This is a test topic about technology and innovation." for i in range(100)])
+
+# The context window test summarizes at a lower temperature than the shared client's 0.7
+CONTEXT_TEST_TEMPERATURE = 0.3
+
+# Product description for the JSON extraction test
+PRODUCT_DESCRIPTION = """The Kees Van Der Westen Speedster is a high-end, single-group espresso machine priced at $6,500. 
+        It features PID temperature control, E61 group head, and commercial-grade build quality."""
+
+# Reports go here; created once at import rather than on every save
+OUTPUT_DIR = Path("test-results")
+OUTPUT_DIR.mkdir(exist_ok=True)
+
+
+@lru_cache(maxsize=1)
+def _reasoning_prompts():
+    """
+    Build the prompt templates and JSON parser for Tests 3-5 once per process.
+    
+    LangChain is imported lazily here (see test_reasoning), so the templates
+    can't be plain module constants; caching the builder gives the same reuse
+    when the test runs repeatedly in one process.
+    
+    Returns:
+        Tuple of (simple prompt, JSON prompt, context window prompt, JSON parser)
+    """
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.output_parsers import JsonOutputParser
+    
+    simple_prompt = ChatPromptTemplate.from_messages([
+        ("system", SYSTEM_PREFIX + "Answer concisely."),
+        ("user", "What is 2+2? Answer in one word.")
+    ])
+    
+    json_parser = JsonOutputParser(
+        pydantic_object={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "price": {"type": "number"},
+                "features": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["name", "price", "features"]
+        }
+    )
+    
+    json_prompt = ChatPromptTemplate.from_messages([
+        ("system", SYSTEM_PREFIX + """Extract product details into JSON with this structure:
+{{
+  "name": "product name here",
+  "price": number_here_without_currency_symbol,
+  "features": ["feature1", "feature2", "feature3"]
+}}"""),
+        ("user", "{input}")
+    ])
+    
+    context_prompt = ChatPromptTemplate.from_messages([
+        ("system", SYSTEM_PREFIX + "Summarize the main themes from these topics."),
+        ("user", "{input}")
+    ])
+    
+    return simple_prompt, json_prompt, context_prompt, json_parser
 
 
 def test_reasoning():
     """Test Groq reasoning models with LangChain."""
+    # Imported here so loading this module (e.g. to list suites) skips LangChain's import cost
+    from langchain_core.runnables import ConfigurableField
+    from langchain_groq import ChatGroq
+    
     print("=" * 60)
     print("Groq Reasoning Models Test")
     print("=" * 60)
     print()
     
+    now = datetime.now()
     results = {
         'test_name': 'reasoning_test',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'tests': []
     }
     
-    # Test 1: Check API key and model config
+    # Test 1: Check API key and model config (reused by the tests below)
     test_result = {
         'name': 'config_check',
         'status': 'pending',
         'message': ''
     }
     
+    api_key = model = None
     try:
         api_key = get_groq_api_key()
         model = get_groq_model()
@@ -51,16 +125,22 @@ def test_reasoning():
     
     results['tests'].append(test_result)
     
-    # Test 2: Initialize LangChain ChatGroq
+    # Test 2: Initialize LangChain ChatGroq (shared by the prompt tests below)
     test_result = {
         'name': 'langchain_initialization',
         'status': 'pending',
         'message': ''
     }
     
+    llm = None
     try:
-        api_key = get_groq_api_key()
-        model = get_groq_model()
+        if not api_key:
+            raise ValueError('Groq configuration not loaded')
+        
+        # Repeat runs answer unchanged prompts from LLM_CACHE_PATH when set
+        if enable_llm_cache():
+            test_result['llm_cache'] = True
+            print("✓ LLM response cache enabled")
         
         llm = ChatGroq(
             model_name=model,
@@ -79,6 +159,41 @@ def test_reasoning():
     
     results['tests'].append(test_result)
     
+    # Tests 3-5 are independent prompts: build them all, then send them in one
+    # concurrent batch instead of three sequential round trips
+    simple_prompt, json_prompt, context_prompt, json_parser = _reasoning_prompts()
+    
+    prompts = [
+        simple_prompt.format_messages(),
+        json_prompt.format_messages(input=PRODUCT_DESCRIPTION),
+        context_prompt.format_messages(input=LARGE_CONTEXT_TEXT)
+    ]
+    
+    # One config per prompt; the context window test keeps its own lower temperature
+    configs = [{'max_concurrency': len(prompts)} for _ in prompts]
+    configs[2]['configurable'] = {'temperature': CONTEXT_TEST_TEMPERATURE}
+    
+    batch_error = None
+    responses = [None] * len(prompts)
+    if llm is None:
+        batch_error = 'ChatGroq not initialized'
+    else:
+        try:
+            batch_llm = llm.configurable_fields(temperature=ConfigurableField(id='temperature'))
+            # return_exceptions keeps one failed prompt from failing the others
+            responses = batch_llm.batch(prompts, config=configs, return_exceptions=True)
+        except Exception as e:
+            batch_error = str(e)
+    
+    def batch_response(index: int):
+        """Return the batched response for a prompt, raising its error if it failed."""
+        if batch_error:
+            raise RuntimeError(batch_error)
+        response = responses[index]
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
     # Test 3: Simple reasoning test
     test_result = {
         'name': 'simple_reasoning',
@@ -87,22 +202,7 @@ def test_reasoning():
     }
     
     try:
-        api_key = get_groq_api_key()
-        model = get_groq_model()
-        
-        llm = ChatGroq(
-            model_name=model,
-            temperature=0.7,
-            groq_api_key=api_key
-        )
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a helpful assistant. Answer concisely."),
-            ("user", "What is 2+2? Answer in one word.")
-        ])
-        
-        chain = prompt | llm
-        response = chain.invoke({})
+        response = batch_response(0)
         
         answer = response.content.strip()
         
@@ -131,43 +231,7 @@ def test_reasoning():
     }
     
     try:
-        api_key = get_groq_api_key()
-        model = get_groq_model()
-        
-        llm = ChatGroq(
-            model_name=model,
-            temperature=0.7,
-            groq_api_key=api_key
-        )
-        
-        parser = JsonOutputParser(
-            pydantic_object={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "price": {"type": "number"},
-                    "features": {"type": "array", "items": {"type": "string"}}
-                },
-                "required": ["name", "price", "features"]
-            }
-        )
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """Extract product details into JSON with this structure:
-{{
-  "name": "product name here",
-  "price": number_here_without_currency_symbol,
-  "features": ["feature1", "feature2", "feature3"]
-}}"""),
-            ("user", "{input}")
-        ])
-        
-        chain = prompt | llm | parser
-        
-        description = """The Kees Van Der Westen Speedster is a high-end, single-group espresso machine priced at $6,500. 
-        It features PID temperature control, E61 group head, and commercial-grade build quality."""
-        
-        result = chain.invoke({"input": description})
+        result = json_parser.invoke(batch_response(1))
         
         if isinstance(result, dict) and 'name' in result and 'price' in result:
             test_result['status'] = 'passed'
@@ -194,25 +258,7 @@ def test_reasoning():
     }
     
     try:
-        api_key = get_groq_api_key()
-        model = get_groq_model()
-        
-        llm = ChatGroq(
-            model_name=model,
-            temperature=0.3,
-            groq_api_key=api_key
-        )
-        
-        # Create a large prompt to test context window
-        large_text = " ".join([f"Topic {i}: This is a test topic about technology and innovation." for i in range(100)])
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "Summarize the main themes from these topics."),
-            ("user", "{input}")
-        ])
-        
-        chain = prompt | llm
-        response = chain.invoke({"input": large_text})
+        response = batch_response(2)
         
         if response.content and len(response.content) > 10:
             test_result['status'] = 'passed'
@@ -232,10 +278,11 @@ def test_reasoning():
     
     # Calculate summary
     total_tests = len(results['tests'])
-    passed_tests = sum(1 for t in results['tests'] if t['status'] == 'passed')
-    failed_tests = sum(1 for t in results['tests'] if t['status'] == 'failed')
-    skipped_tests = sum(1 for t in results['tests'] if t['status'] == 'skipped')
-    warning_tests = sum(1 for t in results['tests'] if t['status'] == 'warning')
+    status_counts = Counter(t['status'] for t in results['tests'])
+    passed_tests = status_counts['passed']
+    failed_tests = status_counts['failed']
+    skipped_tests = status_counts['skipped']
+    warning_tests = status_counts['warning']
     
     results['summary'] = {
         'total': total_tests,
@@ -247,13 +294,10 @@ def test_reasoning():
     }
     
     # Save results
-    output_dir = Path("test-results")
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = output_dir / f"reasoning_test_{timestamp}.json"
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    output_file = OUTPUT_DIR / f"reasoning_test_{timestamp}.json"
     
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    write_json_report(output_file, results)
     
     print()
     print("=" * 60)
@@ -2,155 +2,172 @@
 Run all tests and generate consolidated report
 """
 
+import argparse
+import asyncio
+import importlib
 import json
+import os
+import tempfile
+import time
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List, Optional
 import sys
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tests.database_test import test_database
-from tests.downloader_test import test_downloader
-from tests.test_xai_integration import test_xai_integration
-from tests.real_feed_test import test_real_feed
-from tests.utils_test import test_utils
-from tests.db_opp_test import test_db_opp
-from tests.ai_processing_test import test_ai_processing
+from utils.console import write_json_report
 
+# Reports go here; created once at import rather than on every save
+OUTPUT_DIR = Path("test-results")
+OUTPUT_DIR.mkdir(exist_ok=True)
 
-def run_all_tests():
-    """Run all test suites and generate consolidated report"""
+# (label, module name, "module:entry point") in report order. Entry points are
+# imported only when their suite runs, so selecting one suite with --suite
+# doesn't pay for importing LangChain, DuckDB, etc. for all the others.
+TEST_MODULES = [
+    ("Database", "database_test", "tests.database_test:test_database"),
+    ("Downloader", "downloader_test", "tests.downloader_test:test_downloader"),
+    ("XAI integration", "xai_integration_test", "tests.test_xai_integration:test_xai_integration"),
+    ("Real feed", "real_feed_test", "tests.real_feed_test:test_real_feed"),
+    ("Utils", "utils_test", "tests.utils_test:test_utils"),
+    ("DB OPP", "db_opp_test", "tests.db_opp_test:test_db_opp"),
+    ("AI processing", "ai_processing_test", "tests.ai_processing_test:test_ai_processing"),
+]
+
+# Modules that share a database file run one after another in the same lane
+SHARED_DB_LANES = [
+    ["database_test", "downloader_test"],  # both use data/test_p3.duckdb
+]
+
+
+def _load_entry_point(entry_point: str):
+    """Import "package.module:function" and return the function."""
+    module_path, function_name = entry_point.split(":")
+    return getattr(importlib.import_module(module_path), function_name)
+
+
+def _run_module(label: str, module_name: str, entry_point: str) -> Dict:
+    """
+    Import, run and time one test module.
+    
+    An exception (including a failed import) becomes an error entry for this
+    module only, like the sequential runner did.
+    """
+    print(f"Running {label} tests...")
+    start = time.perf_counter()
+    try:
+        results = _load_entry_point(entry_point)()
+        duration = time.perf_counter() - start
+        print(f"✓ {label} tests completed in {duration:.1f}s")
+    except Exception as e:
+        duration = time.perf_counter() - start
+        print(f"✗ {label} tests failed after {duration:.1f}s: {e}")
+        results = {
+            "test_name": module_name,
+            "error": str(e)
+        }
+    results["duration_seconds"] = round(duration, 3)
+    return results
+
+
+async def _run_module_subprocess(label: str, module_name: str, entry_point: str):
+    """
+    Run one test module in a child interpreter and collect its output and results.
+    
+    A separate process captures everything the suite writes, including output
+    from threads it starts and tracebacks on stderr, without interleaving it
+    with suites running alongside. Results come back through a JSON file.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results_file = Path(tmp_dir) / "results.json"
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(Path(__file__).resolve()),
+            "--run-module", module_name, "--results-file", str(results_file),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env={**os.environ, "PYTHONIOENCODING": "utf-8", "PYTHONUNBUFFERED": "1"}
+        )
+        output, _ = await process.communicate()
+        try:
+            results = json.loads(results_file.read_text())
+        except (OSError, ValueError):
+            results = {
+                "test_name": module_name,
+                "error": f"{label} tests exited with code {process.returncode} without writing results"
+            }
+    return module_name, results, output.decode("utf-8", errors="replace")
+
+
+async def _run_lane(modules: List) -> List:
+    """Run a lane of modules in order, each in its own subprocess."""
+    return [await _run_module_subprocess(*module) for module in modules]
+
+
+async def _run_lanes(lanes: List) -> List:
+    """Run lanes concurrently; the suites are mostly waiting on network I/O."""
+    return await asyncio.gather(*(_run_lane(lane) for lane in lanes), return_exceptions=True)
+
+
+def run_all_tests(suites: Optional[List[str]] = None):
+    """
+    Run all test suites (or the selected ones) and generate consolidated report.
+    
+    Args:
+        suites: Module names from TEST_MODULES to run (default: all)
+    """
     print("=" * 60)
     print("Running Open Podcast Processor Test Suite")
     print("=" * 60)
     print()
     
+    now = datetime.now()
     all_results = {
         "test_suite": "open_podcast_processor",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "test_modules": []
     }
     
-    # Run database tests
-    print("Running database tests...")
-    try:
-        db_results = test_database()
-        all_results["test_modules"].append(db_results)
-        print(f"✓ Database tests completed")
-    except Exception as e:
-        print(f"✗ Database tests failed: {e}")
-        all_results["test_modules"].append({
-            "test_name": "database_test",
-            "error": str(e)
-        })
-    
-    print()
+    selected = [module for module in TEST_MODULES if not suites or module[1] in suites]
+    
+    # Group modules into lanes: shared-database modules together, the rest on their own
+    by_name = {module[1]: module for module in selected}
+    lanes = [[by_name[name] for name in lane if name in by_name] for lane in SHARED_DB_LANES]
+    lanes = [lane for lane in lanes if lane]
+    laned = {name for lane in SHARED_DB_LANES for name in lane}
+    lanes += [[module] for module in selected if module[1] not in laned]
+    
+    lane_outcomes = asyncio.run(_run_lanes(lanes))
+    
+    # Flush each module's buffered output and results in the original order
+    outcomes = {}
+    for lane, lane_result in zip(lanes, lane_outcomes):
+        if isinstance(lane_result, BaseException):
+            for _, module_name, _ in lane:
+                outcomes[module_name] = ("", {"test_name": module_name, "error": str(lane_result)})
+            continue
+        for module_name, results, output in lane_result:
+            outcomes[module_name] = (output, results)
+    
+    for _, module_name, _ in selected:
+        output, results = outcomes[module_name]
+        print(output, end="")
+        print()
+        all_results["test_modules"].append(results)
     
-    # Run downloader tests
-    print("Running downloader tests...")
-    try:
-        downloader_results = test_downloader()
-        all_results["test_modules"].append(downloader_results)
-        print(f"✓ Downloader tests completed")
-    except Exception as e:
-        print(f"✗ Downloader tests failed: {e}")
-        all_results["test_modules"].append({
-            "test_name": "downloader_test",
-            "error": str(e)
-        })
-    
-    print()
-    
-    # Run XAI integration tests
-    print("Running XAI integration tests...")
-    try:
-        xai_results = test_xai_integration()
-        all_results["test_modules"].append(xai_results)
-        print(f"✓ XAI integration tests completed")
-    except Exception as e:
-        print(f"✗ XAI integration tests failed: {e}")
-        all_results["test_modules"].append({
-            "test_name": "xai_integration_test",
-            "error": str(e)
-        })
-    
-    print()
-    
-    # Run real feed tests
-    print("Running real feed tests...")
-    try:
-        real_feed_results = test_real_feed()
-        all_results["test_modules"].append(real_feed_results)
-        print(f"✓ Real feed tests completed")
-    except Exception as e:
-        print(f"✗ Real feed tests failed: {e}")
-        all_results["test_modules"].append({
-            "test_name": "real_feed_test",
-            "error": str(e)
-        })
-    
-    print()
-    
-    # Run utils tests
-    print("Running utils tests...")
-    try:
-        utils_results = test_utils()
-        all_results["test_modules"].append(utils_results)
-        print(f"✓ Utils tests completed")
-    except Exception as e:
-        print(f"✗ Utils tests failed: {e}")
-        all_results["test_modules"].append({
-            "test_name": "utils_test",
-            "error": str(e)
-        })
-    
-    print()
-    
-    # Run db_opp tests
-    print("Running db_opp tests...")
-    try:
-        db_opp_results = test_db_opp()
-        all_results["test_modules"].append(db_opp_results)
-        print(f"✓ DB OPP tests completed")
-    except Exception as e:
-        print(f"✗ DB OPP tests failed: {e}")
-        all_results["test_modules"].append({
-            "test_name": "db_opp_test",
-            "error": str(e)
-        })
-    
-    print()
-    
-    # Run AI processing tests
-    print("Running AI processing tests...")
-    try:
-        ai_processing_results = test_ai_processing()
-        all_results["test_modules"].append(ai_processing_results)
-        print(f"✓ AI processing tests completed")
-    except Exception as e:
-        print(f"✗ AI processing tests failed: {e}")
-        all_results["test_modules"].append({
-            "test_name": "ai_processing_test",
-            "error": str(e)
-        })
-    
-    print()
     print("=" * 60)
     
     # Calculate overall summary
-    total_tests = 0
-    total_passed = 0
-    total_failed = 0
-    total_skipped = 0
-    
+    totals = Counter()
     for module in all_results["test_modules"]:
-        if "summary" in module:
-            summary = module["summary"]
-            total_tests += summary.get("total", 0)
-            total_passed += summary.get("passed", 0)
-            total_failed += summary.get("failed", 0)
-            total_skipped += summary.get("skipped", 0)
+        summary = module.get("summary", {})
+        totals.update({key: summary.get(key, 0) for key in ("total", "passed", "failed", "skipped")})
+    total_tests = totals["total"]
+    total_passed = totals["passed"]
+    total_failed = totals["failed"]
+    total_skipped = totals["skipped"]
     
     all_results["overall_summary"] = {
         "total_tests": total_tests,
@@ -170,13 +187,9 @@ def run_all_tests():
     print("=" * 60)
     
     # Save consolidated report
-    output_dir = Path("test-results")
-    output_dir.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = output_dir / f"all_tests_report_{timestamp}.json"
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2, default=str)
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    output_file = OUTPUT_DIR / f"all_tests_report_{timestamp}.json"
+    write_json_report(output_file, all_results)
     
     print(f"\nConsolidated test report saved to {output_file}")
     
@@ -184,4 +197,19 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    run_all_tests()
+    parser = argparse.ArgumentParser(description="Run the test suites and write a consolidated report")
+    parser.add_argument(
+        "--suite",
+        action="append",
+        choices=[module[1] for module in TEST_MODULES],
+        help="Run only this suite (repeatable; default: all)"
+    )
+    # Internal: run a single module in this process (used by _run_module_subprocess)
+    parser.add_argument("--run-module", help=argparse.SUPPRESS)
+    parser.add_argument("--results-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run_module:
+        module = next(module for module in TEST_MODULES if module[1] == args.run_module)
+        write_json_report(args.results_file, _run_module(*module))
+    else:
+        run_all_tests(suites=args.suite)
@@ -2,18 +2,57 @@
 Batch processing script that processes locally and saves to PostgreSQL.
 """
 
-import json
+import argparse
+import asyncio
 import sys
+import traceback
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.database import P3Database
-from utils.postgres_db import PostgresDB
+from utils.postgres_db import PostgresDB, dispose_engines
 from utils.batch_download import batch_download_one_per_feed
 from utils.batch_process_postgres import process_and_save_to_postgres, migrate_duckdb_to_postgres
+from utils.console import StepLog, buffer_stdout, write_json_report
+
+DUCKDB_PATH = "db/demo.duckdb"
+
+
+def _download_new_episodes(duckdb: P3Database) -> Dict:
+    """Download one episode per feed into DuckDB."""
+    return batch_download_one_per_feed(
+        db=duckdb,
+        data_dir="data/demo",
+        audio_format="mp3"
+    )
+
+
+def _migrate_with_own_connection(postgres: PostgresDB) -> int:
+    """Migrate DuckDB data over a separate DuckDB connection, so downloads can use the main one meanwhile."""
+    duckdb = P3Database(db_path=DUCKDB_PATH)
+    try:
+        return migrate_duckdb_to_postgres(duckdb, postgres)
+    finally:
+        duckdb.close()
+
+
+async def _migrate_while_downloading(duckdb: P3Database, postgres: PostgresDB) -> Tuple[int, Dict]:
+    """
+    Run the DuckDB -> PostgreSQL migration and the batch download concurrently.
+    
+    The migration is mostly PostgreSQL writes and the download mostly HTTP, so
+    overlapping them hides the shorter one. Episodes downloaded while the
+    migration reads may or may not be migrated; either way Step 2 saves them.
+    """
+    migrated_count, download_results = await asyncio.gather(
+        asyncio.to_thread(_migrate_with_own_connection, postgres),
+        asyncio.to_thread(_download_new_episodes, duckdb)
+    )
+    return migrated_count, download_results
 
 
 def run_batch_postgres(skip_download=False, migrate_existing=False):
@@ -33,7 +72,7 @@ def run_batch_postgres(skip_download=False, migrate_existing=False):
     print()
     
     # Initialize databases
-    duckdb = P3Database(db_path="db/demo.duckdb")
+    duckdb = P3Database(db_path=DUCKDB_PATH)
     
     try:
         postgres = PostgresDB()
@@ -48,38 +87,51 @@ def run_batch_postgres(skip_download=False, migrate_existing=False):
         print("\nInitializing PostgreSQL schema...")
         sql_file = Path("sql/schema.sql")
         if sql_file.exists():
-            postgres.execute_sql_file(str(sql_file))
-            print("✓ Schema initialized")
+            if postgres.execute_sql_file(str(sql_file), skip_if_unchanged=True):
+                print("✓ Schema initialized")
+            else:
+                print("✓ Schema already up to date")
         else:
             print("⚠️  SQL schema file not found, assuming schema exists")
     except Exception as e:
         print(f"⚠️  Schema initialization warning: {e}")
     
+    now = datetime.now()
     results = {
         'test_name': 'batch_postgres',
-        'timestamp': datetime.now().isoformat(),
-        'duckdb_path': 'db/demo.duckdb'
+        'timestamp': now.isoformat(),
+        'duckdb_path': DUCKDB_PATH
     }
     
+    # Each step is also appended to an NDJSON log as it finishes (tail -f friendly)
+    output_dir = Path("test-results")
+    output_dir.mkdir(exist_ok=True)
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    steps = StepLog(output_dir / f"batch_postgres_{timestamp}.ndjson")
+    
     try:
-        # Migrate existing data if requested
+        # Migrate existing data if requested (alongside the download, when there is one)
+        download_results = None
         if migrate_existing:
             print("\n" + "=" * 60)
-            print("Migrating existing DuckDB data to PostgreSQL")
-            print("=" * 60)
-            migrated_count = migrate_duckdb_to_postgres(duckdb, postgres)
+            if skip_download:
+                print("Migrating existing DuckDB data to PostgreSQL")
+                print("=" * 60)
+                migrated_count = migrate_duckdb_to_postgres(duckdb, postgres)
+            else:
+                print("Migrating existing DuckDB data to PostgreSQL while downloading")
+                print("=" * 60)
+                migrated_count, download_results = asyncio.run(_migrate_while_downloading(duckdb, postgres))
             results['migrated'] = migrated_count
+            steps.write('migrate', {'migrated': migrated_count})
         
         # Step 1: Download (if not skipping)
         if not skip_download:
             print("\n" + "=" * 60)
             print("Step 1: Batch Download")
             print("=" * 60)
-            download_results = batch_download_one_per_feed(
-                db=duckdb,
-                data_dir="data/demo",
-                audio_format="mp3"
-            )
+            if download_results is None:
+                download_results = _download_new_episodes(duckdb)
             results['download'] = download_results
             episode_ids = [ep['id'] for ep in download_results.get('episodes', [])]
             print(f"Downloaded {len(episode_ids)} episode(s)")
@@ -87,13 +139,13 @@ def run_batch_postgres(skip_download=False, migrate_existing=False):
             print("\n" + "=" * 60)
             print("Step 1: Using existing downloaded episodes")
             print("=" * 60)
-            downloaded_episodes = duckdb.get_episodes_by_status('downloaded')
-            episode_ids = [ep['id'] for ep in downloaded_episodes]
+            episode_ids = duckdb.get_episode_ids_by_status('downloaded')
             print(f"Found {len(episode_ids)} downloaded episode(s)")
             results['download'] = {
                 'total_downloaded': len(episode_ids),
                 'message': 'Using existing episodes'
             }
+        steps.write('download', results['download'])
         
         # Step 2: Process and save to PostgreSQL
         if episode_ids:
@@ -112,13 +164,13 @@ def run_batch_postgres(skip_download=False, migrate_existing=False):
             results['processing'] = {
                 'message': 'No episodes to process'
             }
+        steps.write('processing', results['processing'])
         
         # Step 3: Verify saved podcasts
         print("\n" + "=" * 60)
         print("Step 3: Verification")
         print("=" * 60)
         
-        all_podcasts = postgres.get_all_podcasts()
         stats = postgres.get_stats()
         
         print(f"✓ Total podcasts in PostgreSQL: {stats.get('total_podcasts', 0)}")
@@ -132,14 +184,15 @@ def run_batch_postgres(skip_download=False, migrate_existing=False):
             'transcribed': stats.get('transcribed_count', 0),
             'unique_feeds': stats.get('unique_feeds', 0)
         }
+        steps.write('verification', results['verification'])
         
         # Show recent podcasts
         print("\nRecent podcasts:")
-        for podcast in all_podcasts[:6]:
+        for podcast in postgres.get_recent_podcasts(limit=6):
             title = podcast.get('title', 'Untitled')[:60]
             status = podcast.get('status', 'unknown')
-            has_transcript = bool(podcast.get('transcript'))
-            has_summary = bool(podcast.get('summary'))
+            has_transcript = podcast['has_transcript']
+            has_summary = podcast['has_summary']
             print(f"  - {title} [{status}] {'📝' if has_transcript else ''} {'📊' if has_summary else ''}")
         
         print("\n" + "=" * 60)
@@ -149,29 +202,36 @@ def run_batch_postgres(skip_download=False, migrate_existing=False):
         
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
-        import traceback
         traceback.print_exc()
         results['error'] = str(e)
+        steps.write('error', {'error': str(e)})
     
     finally:
         duckdb.close()
         postgres.close()
+        dispose_engines()
+        steps.close()
         
-        # Save results
-        output_dir = Path("test-results")
-        output_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Save the complete results for single-file consumers
         output_file = output_dir / f"batch_postgres_{timestamp}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        write_json_report(output_file, results)
         
-        print(f"\nResults saved to: {output_file}")
+        print(f"\nResults saved to: {output_file} (step log: {steps.path})")
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Process episodes locally and save the results to PostgreSQL")
+    parser.add_argument("-s", "--skip-download", action="store_true",
+                        help="Process existing downloaded episodes instead of downloading")
+    parser.add_argument("-m", "--migrate", dest="migrate_existing", action="store_true",
+                        help="Migrate existing DuckDB data to PostgreSQL first")
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    import sys
-    skip_download = "--skip-download" in sys.argv or "-s" in sys.argv
-    migrate_existing = "--migrate" in sys.argv or "-m" in sys.argv
-    run_batch_postgres(skip_download=skip_download, migrate_existing=migrate_existing)
+    args = parse_args()
+    buffer_stdout()
+    run_batch_postgres(skip_download=args.skip_download, migrate_existing=args.migrate_existing)
 
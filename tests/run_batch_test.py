@@ -6,18 +6,77 @@ Uses batch utilities and processes all feeds from config/feeds.yaml.
 Skips steps that are already complete.
 """
 
-import json
+import argparse
+import os
 import sys
+import traceback
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List, Optional, Set
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.postgres_db import PostgresDB
+from utils.postgres_db import PostgresDB, dispose_engines
 from utils.batch_download import batch_download_one_per_feed
-from utils.batch_process import batch_transcribe_downloaded, batch_summarize_transcribed
+from utils.batch_process import batch_transcribe_and_summarize, batch_summarize_transcribed, MAX_CONCURRENT_EPISODES
 from utils.download import load_feeds_config
+from utils.console import StepLog, buffer_stdout, write_json_report
+
+# Reports go here; created once at import rather than on every save
+OUTPUT_DIR = Path("test-results")
+OUTPUT_DIR.mkdir(exist_ok=True)
+
+PIPELINE_STATUSES = ('downloaded', 'transcribed', 'processed')
+
+# Where batch_download_one_per_feed stores audio
+DATA_DIR = "data/demo"
+
+
+@dataclass
+class PipelineContext:
+    """
+    Feeds and episode listing shared by the steps of one main() run.
+    
+    The episode listing is loaded with one query on first use and reused until
+    a step that changes episode statuses calls invalidate().
+    """
+    feeds: List[Dict] = field(default_factory=list)
+    _episodes: Optional[List[Dict]] = None
+    
+    def episodes_with_status(self, status: str) -> List[Dict]:
+        """Episodes (without transcript/summary) currently in the given status."""
+        if self._episodes is None:
+            db = PostgresDB()
+            try:
+                self._episodes = db.get_episode_listing(list(PIPELINE_STATUSES))
+            finally:
+                db.close()
+        return [ep for ep in self._episodes if ep['status'] == status]
+    
+    def invalidate(self):
+        """Forget the episode listing after downloads/transcriptions changed it."""
+        self._episodes = None
+
+
+def _existing_audio_files(data_dir: str = DATA_DIR) -> Set[str]:
+    """Absolute paths of all files under data_dir, from one directory walk instead of a stat per episode."""
+    existing = set()
+    for dirpath, _, filenames in os.walk(data_dir):
+        existing.update(os.path.abspath(os.path.join(dirpath, name)) for name in filenames)
+    return existing
+
+
+def _audio_file_exists(file_path: Optional[str], existing: Set[str], data_dir: str = DATA_DIR) -> bool:
+    """Check file_path against a _existing_audio_files() set, stat-ing only files stored elsewhere."""
+    if not file_path:
+        return False
+    path = os.path.abspath(file_path)
+    if path.startswith(os.path.abspath(data_dir) + os.sep):
+        return path in existing
+    return os.path.exists(path)
 
 
 def test_database_connection():
@@ -36,8 +95,10 @@ def test_database_connection():
         print("\n[1.2] Initializing PostgreSQL schema...")
         schema_path = Path(__file__).parent.parent / "sql" / "schema.sql"
         if schema_path.exists():
-            db.execute_sql_file(str(schema_path))
-            print("✓ PostgreSQL schema initialized")
+            if db.execute_sql_file(str(schema_path), skip_if_unchanged=True):
+                print("✓ PostgreSQL schema initialized")
+            else:
+                print("✓ PostgreSQL schema already up to date")
         else:
             print("⚠️  Schema file not found, skipping schema initialization")
         
@@ -46,7 +107,6 @@ def test_database_connection():
         return True
     except Exception as e:
         print(f"\n❌ TEST 1 FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -81,21 +141,21 @@ def test_load_feeds_config():
         
     except Exception as e:
         print(f"\n❌ TEST 2 FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return []
 
 
-def test_batch_download_episodes(skip_download=False, process_all_downloaded=False):
+def test_batch_download_episodes(skip_download=False, process_all_downloaded=False, ctx=None):
     """Test 3: Batch download episodes from all feeds."""
     print("\n" + "="*70)
     print("TEST 3: Batch Download Episodes from All Feeds")
     print("="*70)
     
+    if ctx is None:
+        ctx = PipelineContext(feeds=load_feeds_config().get('feeds', []))
+    
     try:
-        # Load feed configuration
-        config = load_feeds_config()
-        feeds = config.get('feeds', [])
+        feeds = ctx.feeds
         
         if not feeds:
             print("❌ No feeds configured in config/feeds.yaml")
@@ -117,40 +177,29 @@ def test_batch_download_episodes(skip_download=False, process_all_downloaded=Fal
             'episodes': []
         }
         
-        if skip_download:
-            print("\n[3.3] Skipping download, using existing episodes...")
-            downloaded_episodes = db.get_episodes_by_status('downloaded')
-            episode_ids = [ep['id'] for ep in downloaded_episodes]
-            
-            print(f"✓ Found {len(episode_ids)} downloaded episode(s) to process")
-            results['total_existing'] = len(episode_ids)
-            results['message'] = 'Using existing downloaded episodes'
+        # Use existing downloads instead of downloading (--skip-download or --all);
+        # both modes read the same 'downloaded' rows, so fetch and filter them once
+        if skip_download or process_all_downloaded:
+            if skip_download:
+                print("\n[3.3] Skipping download, using existing episodes...")
+            else:
+                print("\n[3.3] Processing ALL downloaded episodes (not just batch download)")
+            downloaded_episodes = ctx.episodes_with_status('downloaded')
             
             # Filter episodes with valid files
-            valid_episodes = []
-            for ep in downloaded_episodes:
-                file_path = ep.get('audio_file_path') or ep.get('file_path')
-                if file_path and Path(file_path).exists():
-                    valid_episodes.append(ep)
+            existing_files = _existing_audio_files()
+            valid_episodes = [
+                ep for ep in downloaded_episodes
+                if _audio_file_exists(ep.get('audio_file_path') or ep.get('file_path'), existing_files)
+            ]
             
             db.close()
-            print("\n✅ TEST 3 PASSED: Using existing episodes")
-            print(f"   {len(valid_episodes)} episode(s) ready for transcription")
-            return valid_episodes
-        
-        # Process all downloaded episodes if flag is set
-        if process_all_downloaded:
-            print("\n[3.3] Processing ALL downloaded episodes (not just batch download)")
-            all_downloaded = db.get_episodes_by_status('downloaded')
-            valid_episodes = []
-            for ep in all_downloaded:
-                file_path = ep.get('audio_file_path') or ep.get('file_path')
-                if file_path and Path(file_path).exists():
-                    valid_episodes.append(ep)
-            
-            print(f"✓ Found {len(valid_episodes)} downloaded episode(s)")
-            db.close()
-            print("\n✅ TEST 3 PASSED: Using all downloaded episodes")
+            if skip_download:
+                print(f"✓ Found {len(downloaded_episodes)} downloaded episode(s) to process")
+                print("\n✅ TEST 3 PASSED: Using existing episodes")
+            else:
+                print(f"✓ Found {len(valid_episodes)} downloaded episode(s)")
+                print("\n✅ TEST 3 PASSED: Using all downloaded episodes")
             print(f"   {len(valid_episodes)} episode(s) ready for transcription")
             return valid_episodes
         
@@ -160,10 +209,12 @@ def test_batch_download_episodes(skip_download=False, process_all_downloaded=Fal
         
         download_results = batch_download_one_per_feed(
             db=db,
-            data_dir="data/demo",
+            data_dir=DATA_DIR,
             audio_format="mp3"  # Convert to MP3 for faster processing
         )
         
+        ctx.invalidate()
+        
         results['total_downloaded'] = download_results.get('total_downloaded', 0)
         results['feed_results'] = download_results.get('feed_results', {})
         results['episodes'] = download_results.get('episodes', [])
@@ -191,15 +242,13 @@ def test_batch_download_episodes(skip_download=False, process_all_downloaded=Fal
                 else:
                     print(f"  ⚠️  {feed_name}: No new episodes (may already exist)")
         
-        # Get valid episodes with files
-        valid_episodes = []
-        for ep_info in results['episodes']:
-            file_path = ep_info.get('file_path')
-            if file_path and Path(file_path).exists():
-                # Get full episode from database
-                episode = db.get_episode_by_id(ep_info['id'])
-                if episode:
-                    valid_episodes.append(episode)
+        # Get valid episodes with files (full rows fetched in one query)
+        existing_files = _existing_audio_files()
+        ids_with_files = [
+            ep_info['id'] for ep_info in results['episodes']
+            if _audio_file_exists(ep_info.get('file_path'), existing_files)
+        ]
+        valid_episodes = db.get_episodes_by_ids(ids_with_files)
         
         db.close()
         
@@ -210,31 +259,38 @@ def test_batch_download_episodes(skip_download=False, process_all_downloaded=Fal
         
     except Exception as e:
         print(f"\n❌ TEST 3 FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return []
 
 
-def test_batch_transcribe_episodes(episodes):
-    """Test 4: Batch transcribe downloaded episodes."""
+def test_batch_transcribe_episodes(episodes, concurrency=MAX_CONCURRENT_EPISODES):
+    """
+    Test 4: Batch transcribe downloaded episodes.
+    
+    Each episode is summarized as soon as its transcript is saved, so this also
+    does Test 5's work; returns (transcribed episodes, summarization results).
+    """
     print("\n" + "="*70)
     print("TEST 4: Batch Transcribe Episodes")
     print("="*70)
     
     if not episodes:
         print("⚠️  No episodes provided for transcription")
-        return []
+        return [], None
     
-    # Filter episodes with valid files
+    # Filter episodes with valid files, collecting their IDs in the same pass
+    existing_files = _existing_audio_files()
     valid_episodes = []
+    episode_ids = []
     for ep in episodes:
         file_path = ep.get('audio_file_path') or ep.get('file_path')
-        if file_path and Path(file_path).exists():
+        if _audio_file_exists(file_path, existing_files):
             valid_episodes.append(ep)
+            episode_ids.append(ep['id'])
     
     if not valid_episodes:
         print("❌ No episodes with valid audio files found")
-        return []
+        return [], None
     
     print(f"\n✅ Found {len(valid_episodes)} episode(s) ready for transcription\n")
     
@@ -256,18 +312,16 @@ def test_batch_transcribe_episodes(episodes):
     # Initialize database
     db = PostgresDB()
     
-    # Get episode IDs
-    episode_ids = [ep['id'] for ep in valid_episodes]
-    
     print(f"\n{'='*70}")
     print(f"BATCH TRANSCRIBING {len(episode_ids)} EPISODE(S)")
     print(f"{'='*70}\n")
     
     try:
-        # Batch transcribe
-        transcription_results = batch_transcribe_downloaded(
+        # Batch transcribe, summarizing each episode as soon as it is transcribed
+        transcription_results, summarization_results = batch_transcribe_and_summarize(
             db=db,
-            episode_ids=episode_ids
+            episode_ids=episode_ids,
+            max_concurrency=concurrency
         )
         
         # Summary
@@ -289,34 +343,37 @@ def test_batch_transcribe_episodes(episodes):
                 else:
                     print(f"  ❌ {result.get('title', 'Unknown')[:60]}... (Error: {result.get('error', 'Unknown')})")
         
-        # Get transcribed episodes
-        transcribed_episodes = []
-        for ep in valid_episodes:
-            episode_check = db.get_episode_by_id(ep['id'])
-            if episode_check.get('status') == 'transcribed' or episode_check.get('status') == 'processed':
-                transcribed_episodes.append(episode_check)
+        # Get transcribed episodes (one query for the whole batch)
+        transcribed_episodes = [
+            episode for episode in db.get_episodes_by_ids(episode_ids)
+            if episode.get('status') in ('transcribed', 'processed')
+        ]
         
         db.close()
         
         print("\n✅ TEST 4 PASSED: Batch transcription completed")
-        print(f"   {len(transcribed_episodes)} episode(s) ready for summarization")
+        print(f"   {len(transcribed_episodes)} episode(s) transcribed")
         
-        return transcribed_episodes
+        return transcribed_episodes, summarization_results
         
     except KeyboardInterrupt:
         print(f"\n\n⚠️  Transcription interrupted by user")
         db.close()
-        return []
+        return [], None
     except Exception as e:
         print(f"\n❌ TEST 4 FAILED: {e}")
-        import traceback
         traceback.print_exc()
         db.close()
-        return []
+        return [], None
 
 
-def test_batch_summarize_episodes(episodes):
-    """Test 5: Batch summarize transcribed episodes."""
+def test_batch_summarize_episodes(episodes, summarization_results=None, concurrency=MAX_CONCURRENT_EPISODES):
+    """
+    Test 5: Batch summarize transcribed episodes.
+    
+    If Test 4 already summarized them while transcribing, pass its
+    summarization_results to report them instead of summarizing again.
+    """
     print("\n" + "="*70)
     print("TEST 5: Batch Summarize Episodes")
     print("="*70)
@@ -331,18 +388,20 @@ def test_batch_summarize_episodes(episodes):
     db = PostgresDB()
     
     # Get episode IDs
-    episode_ids = [ep['id'] for ep in episodes]
+    episode_ids = list(map(itemgetter('id'), episodes))
     
     print(f"\n{'='*70}")
     print(f"BATCH SUMMARIZING {len(episode_ids)} EPISODE(S)")
     print(f"{'='*70}\n")
     
     try:
-        # Batch summarize
-        summarization_results = batch_summarize_transcribed(
-            db=db,
-            episode_ids=episode_ids
-        )
+        # Batch summarize, unless Test 4 already did it alongside transcription
+        if summarization_results is None:
+            summarization_results = batch_summarize_transcribed(
+                db=db,
+                episode_ids=episode_ids,
+                max_concurrency=concurrency
+            )
         
         # Summary
         print("\n" + "=" * 70)
@@ -375,31 +434,54 @@ def test_batch_summarize_episodes(episodes):
         return {}
     except Exception as e:
         print(f"\n❌ TEST 5 FAILED: {e}")
-        import traceback
         traceback.print_exc()
         db.close()
         return {}
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Batch pipeline test for all feeds: download -> transcribe -> summarize")
+    parser.add_argument("-s", "--skip-download", action="store_true",
+                        help="Use already downloaded episodes instead of downloading")
+    parser.add_argument("-a", "--all", dest="process_all", action="store_true",
+                        help="Process all downloaded episodes, not just this batch")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_EPISODES,
+                        help=f"Episodes transcribed/summarized at once (default: {MAX_CONCURRENT_EPISODES})")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
+
+
+def main(argv=None):
     """Run complete batch pipeline for all feeds."""
+    # Parse command line arguments
+    args = parse_args(argv)
+    skip_download = args.skip_download
+    process_all = args.process_all
+    
     print("\n" + "="*70)
     print("BATCH PIPELINE TEST - ALL FEEDS")
     print("Testing: Download -> Transcribe -> Summarize")
     print("="*70)
     
-    # Parse command line arguments
-    skip_download = "--skip-download" in sys.argv or "-s" in sys.argv
-    process_all = "--all" in sys.argv or "-a" in sys.argv
-    
+    now = datetime.now()
     results = {
         'test_name': 'batch_pipeline_all_feeds',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'database': 'PostgreSQL',
         'skip_download': skip_download,
-        'process_all_downloaded': process_all
+        'process_all_downloaded': process_all,
+        'concurrency': args.concurrency
     }
     
+    # Each step is also appended to an NDJSON log as it finishes (tail -f friendly);
+    # the full results are written to the JSON report once the run ends
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    output_file = OUTPUT_DIR / f"batch_pipeline_{timestamp}.json"
+    steps = StepLog(OUTPUT_DIR / f"batch_pipeline_{timestamp}.ndjson")
+    
     try:
         # Test 1: Database connection
         if not test_database_connection():
@@ -415,19 +497,20 @@ def main():
             return results
         
         results['feeds_count'] = len(feeds)
+        steps.write('feeds', {'feeds_count': len(feeds)})
+        ctx = PipelineContext(feeds=feeds)
         
         # Test 3: Batch download episodes
         episodes = test_batch_download_episodes(
             skip_download=skip_download,
-            process_all_downloaded=process_all
+            process_all_downloaded=process_all,
+            ctx=ctx
         )
         if not episodes:
             print("\n⚠️  No episodes downloaded or found")
             print("   Pipeline test will continue with existing episodes...")
             # Try to get existing episodes
-            db = PostgresDB()
-            episodes = db.get_episodes_by_status('downloaded')
-            db.close()
+            episodes = ctx.episodes_with_status('downloaded')
             if not episodes:
                 print("\n❌ Pipeline test aborted: No episodes available")
                 results['error'] = 'No episodes available'
@@ -435,18 +518,19 @@ def main():
         
         results['download'] = {
             'total_episodes': len(episodes),
-            'episode_ids': [ep['id'] for ep in episodes]
+            'episode_ids': list(map(itemgetter('id'), episodes))
         }
+        steps.write('download', results['download'])
         
         # Test 4: Batch transcribe episodes
-        transcribed_episodes = test_batch_transcribe_episodes(episodes)
+        transcribed_episodes, summarization_results = test_batch_transcribe_episodes(episodes, args.concurrency)
+        ctx.invalidate()
         if not transcribed_episodes:
+            summarization_results = None
             print("\n⚠️  No episodes transcribed")
             print("   Pipeline test will continue with existing transcribed episodes...")
             # Try to get existing transcribed episodes
-            db = PostgresDB()
-            transcribed_episodes = db.get_episodes_by_status('transcribed')
-            db.close()
+            transcribed_episodes = ctx.episodes_with_status('transcribed')
             if not transcribed_episodes:
                 print("\n⚠️  Pipeline test completed: No episodes available for summarization")
                 results['warning'] = 'No episodes available for summarization'
@@ -454,12 +538,14 @@ def main():
         
         results['transcription'] = {
             'total_episodes': len(transcribed_episodes),
-            'episode_ids': [ep['id'] for ep in transcribed_episodes]
+            'episode_ids': list(map(itemgetter('id'), transcribed_episodes))
         }
+        steps.write('transcription', results['transcription'])
         
         # Test 5: Batch summarize episodes
-        summarize_results = test_batch_summarize_episodes(transcribed_episodes)
+        summarize_results = test_batch_summarize_episodes(transcribed_episodes, summarization_results, args.concurrency)
         results['summarization'] = summarize_results
+        steps.write('summarization', summarize_results)
         
         # Final summary
         print("\n" + "="*70)
@@ -468,10 +554,11 @@ def main():
         
         # Show pipeline status
         db = PostgresDB()
-        downloaded_count = len(db.get_episodes_by_status('downloaded'))
-        transcribed_count = len(db.get_episodes_by_status('transcribed'))
-        processed_count = len(db.get_episodes_by_status('processed'))
+        status_counts = db.count_by_status()
         db.close()
+        downloaded_count = status_counts.get('downloaded', 0)
+        transcribed_count = status_counts.get('transcribed', 0)
+        processed_count = status_counts.get('processed', 0)
         
         print(f"\nSummary:")
         print(f"  📥 Downloaded: {len(episodes)} episode(s)")
@@ -486,17 +573,8 @@ def main():
         print(f"📥 Downloaded: {downloaded_count}")
         print(f"🎙️  Transcribed: {transcribed_count}")
         print(f"✅ Processed (with summaries): {processed_count}")
+        steps.write('pipeline_status', status_counts)
         
-        # Save results
-        output_dir = Path("test-results")
-        output_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = output_dir / f"batch_pipeline_{timestamp}.json"
-        
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        
-        print(f"\nResults saved to: {output_file}")
         print("\n✅ Batch pipeline working for all feeds!")
         
         return results
@@ -504,14 +582,22 @@ def main():
     except KeyboardInterrupt:
         print("\n\n⚠️  Pipeline test interrupted by user")
         results['interrupted'] = True
+        steps.write('interrupted')
         return results
     except Exception as e:
         print(f"\n\n❌ Pipeline test failed: {e}")
-        import traceback
         traceback.print_exc()
         results['error'] = str(e)
+        steps.write('error', {'error': str(e)})
         return results
+    finally:
+        # Helpers' PostgresDB() instances share one pooled engine; close its connections once here
+        dispose_engines()
+        steps.close()
+        write_json_report(output_file, results)
+        print(f"\nResults saved to: {output_file} (step log: {steps.path})")
 
 
 if __name__ == "__main__":
+    buffer_stdout()
     main()
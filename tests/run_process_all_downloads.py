@@ -5,6 +5,7 @@ Scans audio directory, compares with database, and processes missing episodes.
 Tests: Find Downloads -> Add to DB -> Transcribe -> Summarize
 """
 
+import os
 import sys
 import time
 from pathlib import Path
@@ -19,6 +20,7 @@ from utils.processing import transcribe_episode, summarize_episode
 from utils.transcriber_groq import AudioTranscriber
 from utils.cleaner_groq import TranscriptCleaner
 from utils.config import get_groq_api_key
+from utils.console import write_json_report
 
 
 def test_database_connection():
@@ -36,8 +38,10 @@ def test_database_connection():
         print("\n[1.2] Initializing PostgreSQL schema...")
         schema_path = Path(__file__).parent.parent / "sql" / "schema.sql"
         if schema_path.exists():
-            db.execute_sql_file(str(schema_path))
-            print("✓ PostgreSQL schema initialized")
+            if db.execute_sql_file(str(schema_path), skip_if_unchanged=True):
+                print("✓ PostgreSQL schema initialized")
+            else:
+                print("✓ PostgreSQL schema already up to date")
         else:
             print("⚠️  Schema file not found, skipping schema initialization")
         
@@ -51,27 +55,49 @@ def test_database_connection():
         return False
 
 
-def find_downloaded_audio_files(data_dir: str = "data/audio") -> list:
-    """Find all audio files in the data directory."""
+# Supported audio formats (a tuple, so str.endswith can check them all at once)
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.m4a', '.flac', '.ogg')
+
+
+def _is_temp_name(name: str) -> bool:
+    return 'temp' in name or '_downloaded.tmp' in name
+
+
+def _walk_audio_files(root: str):
+    """Yield DirEntry objects for audio files under root, skipping temp files and temp directories."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if _is_temp_name(entry.name):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_audio_files(entry.path)
+            elif entry.name.endswith(AUDIO_EXTENSIONS) and entry.is_file():
+                yield entry
+
+
+def find_downloaded_audio_files(data_dir: str = "data/audio", sort: bool = True) -> list:
+    """
+    Find all audio files in the data directory and its subdirectories.
+    
+    One os.scandir walk finds every file once; directory entries already carry
+    their type, so no per-file stat() is needed to tell files from directories.
+    
+    Args:
+        data_dir: Directory to search
+        sort: Return paths sorted (set False when order doesn't matter)
+        
+    Returns:
+        List of Path objects
+    """
     audio_dir = Path(data_dir)
     
     if not audio_dir.exists():
         print(f"⚠️  Audio directory not found: {audio_dir}")
         return []
     
-    # Supported audio formats
-    audio_extensions = ['.wav', '.mp3', '.m4a', '.flac', '.ogg']
+    audio_files = [Path(entry.path) for entry in _walk_audio_files(str(audio_dir))]
     
-    audio_files = []
-    for ext in audio_extensions:
-        audio_files.extend(audio_dir.glob(f"*{ext}"))
-        # Also check subdirectories
-        audio_files.extend(audio_dir.rglob(f"*{ext}"))
-    
-    # Filter out temp files
-    audio_files = [f for f in audio_files if 'temp' not in str(f) and '_downloaded.tmp' not in str(f)]
-    
-    return sorted(audio_files)
+    return sorted(audio_files) if sort else audio_files
 
 
 def get_episodes_in_database(db: PostgresDB) -> dict:
@@ -202,40 +228,31 @@ def test_add_missing_to_database(missing_files: list):
         
         print(f"\n[3.1] Adding {len(missing_files)} episode(s) to database...")
         
-        added_episodes = []
+        # One batched INSERT ... RETURNING for all files instead of a round trip per file
+        rows = [
+            {
+                'title': item['title'],
+                'feed_url': None,  # Unknown feed URL
+                'episode_url': None,  # Unknown episode URL
+                'audio_file_path': item['file_path'],
+                'file_size_bytes': item['file_size_bytes'],
+                'status': 'downloaded',
+                'podcast_feed_name': item['feed_name'],
+                'podcast_category': item['category']
+            }
+            for item in missing_files
+        ]
         
-        for idx, item in enumerate(missing_files, 1):
-            print(f"\n[{idx}/{len(missing_files)}] Adding: {item['filename']}")
-            print("-" * 70)
-            
-            try:
-                # Add episode to database
-                episode_id = db.save_podcast(
-                    title=item['title'],
-                    description=None,
-                    feed_url=None,  # Unknown feed URL
-                    episode_url=None,  # Unknown episode URL
-                    published_at=None,
-                    duration_seconds=None,
-                    audio_file_path=item['file_path'],
-                    file_size_bytes=item['file_size_bytes'],
-                    status='downloaded',
-                    transcript=None,
-                    summary=None,
-                    podcast_feed_name=item['feed_name'],
-                    podcast_category=item['category']
-                )
-                
-                print(f"✓ Added to database (ID: {episode_id})")
-                
-                # Get the episode back
-                episode = db.get_episode_by_id(episode_id)
-                added_episodes.append(episode)
-                
-            except Exception as e:
-                print(f"✗ Failed to add: {e}")
-                import traceback
-                traceback.print_exc()
+        added_episodes = []
+        try:
+            # The saved rows come back with the insert, so no re-read is needed
+            added_episodes = db.save_podcasts_bulk(rows, return_episodes=True)
+            for item, episode in zip(missing_files, added_episodes):
+                print(f"✓ Added {item['filename']} (ID: {episode['id']})")
+        except Exception as e:
+            print(f"✗ Failed to add episodes: {e}")
+            import traceback
+            traceback.print_exc()
         
         db.close()
         
@@ -579,8 +596,7 @@ def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = output_dir / f"process_all_downloads_{timestamp}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        write_json_report(output_file, results)
         
         print(f"\nResults saved to: {output_file}")
         print("\n✅ Process all downloads working!")
@@ -2,8 +2,8 @@
 Test Groq Whisper Large V3 Turbo speech-to-text transcription.
 """
 
-import json
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.database import P3Database
 from utils.config import get_groq_api_key
 from utils.transcriber_groq import AudioTranscriber
+from utils.console import write_json_report
 
 
 def test_stt():
@@ -122,9 +123,10 @@ def test_stt():
     
     # Calculate summary
     total_tests = len(results['tests'])
-    passed_tests = sum(1 for t in results['tests'] if t['status'] == 'passed')
-    failed_tests = sum(1 for t in results['tests'] if t['status'] == 'failed')
-    skipped_tests = sum(1 for t in results['tests'] if t['status'] == 'skipped')
+    status_counts = Counter(t['status'] for t in results['tests'])
+    passed_tests = status_counts['passed']
+    failed_tests = status_counts['failed']
+    skipped_tests = status_counts['skipped']
     
     results['summary'] = {
         'total': total_tests,
@@ -140,8 +142,7 @@ def test_stt():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = output_dir / f"stt_test_{timestamp}.json"
     
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    write_json_report(output_file, results)
     
     print()
     print("=" * 60)
@@ -3,13 +3,14 @@ Test utils module functionality
 Tests for processing and download utilities extracted from Streamlit pages
 """
 
-import json
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from utils.database import P3Database
 from utils.processing import process_all_episodes, transcribe_episode, summarize_episode
 from utils.download import load_feeds_config, download_feeds
 from utils.config import get_api_key
+from utils.console import write_json_report
 
 
 def test_utils():
@@ -180,10 +181,11 @@ def test_utils():
         
         # Calculate summary
         total_tests = len(results["tests"])
-        passed_tests = sum(1 for t in results["tests"] if t["status"] == "passed")
-        failed_tests = sum(1 for t in results["tests"] if t["status"] == "failed")
-        skipped_tests = sum(1 for t in results["tests"] if t["status"] == "skipped")
-        warning_tests = sum(1 for t in results["tests"] if t["status"] == "warning")
+        status_counts = Counter(t["status"] for t in results["tests"])
+        passed_tests = status_counts["passed"]
+        failed_tests = status_counts["failed"]
+        skipped_tests = status_counts["skipped"]
+        warning_tests = status_counts["warning"]
         
         results["summary"] = {
             "total": total_tests,
@@ -203,8 +205,7 @@ def test_utils():
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = output_dir / f"utils_test_{timestamp}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    write_json_report(output_file, results)
     
     print(f"Utils test results saved to {output_file}")
     print(f"Summary: {results.get('summary', {})}")
@@ -16,7 +16,7 @@ from .download import download_feeds, load_feeds_config
 # Note: db_util functions removed - they depend on DuckDB P3Database
 from .audio import check_ffmpeg_installed, normalize_audio
 from .batch_download import batch_download_one_per_feed
-from .batch_process import batch_transcribe_downloaded, batch_summarize_transcribed, batch_process_all
+from .batch_process import batch_transcribe_downloaded, batch_summarize_transcribed, batch_transcribe_and_summarize, batch_process_all
 from .topic_analysis_groq import analyze_podcast_topics
 
 __version__ = "0.1.0"
@@ -43,6 +43,7 @@ __all__ = [
     'batch_download_one_per_feed',
     'batch_transcribe_downloaded',
     'batch_summarize_transcribed',
+    'batch_transcribe_and_summarize',
     'batch_process_all',
     # Topic analysis
     'analyze_podcast_topics'
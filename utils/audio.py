@@ -4,17 +4,28 @@ Checks for ffmpeg and provides audio processing functions.
 """
 
 import subprocess
+import wave
 from pathlib import Path
 from typing import Optional, Tuple
 
+# Version line from the first successful ffmpeg check; later checks reuse it instead of forking again
+_ffmpeg_version: Optional[str] = None
+
 
 def check_ffmpeg_installed() -> Tuple[bool, Optional[str]]:
     """
     Check if ffmpeg is installed and available.
     
+    A successful check is cached for the life of the process; failures are
+    re-checked on the next call so installing ffmpeg is picked up.
+    
     Returns:
         Tuple of (is_installed: bool, version: Optional[str])
     """
+    global _ffmpeg_version
+    if _ffmpeg_version is not None:
+        return True, _ffmpeg_version
+    
     try:
         result = subprocess.run(
             ['ffmpeg', '-version'],
@@ -25,6 +36,7 @@ def check_ffmpeg_installed() -> Tuple[bool, Optional[str]]:
         if result.returncode == 0:
             # Extract version from first line
             version_line = result.stdout.split('\n')[0]
+            _ffmpeg_version = version_line
             return True, version_line
         return False, None
     except FileNotFoundError:
@@ -73,3 +85,45 @@ def normalize_audio(input_path: Path, output_path: Path, sample_rate: int = 1600
     except Exception:
         return False
 
+
+def load_audio(audio_path: Path, sample_rate: int = 16000):
+    """
+    Decode an audio file to a mono float32 numpy array in [-1, 1].
+    
+    WAV files already at the target rate (as written by the downloader: mono,
+    16-bit PCM) are read directly without spawning ffmpeg; anything else is
+    decoded and resampled through an ffmpeg pipe.
+    
+    Args:
+        audio_path: Path to audio file
+        sample_rate: Target sample rate (default: 16000 for Whisper)
+        
+    Returns:
+        numpy float32 array, or None if decoding failed
+    """
+    import numpy as np
+    
+    try:
+        with wave.open(str(audio_path), 'rb') as wav:
+            if (wav.getframerate() == sample_rate and wav.getnchannels() == 1
+                    and wav.getsampwidth() == 2 and wav.getcomptype() == 'NONE'):
+                pcm = wav.readframes(wav.getnframes())
+                return np.frombuffer(pcm, np.int16).astype(np.float32) * (1 / 32768.0)
+    except (wave.Error, EOFError, OSError):
+        pass  # Not a plain PCM WAV; decode with ffmpeg below
+    
+    try:
+        cmd = [
+            'ffmpeg', '-nostdin', '-loglevel', 'error',
+            '-i', str(audio_path),
+            '-f', 's16le',  # raw PCM 16-bit little-endian
+            '-ac', '1',  # mono
+            '-ar', str(sample_rate),  # sample rate
+            '-'
+        ]
+        result = subprocess.run(cmd, capture_output=True, timeout=600)
+        if result.returncode != 0:
+            return None
+        return np.frombuffer(result.stdout, np.int16).astype(np.float32) * (1 / 32768.0)
+    except Exception:
+        return None
@@ -9,6 +9,20 @@ from pathlib import Path
 from typing import List, Tuple, Optional
 from utils.audio import check_ffmpeg_installed
 
+# Optional mutagen for reading duration from audio headers without spawning ffprobe
+try:
+    import mutagen
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
+# Optional PyAV (libav bindings) for probing formats mutagen can't read, still in-process
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
 
 def create_slug(text: str, max_length: int = 100) -> str:
     """
@@ -48,7 +62,9 @@ MAX_CHUNK_DURATION_SECONDS_LARGE = 30 * 60  # 30 minutes for large files
 
 def get_audio_duration(audio_path: Path) -> Optional[float]:
     """
-    Get audio file duration in seconds using ffprobe.
+    Get audio file duration in seconds.
+    Reads the audio header in-process with mutagen or PyAV when available,
+    falling back to an ffprobe subprocess.
     
     Args:
         audio_path: Path to audio file
@@ -56,6 +72,22 @@ def get_audio_duration(audio_path: Path) -> Optional[float]:
     Returns:
         Duration in seconds, or None if error
     """
+    if MUTAGEN_AVAILABLE:
+        try:
+            audio = mutagen.File(str(audio_path))
+            if audio is not None and audio.info and audio.info.length:
+                return float(audio.info.length)
+        except Exception:
+            pass
+    
+    if AV_AVAILABLE:
+        try:
+            with av.open(str(audio_path)) as container:
+                if container.duration:
+                    return container.duration / av.time_base
+        except Exception:
+            pass
+    
     if not check_ffmpeg_installed()[0]:
         return None
     
@@ -86,17 +86,11 @@ def batch_download_one_per_feed(
                 count = downloader.process_feed(feed_url)
                 
                 # Get the downloaded episode info for this podcast
-                # Find episodes by feed_url (PostgreSQL doesn't have podcast_id)
-                episodes = db.get_episodes_by_status('downloaded')
-                feed_episodes = [
-                    ep for ep in episodes 
-                    if ep.get('feed_url') == feed_url
-                ]
+                # Look it up by feed_url (PostgreSQL doesn't have podcast_id)
+                latest_episode = db.get_latest_episode_by_feed_url(feed_url, status='downloaded')
                 
                 episode_info = None
-                if feed_episodes:
-                    # Get the most recently created episode for this feed
-                    latest_episode = feed_episodes[0]  # Already sorted by date DESC
+                if latest_episode:
                     episode_info = {
                         'id': latest_episode['id'],
                         'title': latest_episode['title'],
@@ -4,18 +4,275 @@ Transcribes all downloaded episodes (focus on transcription for demo).
 Uses PostgreSQL and skips already completed steps.
 """
 
-from typing import Dict, List, Optional, Tuple
+import asyncio
+from functools import partial
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from utils.postgres_db import PostgresDB
 from utils.processing import transcribe_episode, summarize_episode
 from utils.transcriber_groq import AudioTranscriber
 from utils.cleaner_groq import TranscriptCleaner
-from utils.config import get_groq_api_key
+from utils.config import get_groq_api_key, get_groq_concurrency, get_groq_max_rps
+
+# Episodes transcribed/summarized at once (GROQ_CONCURRENCY); keeps the burst within Groq's rate limits
+MAX_CONCURRENT_EPISODES = get_groq_concurrency()
+
+
+class _RequestPacer:
+    """Space out episode starts to at most GROQ_MAX_RPS per second (no-op when unset)."""
+    
+    def __init__(self, requests_per_second: Optional[float] = None):
+        self._interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_start = 0.0
+    
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        # Runs on the event loop thread only, so reserving a slot needs no lock
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+async def _gather_bounded(worker: Callable[[Dict], Any], episodes: List[Dict], limit: int) -> List[Any]:
+    """Run a blocking worker over episodes in threads, at most `limit` at a time."""
+    semaphore = asyncio.Semaphore(limit)
+    pacer = _RequestPacer(get_groq_max_rps())
+    
+    async def run_one(episode: Dict):
+        async with semaphore:
+            await pacer.wait()
+            return await asyncio.to_thread(worker, episode)
+    
+    return await asyncio.gather(*(run_one(episode) for episode in episodes), return_exceptions=True)
+
+
+def _run_episodes_concurrently(worker: Callable[[Dict], Any], episodes: List[Dict],
+                               max_concurrency: int = MAX_CONCURRENT_EPISODES) -> List[Any]:
+    """
+    Run worker(episode) for every episode concurrently.
+    
+    The episodes are independent Groq round trips, so overlapping them makes the
+    batch take roughly as long as its slowest episodes instead of the sum of all.
+    
+    Returns:
+        One result per episode, in input order; an exception raised by the
+        worker is returned in place of its result
+    """
+    return asyncio.run(_gather_bounded(worker, episodes, max_concurrency))
+
+
+def _new_transcription_results() -> Dict[str, Any]:
+    return {
+        'total_transcribed': 0,
+        'total_skipped': 0,
+        'total_failed': 0,
+        'episode_results': []
+    }
+
+
+def _new_summarization_results() -> Dict[str, Any]:
+    return {
+        'total_summarized': 0,
+        'total_skipped': 0,
+        'total_failed': 0,
+        'episode_results': []
+    }
+
+
+def _select_for_transcription(db: PostgresDB, episode_ids: Optional[List[int]], results: Dict) -> List[Dict]:
+    """Pick the downloaded episodes whose audio file exists, counting the rest as skipped."""
+    episodes_to_process = []
+    if episode_ids:
+        # One query for all requested episodes instead of one per ID
+        episodes_by_id = {episode['id']: episode for episode in db.get_episodes_by_ids(episode_ids)}
+        for ep_id in episode_ids:
+            episode = episodes_by_id.get(ep_id)
+            if episode:
+                # Check if already transcribed or processed
+                if episode.get('status') == 'transcribed' or episode.get('status') == 'processed':
+                    print(f"    ⏭️  Skipping episode {ep_id}: already transcribed (status: {episode.get('status')})")
+                    results['total_skipped'] += 1
+                    continue
+                # Check if file exists
+                file_path = episode.get('audio_file_path') or episode.get('file_path')
+                if not file_path or not Path(file_path).exists():
+                    print(f"    ⚠️  Skipping episode {ep_id}: file not found ({file_path})")
+                    results['total_skipped'] += 1
+                    continue
+                # Only process if status is 'downloaded'
+                if episode.get('status') == 'downloaded':
+                    episodes_to_process.append(episode)
+                else:
+                    print(f"    ⚠️  Skipping episode {ep_id}: status is '{episode.get('status')}' (not 'downloaded')")
+                    results['total_skipped'] += 1
+    else:
+        # Stream the candidates with an audio path (filtered in SQL); rows whose file is gone are never kept
+        for episode in db.iter_episodes_by_status('downloaded', with_audio_only=True):
+            # Check if file exists
+            file_path = episode.get('audio_file_path') or episode.get('file_path')
+            if file_path and Path(file_path).exists():
+                episodes_to_process.append(episode)
+            else:
+                print(f"    ⚠️  Skipping episode {episode['id']}: file not found")
+                results['total_skipped'] += 1
+    return episodes_to_process
+
+
+def _select_for_summary(db: PostgresDB, episode_ids: Optional[List[int]], results: Dict) -> List[Dict]:
+    """Pick the transcribed episodes (and processed ones missing a summary), counting the rest as skipped."""
+    episodes_to_process = []
+    if episode_ids:
+        episodes_by_id = {episode['id']: episode for episode in db.get_episodes_by_ids(episode_ids)}
+        for ep_id in episode_ids:
+            episode = episodes_by_id.get(ep_id)
+            if episode:
+                # Check if already processed
+                if episode.get('status') == 'processed':
+                    if episode.get('summary'):
+                        print(f"    ⏭️  Skipping episode {ep_id}: already processed")
+                        results['total_skipped'] += 1
+                        continue
+                # Only process if status is 'transcribed' or 'processed' (but no summary)
+                if episode.get('status') == 'transcribed' or (episode.get('status') == 'processed' and not episode.get('summary')):
+                    episodes_to_process.append(episode)
+                else:
+                    print(f"    ⚠️  Skipping episode {ep_id}: status is '{episode.get('status')}' (not 'transcribed')")
+                    results['total_skipped'] += 1
+    else:
+        all_transcribed = db.get_episodes_by_status('transcribed')
+        for episode in all_transcribed:
+            episodes_to_process.append(episode)
+        # Also check for processed episodes without summaries
+        all_processed = db.get_episodes_by_status('processed')
+        for episode in all_processed:
+            if not episode.get('summary'):
+                episodes_to_process.append(episode)
+    return episodes_to_process
+
+
+def _transcribe_one(db: PostgresDB, episode: Dict) -> Tuple[bool, Optional[str]]:
+    episode_id = episode['id']
+    print(f"  Transcribing: {episode.get('title', f'Episode {episode_id}')[:60]}...")
+    return transcribe_episode(episode_id, db)
+
+
+def _summarize_one(db: PostgresDB, episode: Dict) -> Optional[Tuple]:
+    """Summarize an episode; returns None if it was processed in the meantime."""
+    episode_id = episode['id']
+    
+    # Double-check if already processed (race condition check)
+    episode_check = db.get_episode_by_id(episode_id)
+    if episode_check.get('status') == 'processed' and episode_check.get('summary'):
+        return None
+    
+    print(f"  Summarizing: {episode.get('title', f'Episode {episode_id}')[:60]}...")
+    return summarize_episode(episode_id, db)
+
+
+def _record_transcription(results: Dict, episode: Dict, outcome: Any) -> bool:
+    """Add one transcription outcome to results; returns True if the episode was transcribed."""
+    episode_id = episode['id']
+    episode_title = episode.get('title', f'Episode {episode_id}')
+    
+    if isinstance(outcome, Exception):
+        results['total_failed'] += 1
+        results['episode_results'].append({
+            'episode_id': episode_id,
+            'title': episode_title,
+            'status': 'failed',
+            'error': str(outcome)
+        })
+        print(f"    ✗ Error: {episode_title[:60]} - {str(outcome)}")
+        return False
+    
+    success, error = outcome
+    if success:
+        results['total_transcribed'] += 1
+        results['episode_results'].append({
+            'episode_id': episode_id,
+            'title': episode_title,
+            'status': 'transcribed',
+            'error': None
+        })
+        print(f"    ✓ Transcribed: {episode_title[:60]}")
+        return True
+    
+    results['total_failed'] += 1
+    results['episode_results'].append({
+        'episode_id': episode_id,
+        'title': episode_title,
+        'status': 'failed',
+        'error': error or 'Unknown error'
+    })
+    print(f"    ✗ Failed: {episode_title[:60]} - {error}")
+    return False
+
+
+def _record_summary(results: Dict, episode: Dict, outcome: Any) -> None:
+    """Add one summarization outcome (None meaning skipped) to results."""
+    episode_id = episode['id']
+    episode_title = episode.get('title', f'Episode {episode_id}')
+    
+    if outcome is None:
+        print(f"    ⏭️  Skipping episode {episode_id}: already processed")
+        results['total_skipped'] += 1
+        return
+    
+    if isinstance(outcome, Exception):
+        results['total_failed'] += 1
+        results['episode_results'].append({
+            'episode_id': episode_id,
+            'title': episode_title,
+            'status': 'failed',
+            'error': str(outcome)
+        })
+        print(f"    ✗ Error: {episode_title[:60]} - {str(outcome)}")
+        return
+    
+    success, error, summary = outcome
+    if success:
+        results['total_summarized'] += 1
+        results['episode_results'].append({
+            'episode_id': episode_id,
+            'title': episode_title,
+            'status': 'summarized',
+            'error': None,
+            'summary': summary
+        })
+        print(f"    ✓ Summarized: {episode_title[:60]}")
+    else:
+        results['total_failed'] += 1
+        results['episode_results'].append({
+            'episode_id': episode_id,
+            'title': episode_title,
+            'status': 'failed',
+            'error': error or 'Unknown error'
+        })
+        print(f"    ✗ Failed: {episode_title[:60]} - {error}")
+
+
+def _print_transcription_totals(results: Dict) -> None:
+    print(f"\n✅ Batch transcription complete:")
+    print(f"   Transcribed: {results['total_transcribed']}")
+    print(f"   Skipped: {results['total_skipped']}")
+    print(f"   Failed: {results['total_failed']}")
+
+
+def _print_summarization_totals(results: Dict) -> None:
+    print(f"\n✅ Batch summarization complete:")
+    print(f"   Summarized: {results['total_summarized']}")
+    print(f"   Skipped: {results['total_skipped']}")
+    print(f"   Failed: {results['total_failed']}")
 
 
 def batch_transcribe_downloaded(
     db: Optional[PostgresDB] = None,
-    episode_ids: Optional[List[int]] = None
+    episode_ids: Optional[List[int]] = None,
+    max_concurrency: int = MAX_CONCURRENT_EPISODES
 ) -> Dict[str, any]:
     """
     Transcribe all downloaded episodes (or specific episode IDs).
@@ -25,7 +282,8 @@ def batch_transcribe_downloaded(
         db: Database instance (creates new if not provided)
         episode_ids: Optional list of specific episode IDs to transcribe.
                      If None, transcribes all episodes with 'downloaded' status.
-        
+        max_concurrency: Episodes transcribed at the same time
+    
     Returns:
         Dictionary with processing results: {
             'total_transcribed': int,
@@ -40,48 +298,10 @@ def batch_transcribe_downloaded(
     else:
         should_close = False
     
-    results = {
-        'total_transcribed': 0,
-        'total_skipped': 0,
-        'total_failed': 0,
-        'episode_results': []
-    }
+    results = _new_transcription_results()
     
     try:
-        # Get episodes to process
-        if episode_ids:
-            episodes_to_process = []
-            for ep_id in episode_ids:
-                episode = db.get_episode_by_id(ep_id)
-                if episode:
-                    # Check if already transcribed or processed
-                    if episode.get('status') == 'transcribed' or episode.get('status') == 'processed':
-                        print(f"    ⏭️  Skipping episode {ep_id}: already transcribed (status: {episode.get('status')})")
-                        results['total_skipped'] += 1
-                        continue
-                    # Check if file exists
-                    file_path = episode.get('audio_file_path') or episode.get('file_path')
-                    if not file_path or not Path(file_path).exists():
-                        print(f"    ⚠️  Skipping episode {ep_id}: file not found ({file_path})")
-                        results['total_skipped'] += 1
-                        continue
-                    # Only process if status is 'downloaded'
-                    if episode.get('status') == 'downloaded':
-                        episodes_to_process.append(episode)
-                    else:
-                        print(f"    ⚠️  Skipping episode {ep_id}: status is '{episode.get('status')}' (not 'downloaded')")
-                        results['total_skipped'] += 1
-        else:
-            all_downloaded = db.get_episodes_by_status('downloaded')
-            episodes_to_process = []
-            for episode in all_downloaded:
-                # Check if file exists
-                file_path = episode.get('audio_file_path') or episode.get('file_path')
-                if file_path and Path(file_path).exists():
-                    episodes_to_process.append(episode)
-                else:
-                    print(f"    ⚠️  Skipping episode {episode['id']}: file not found")
-                    results['total_skipped'] += 1
+        episodes_to_process = _select_for_transcription(db, episode_ids, results)
         
         if not episodes_to_process:
             results['message'] = "No downloaded episodes to transcribe"
@@ -97,52 +317,15 @@ def batch_transcribe_downloaded(
             results['error'] = f"Failed to initialize transcriber: {str(e)}"
             return results
         
-        # Process each episode
-        for episode in episodes_to_process:
-            episode_id = episode['id']
-            episode_title = episode.get('title', f'Episode {episode_id}')
-            
-            print(f"  Transcribing: {episode_title[:60]}...")
-            
-            try:
-                success, error = transcribe_episode(episode_id, db)
-                
-                if success:
-                    results['total_transcribed'] += 1
-                    results['episode_results'].append({
-                        'episode_id': episode_id,
-                        'title': episode_title,
-                        'status': 'transcribed',
-                        'error': None
-                    })
-                    print(f"    ✓ Transcribed: {episode_title[:60]}")
-                else:
-                    results['total_failed'] += 1
-                    results['episode_results'].append({
-                        'episode_id': episode_id,
-                        'title': episode_title,
-                        'status': 'failed',
-                        'error': error or 'Unknown error'
-                    })
-                    print(f"    ✗ Failed: {episode_title[:60]} - {error}")
-                    
-            except Exception as e:
-                results['total_failed'] += 1
-                results['episode_results'].append({
-                    'episode_id': episode_id,
-                    'title': episode_title,
-                    'status': 'failed',
-                    'error': str(e)
-                })
-                print(f"    ✗ Error: {episode_title[:60]} - {str(e)}")
+        # Transcribe episodes concurrently, then record the outcomes in order
+        outcomes = _run_episodes_concurrently(partial(_transcribe_one, db), episodes_to_process, max_concurrency)
+        for episode, outcome in zip(episodes_to_process, outcomes):
+            _record_transcription(results, episode, outcome)
         
-        print(f"\n✅ Batch transcription complete:")
-        print(f"   Transcribed: {results['total_transcribed']}")
-        print(f"   Skipped: {results['total_skipped']}")
-        print(f"   Failed: {results['total_failed']}")
+        _print_transcription_totals(results)
         
         return results
-        
+    
     finally:
         if should_close and db:
             db.close()
@@ -150,7 +333,8 @@ def batch_transcribe_downloaded(
 
 def batch_summarize_transcribed(
     db: Optional[PostgresDB] = None,
-    episode_ids: Optional[List[int]] = None
+    episode_ids: Optional[List[int]] = None,
+    max_concurrency: int = MAX_CONCURRENT_EPISODES
 ) -> Dict[str, any]:
     """
     Summarize all transcribed episodes (or specific episode IDs).
@@ -160,7 +344,8 @@ def batch_summarize_transcribed(
         db: Database instance (creates new if not provided)
         episode_ids: Optional list of specific episode IDs to summarize.
                      If None, summarizes all episodes with 'transcribed' status.
-        
+        max_concurrency: Episodes summarized at the same time
+    
     Returns:
         Dictionary with processing results: {
             'total_summarized': int,
@@ -175,42 +360,10 @@ def batch_summarize_transcribed(
     else:
         should_close = False
     
-    results = {
-        'total_summarized': 0,
-        'total_skipped': 0,
-        'total_failed': 0,
-        'episode_results': []
-    }
+    results = _new_summarization_results()
     
     try:
-        # Get episodes to process
-        if episode_ids:
-            episodes_to_process = []
-            for ep_id in episode_ids:
-                episode = db.get_episode_by_id(ep_id)
-                if episode:
-                    # Check if already processed
-                    if episode.get('status') == 'processed':
-                        if episode.get('summary'):
-                            print(f"    ⏭️  Skipping episode {ep_id}: already processed")
-                            results['total_skipped'] += 1
-                            continue
-                    # Only process if status is 'transcribed' or 'processed' (but no summary)
-                    if episode.get('status') == 'transcribed' or (episode.get('status') == 'processed' and not episode.get('summary')):
-                        episodes_to_process.append(episode)
-                    else:
-                        print(f"    ⚠️  Skipping episode {ep_id}: status is '{episode.get('status')}' (not 'transcribed')")
-                        results['total_skipped'] += 1
-        else:
-            all_transcribed = db.get_episodes_by_status('transcribed')
-            episodes_to_process = []
-            for episode in all_transcribed:
-                episodes_to_process.append(episode)
-            # Also check for processed episodes without summaries
-            all_processed = db.get_episodes_by_status('processed')
-            for episode in all_processed:
-                if not episode.get('summary'):
-                    episodes_to_process.append(episode)
+        episodes_to_process = _select_for_summary(db, episode_ids, results)
         
         if not episodes_to_process:
             results['message'] = "No transcribed episodes to summarize"
@@ -218,60 +371,117 @@ def batch_summarize_transcribed(
         
         print(f"🧠 Batch summarizing {len(episodes_to_process)} episode(s)...")
         
-        # Process each episode
-        for episode in episodes_to_process:
-            episode_id = episode['id']
-            episode_title = episode.get('title', f'Episode {episode_id}')
-            
-            # Double-check if already processed (race condition check)
-            episode_check = db.get_episode_by_id(episode_id)
-            if episode_check.get('status') == 'processed' and episode_check.get('summary'):
-                print(f"    ⏭️  Skipping episode {episode_id}: already processed")
-                results['total_skipped'] += 1
-                continue
-            
-            print(f"  Summarizing: {episode_title[:60]}...")
-            
+        # Summarize episodes concurrently, then record the outcomes in order
+        outcomes = _run_episodes_concurrently(partial(_summarize_one, db), episodes_to_process, max_concurrency)
+        for episode, outcome in zip(episodes_to_process, outcomes):
+            _record_summary(results, episode, outcome)
+        
+        _print_summarization_totals(results)
+        
+        return results
+    
+    finally:
+        if should_close and db:
+            db.close()
+
+
+async def _stream_transcribe_summarize(db: PostgresDB, episodes: List[Dict],
+                                       transcription_results: Dict, summarization_results: Dict,
+                                       max_concurrency: int = MAX_CONCURRENT_EPISODES) -> None:
+    """
+    Transcribe episodes and hand each one to a summarizer as soon as it is done.
+    
+    Transcriptions run up to max_concurrency at a time and put finished
+    episodes on a queue; the same number of consumers summarize from it, so
+    summaries start while later episodes are still transcribing.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pacer = _RequestPacer(get_groq_max_rps())
+    
+    async def transcribe(episode: Dict):
+        async with semaphore:
+            await pacer.wait()
             try:
-                success, error, summary = summarize_episode(episode_id, db)
-                
-                if success:
-                    results['total_summarized'] += 1
-                    results['episode_results'].append({
-                        'episode_id': episode_id,
-                        'title': episode_title,
-                        'status': 'summarized',
-                        'error': None,
-                        'summary': summary
-                    })
-                    print(f"    ✓ Summarized: {episode_title[:60]}")
-                else:
-                    results['total_failed'] += 1
-                    results['episode_results'].append({
-                        'episode_id': episode_id,
-                        'title': episode_title,
-                        'status': 'failed',
-                        'error': error or 'Unknown error'
-                    })
-                    print(f"    ✗ Failed: {episode_title[:60]} - {error}")
-                    
+                outcome = await asyncio.to_thread(_transcribe_one, db, episode)
+            except Exception as e:
+                outcome = e
+        if _record_transcription(transcription_results, episode, outcome):
+            await queue.put(episode)
+    
+    async def producer():
+        await asyncio.gather(*(transcribe(episode) for episode in episodes))
+        for _ in range(max_concurrency):
+            await queue.put(None)
+    
+    async def consumer():
+        while (episode := await queue.get()) is not None:
+            await pacer.wait()
+            try:
+                outcome = await asyncio.to_thread(_summarize_one, db, episode)
             except Exception as e:
-                results['total_failed'] += 1
-                results['episode_results'].append({
-                    'episode_id': episode_id,
-                    'title': episode_title,
-                    'status': 'failed',
-                    'error': str(e)
-                })
-                print(f"    ✗ Error: {episode_title[:60]} - {str(e)}")
+                outcome = e
+            _record_summary(summarization_results, episode, outcome)
+    
+    await asyncio.gather(producer(), *(consumer() for _ in range(max_concurrency)))
+
+
+def batch_transcribe_and_summarize(
+    db: Optional[PostgresDB] = None,
+    episode_ids: Optional[List[int]] = None,
+    max_concurrency: int = MAX_CONCURRENT_EPISODES
+) -> Tuple[Dict[str, any], Dict[str, any]]:
+    """
+    Transcribe downloaded episodes and summarize each one as soon as its transcript is saved.
+    
+    Same selection and skipping rules as batch_transcribe_downloaded, without the
+    barrier of waiting for every transcription before the first summary starts.
+    
+    Args:
+        db: Database instance (creates new if not provided)
+        episode_ids: Optional list of specific episode IDs to process.
+                     If None, processes all episodes with 'downloaded' status.
+        max_concurrency: Episodes transcribed (and, separately, summarized) at the same time
+    
+    Returns:
+        Tuple of (transcription results, summarization results), shaped like the
+        results of batch_transcribe_downloaded and batch_summarize_transcribed;
+        episode_results are in completion order
+    """
+    if db is None:
+        db = PostgresDB()
+        should_close = True
+    else:
+        should_close = False
+    
+    transcription_results = _new_transcription_results()
+    summarization_results = _new_summarization_results()
+    
+    try:
+        episodes_to_process = _select_for_transcription(db, episode_ids, transcription_results)
         
-        print(f"\n✅ Batch summarization complete:")
-        print(f"   Summarized: {results['total_summarized']}")
-        print(f"   Skipped: {results['total_skipped']}")
-        print(f"   Failed: {results['total_failed']}")
+        if not episodes_to_process:
+            transcription_results['message'] = "No downloaded episodes to transcribe"
+            summarization_results['message'] = "No transcribed episodes to summarize"
+            return transcription_results, summarization_results
         
-        return results
+        print(f"🎙️  Transcribing and summarizing {len(episodes_to_process)} episode(s)...")
         
+        try:
+            get_groq_api_key()
+        except Exception as e:
+            transcription_results['error'] = f"Failed to initialize transcriber: {str(e)}"
+            return transcription_results, summarization_results
+        
+        asyncio.run(_stream_transcribe_summarize(
+            db, episodes_to_process, transcription_results, summarization_results, max_concurrency
+        ))
+        
+        _print_transcription_totals(transcription_results)
+        _print_summarization_totals(summarization_results)
+        
+        return transcription_results, summarization_results
+    
     finally:
         if should_close and db:
             db.close()
@@ -288,7 +498,7 @@ def batch_process_all(
     Args:
         db: Database instance (creates new if not provided)
         audio_format: Audio format for download ('mp3' or 'wav')
-        
+    
     Returns:
         Combined results from download, transcription, and summarization
     """
@@ -304,15 +514,22 @@ def batch_process_all(
         # Step 1: Download (with MP3 conversion)
         download_results = batch_download_one_per_feed(db=db, audio_format=audio_format)
         
-        # Step 2: Transcribe (will skip already transcribed episodes)
-        episode_ids = [ep['id'] for ep in download_results.get('episodes', [])]
-        transcription_results = batch_transcribe_downloaded(db=db, episode_ids=episode_ids)
+        # Step 2: Transcribe, summarizing each episode as soon as it is transcribed
+        # (will skip already transcribed episodes)
+        episode_ids = list(map(itemgetter('id'), download_results.get('episodes', [])))
+        transcription_results, summarization_results = batch_transcribe_and_summarize(
+            db=db, episode_ids=episode_ids
+        )
         
-        # Step 3: Summarize transcribed episodes (will skip already processed episodes)
-        # Get all transcribed episodes, not just from this batch
-        transcribed_episodes = db.get_episodes_by_status('transcribed')
-        transcribed_episode_ids = [ep['id'] for ep in transcribed_episodes]
-        summarization_results = batch_summarize_transcribed(db=db, episode_ids=transcribed_episode_ids)
+        # Step 3: Summarize transcribed episodes left over from earlier runs
+        # (will skip already processed episodes)
+        handled_ids = {result['episode_id'] for result in summarization_results['episode_results']}
+        leftover_ids = [ep_id for ep_id in db.get_episode_ids_by_status('transcribed') if ep_id not in handled_ids]
+        if leftover_ids:
+            leftover_results = batch_summarize_transcribed(db=db, episode_ids=leftover_ids)
+            for key in ('total_summarized', 'total_skipped', 'total_failed'):
+                summarization_results[key] += leftover_results.get(key, 0)
+            summarization_results['episode_results'].extend(leftover_results.get('episode_results', []))
         
         return {
             'download': download_results,
@@ -327,8 +544,7 @@ def batch_process_all(
                 'failed': transcription_results.get('total_failed', 0) + summarization_results.get('total_failed', 0)
             }
         }
-        
+    
     finally:
         if should_close and db:
             db.close()
-
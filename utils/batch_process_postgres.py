@@ -37,7 +37,7 @@ def migrate_duckdb_to_postgres(duckdb: P3Database, postgres: PostgresDB):
     
     print(f"Found {len(unique_episodes)} episodes to migrate")
     
-    migrated_count = 0
+    rows = []
     for episode in unique_episodes:
         try:
             # Get transcript if available
@@ -70,29 +70,30 @@ def migrate_duckdb_to_postgres(duckdb: P3Database, postgres: PostgresDB):
             podcast_name = podcast.get('name') if podcast else None
             podcast_category = podcast.get('category') if podcast else None
             
-            # Save to PostgreSQL
-            podcast_id = postgres.save_podcast(
-                title=episode.get('title', 'Untitled'),
-                description=episode.get('description'),
-                feed_url=episode.get('feed_url'),
-                episode_url=episode.get('url'),
-                published_at=episode.get('published_at'),
-                duration_seconds=episode.get('duration_seconds'),
-                audio_file_path=episode.get('file_path'),
-                file_size_bytes=None,  # Could calculate from file if exists
-                status=episode.get('status', 'downloaded'),
-                transcript=transcript_data,
-                summary=summary_data,
-                podcast_feed_name=podcast_name,
-                podcast_category=podcast_category
-            )
-            
-            migrated_count += 1
-            print(f"  ✓ Migrated: {episode.get('title', 'Untitled')[:60]}")
+            # Queue for the bulk write to PostgreSQL
+            rows.append({
+                'title': episode.get('title', 'Untitled'),
+                'description': episode.get('description'),
+                'feed_url': episode.get('feed_url'),
+                'episode_url': episode.get('url'),
+                'published_at': episode.get('published_at'),
+                'duration_seconds': episode.get('duration_seconds'),
+                'audio_file_path': episode.get('file_path'),
+                'file_size_bytes': None,  # Could calculate from file if exists
+                'status': episode.get('status', 'downloaded'),
+                'transcript': transcript_data,
+                'summary': summary_data,
+                'podcast_feed_name': podcast_name,
+                'podcast_category': podcast_category
+            })
+            print(f"  ✓ Prepared: {episode.get('title', 'Untitled')[:60]}")
             
         except Exception as e:
             print(f"  ✗ Failed to migrate episode {episode.get('id')}: {e}")
     
+    # One COPY-based upsert for all episodes instead of an INSERT per episode
+    migrated_count = postgres.copy_upsert_podcasts(rows)
+    
     print(f"\n✅ Migration complete: {migrated_count}/{len(unique_episodes)} episodes migrated")
     return migrated_count
 
@@ -140,6 +141,8 @@ def process_and_save_to_postgres(
     transcriber = AudioTranscriber(duckdb, api_key=api_key)
     cleaner = TranscriptCleaner(duckdb, api_key=api_key)
     
+    # Processed episodes are written to PostgreSQL together after the loop
+    pending_rows = []
     for episode in episodes_to_process:
         episode_id = episode['id']
         episode_title = episode.get('title', f'Episode {episode_id}')
@@ -207,8 +210,7 @@ def process_and_save_to_postgres(
             else:
                 results['summarized'] += 1
             
-            # Step 3: Save to PostgreSQL
-            print(f"  Saving to PostgreSQL: {episode_title[:60]}...")
+            # Step 3: Queue for PostgreSQL
             
             # Get podcast info
             podcast = duckdb.get_podcast_by_id(episode.get('podcast_id'))
@@ -222,31 +224,41 @@ def process_and_save_to_postgres(
                 if audio_path.exists():
                     file_size_bytes = audio_path.stat().st_size
             
-            postgres_id = postgres.save_podcast(
-                title=episode.get('title', 'Untitled'),
-                description=episode.get('description'),
-                feed_url=episode.get('feed_url'),
-                episode_url=episode.get('url'),
-                published_at=episode.get('published_at'),
-                duration_seconds=episode.get('duration_seconds'),
-                audio_file_path=episode.get('file_path'),
-                file_size_bytes=file_size_bytes,
-                status='processed' if summary else 'transcribed',
-                transcript=transcript_data,
-                summary=summary,
-                podcast_feed_name=podcast_name,
-                podcast_category=podcast_category
-            )
-            
-            results['saved_to_postgres'] += 1
-            print(f"    ✓ Saved to PostgreSQL (ID: {postgres_id})")
+            pending_rows.append({
+                'title': episode.get('title', 'Untitled'),
+                'description': episode.get('description'),
+                'feed_url': episode.get('feed_url'),
+                'episode_url': episode.get('url'),
+                'published_at': episode.get('published_at'),
+                'duration_seconds': episode.get('duration_seconds'),
+                'audio_file_path': episode.get('file_path'),
+                'file_size_bytes': file_size_bytes,
+                'status': 'processed' if summary else 'transcribed',
+                'transcript': transcript_data,
+                'summary': summary,
+                'podcast_feed_name': podcast_name,
+                'podcast_category': podcast_category
+            })
             
+
         except Exception as e:
             print(f"    ✗ Error processing episode {episode_id}: {e}")
             import traceback
             traceback.print_exc()
             results['errors'] += 1
     
+    if pending_rows:
+        print(f"  Saving {len(pending_rows)} episode(s) to PostgreSQL...")
+        try:
+            saved = postgres.copy_upsert_podcasts(pending_rows)
+            results['saved_to_postgres'] += saved
+            print(f"    ✓ Saved {saved} episode(s) to PostgreSQL")
+        except Exception as e:
+            print(f"    ✗ Error saving to PostgreSQL: {e}")
+            import traceback
+            traceback.print_exc()
+            results['errors'] += len(pending_rows)
+    
     print(f"\n✅ Processing complete:")
     print(f"   Transcribed: {results['transcribed']}")
     print(f"   Summarized: {results['summarized']}")
@@ -10,6 +10,7 @@ from langchain_core.output_parsers import JsonOutputParser
 
 from utils.postgres_db import PostgresDB
 from utils.config import get_groq_api_key, get_groq_model, get_groq_temperature, get_groq_max_tokens
+from utils.llm_cache import enable_llm_cache
 
 
 class TranscriptCleaner:
@@ -27,6 +28,11 @@ class TranscriptCleaner:
         self.model = model or get_groq_model()
         self.temperature = get_groq_temperature()
         self.max_tokens = get_groq_max_tokens()
+        # Episode row as written by the last successful generate_summary() call
+        self.last_saved_episode = None
+        
+        # Re-summarizing an unchanged transcript is answered from LLM_CACHE_PATH when set
+        enable_llm_cache()
         
         # Initialize LangChain ChatGroq
         self.llm = ChatGroq(
@@ -105,6 +111,7 @@ Return ONLY valid JSON, no other text."""),
                 # Return existing summary
                 summary = episode.get('summary')
                 if isinstance(summary, dict):
+                    self.last_saved_episode = episode
                     return summary
                 return None
         
@@ -135,8 +142,8 @@ Return ONLY valid JSON, no other text."""),
         
         if summary_data:
             print(f"\n💾 Saving summary to PostgreSQL...")
-            # Store in PostgreSQL
-            self.db.add_summary(
+            # Store in PostgreSQL (also sets status to 'processed')
+            self.last_saved_episode = self.db.add_summary(
                 episode_id=episode_id,
                 key_topics=summary_data.get('key_topics', []),
                 themes=summary_data.get('themes', []),
@@ -146,9 +153,6 @@ Return ONLY valid JSON, no other text."""),
                 digest_date=datetime.now()
             )
             
-            # Update episode status
-            self.db.update_episode_status(episode_id, 'processed')
-            
             total_time = time.time() - summary_start
             print(f"\n✅ Summary generated successfully!")
             print(f"   Processing time: {int(total_time//60)}m{int(total_time%60)}s ({total_time:.1f}s)")
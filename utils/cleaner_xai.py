@@ -1,7 +1,9 @@
 """LLM-based transcript cleaning and summarization using XAI API with LangChain."""
 
+import hashlib
 import json
 import os
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from langchain_openai import ChatOpenAI
@@ -9,10 +11,15 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from utils.database import P3Database
 from utils.config import get_api_key, get_grok_model
+from utils.http_client import get_httpx_client
+
+# Maximum number of in-flight XAI completion requests across all threads
+MAX_CONCURRENT_REQUESTS = 5
+_api_semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
 
 
 class TranscriptCleaner:
-    def __init__(self, db: P3Database, api_key: str = None, model: str = None):
+    def __init__(self, db: P3Database, api_key: str = None, model: str = None, http_client=None):
         """
         Initialize XAI cleaner with LangChain.
         
@@ -20,10 +27,13 @@ class TranscriptCleaner:
             db: Database instance
             api_key: XAI API key (defaults to environment/secrets)
             model: XAI model to use (defaults to GROK_MODEL from .env or grok-2-1212)
+            http_client: httpx.Client to send requests through (defaults to the shared pool)
         """
         self.db = db
         self.api_key = api_key or get_api_key()
         self.model = model or get_grok_model()
+        # Serializes database access when summaries are generated from worker threads
+        self._db_lock = threading.Lock()
         
         # Initialize LangChain ChatOpenAI with XAI
         self.llm = ChatOpenAI(
@@ -31,38 +41,52 @@ class TranscriptCleaner:
             api_key=self.api_key,
             base_url="https://api.x.ai/v1",
             temperature=0.2,
-            max_tokens=4000
+            max_tokens=4000,
+            http_client=http_client or get_httpx_client()
         )
 
     def generate_summary(self, episode_id: int) -> Optional[Dict[str, Any]]:
         """Generate structured summary of an episode."""
         # Get transcript segments
-        segments = self.db.get_transcripts_for_episode(episode_id)
+        with self._db_lock:
+            segments = self.db.get_transcripts_for_episode(episode_id)
         full_text = "\n".join(segment['text'] for segment in segments)
         
         if not full_text.strip():
             return None
         
-        # Generate structured summary using XAI
-        summary_data = self._generate_structured_summary(full_text)
+        # Reuse a previous summary of the same transcript, otherwise call XAI
+        summary_data = self._summary_cache_lookup(full_text)
+        if summary_data is None:
+            summary_data = self._generate_structured_summary(full_text)
         
         if summary_data:
-            # Store in database
-            self.db.add_summary(
-                episode_id=episode_id,
-                key_topics=summary_data.get('key_topics', []),
-                themes=summary_data.get('themes', []),
-                quotes=summary_data.get('quotes', []),
-                startups=summary_data.get('startups', []),
-                full_summary=summary_data.get('summary', ''),
-                digest_date=datetime.now()
-            )
-            
-            # Update episode status
-            self.db.update_episode_status(episode_id, 'processed')
-        
+            with self._db_lock:
+                # Store in database
+                self.db.add_summary(
+                    episode_id=episode_id,
+                    key_topics=summary_data.get('key_topics', []),
+                    themes=summary_data.get('themes', []),
+                    quotes=summary_data.get('quotes', []),
+                    startups=summary_data.get('startups', []),
+                    full_summary=summary_data.get('summary', ''),
+                    digest_date=datetime.now()
+                )
+
+                # Update episode status
+                self.db.update_episode_status(episode_id, 'processed')
+
         return summary_data
 
+    def _transcript_hash(self, text: str) -> str:
+        """Cache key for a transcript: summaries depend on both the model and the text."""
+        return hashlib.sha256(f"{self.model}\n{text}".encode('utf-8')).hexdigest()
+
+    def _summary_cache_lookup(self, text: str) -> Optional[Dict[str, Any]]:
+        """Return a cached summary for this transcript, if one exists."""
+        with self._db_lock:
+            return self.db.get_cached_summary(self._transcript_hash(text))
+
     def _generate_structured_summary(self, text: str) -> Optional[Dict[str, Any]]:
         """Generate structured summary using XAI."""
         prompt = """Analyze this podcast transcript and extract structured information in JSON format:
@@ -92,7 +116,8 @@ Transcript:
                 HumanMessage(content=prompt)
             ]
             
-            response = self.llm.invoke(messages)
+            with _api_semaphore:
+                response = self.llm.invoke(messages)
             content = response.content.strip()
             
             # Extract JSON from response
@@ -100,7 +125,11 @@ Transcript:
             json_end = content.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = content[json_start:json_end]
-                return json.loads(json_str)
+                summary_data = json.loads(json_str)
+                # Only cache real LLM output, never the basic-extraction fallback
+                with self._db_lock:
+                    self.db.save_cached_summary(self._transcript_hash(text), summary_data)
+                return summary_data
             
             return None
             
@@ -4,7 +4,9 @@ Uses python-dotenv to load from .env file.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load .env file if it exists
@@ -12,9 +14,11 @@ env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
+@lru_cache(maxsize=1)
 def get_groq_api_key() -> str:
     """
     Get Groq API key from environment variables (loaded via python-dotenv).
+    The value is cached for the life of the process (get_groq_api_key.cache_clear() to re-read).
     
     Returns:
         str: Groq API key
@@ -34,10 +38,12 @@ def get_groq_api_key() -> str:
     return api_key
 
 
+@lru_cache(maxsize=1)
 def get_groq_model() -> str:
     """
     Get Groq model name from environment variables.
     Defaults to llama-3.3-70b-versatile (largest context window: 131k tokens).
+    Cached like get_groq_api_key().
     
     Returns:
         str: Groq model name (e.g., 'llama-3.3-70b-versatile', 'llama-3.1-8b-instant')
@@ -103,6 +109,50 @@ def get_groq_max_tokens() -> int:
         return 4000
 
 
+def get_groq_concurrency() -> int:
+    """
+    Get how many episodes batch jobs send to Groq at once from environment variables.
+    Defaults to 8.
+    
+    Returns:
+        int: Maximum concurrent episodes (at least 1)
+    """
+    concurrency_str = os.getenv('GROQ_CONCURRENCY', '8')
+    try:
+        return max(1, int(concurrency_str))
+    except ValueError:
+        return 8
+
+
+def get_groq_max_rps() -> Optional[float]:
+    """
+    Get the maximum number of Groq requests batch jobs start per second from environment variables.
+    Unset (the default) means no pacing beyond the concurrency limit.
+    
+    Returns:
+        Optional[float]: Requests per second, or None
+    """
+    rps_str = os.getenv('GROQ_MAX_RPS')
+    if not rps_str:
+        return None
+    try:
+        rps = float(rps_str)
+    except ValueError:
+        return None
+    return rps if rps > 0 else None
+
+
+def get_llm_cache_path() -> Optional[str]:
+    """
+    Get the SQLite file for caching LLM responses from environment variables.
+    Unset (the default) disables the cache, so every call reaches Groq.
+    
+    Returns:
+        Optional[str]: Cache file path (e.g., 'db/llm_cache.sqlite'), or None
+    """
+    return os.getenv('LLM_CACHE_PATH') or None
+
+
 def get_db_url() -> str:
     """
     Get PostgreSQL database URL from environment variables.
@@ -137,6 +187,19 @@ def get_db_schema() -> str:
     return schema
 
 
+def get_db_prepared_statements() -> bool:
+    """
+    Whether to use server-side prepared statements for hot PostgreSQL lookups.
+    Defaults to false; set DB_PREPARED_STATEMENTS=true when connecting directly
+    (or through a session-mode pooler). Transaction-mode poolers such as PgBouncer
+    don't keep session state, so prepared statements break there.
+    
+    Returns:
+        bool: True if prepared statements are enabled
+    """
+    return os.getenv('DB_PREPARED_STATEMENTS', 'false').lower() in ('1', 'true', 'yes')
+
+
 # Backward compatibility aliases
 def get_api_key() -> str:
     """Backward compatibility: returns Groq API key."""
@@ -0,0 +1,94 @@
+"""
+Console output helpers for the command-line test and batch scripts.
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Union
+
+# Optional orjson for faster result serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def buffer_stdout() -> None:
+    """
+    Switch stdout to block buffering when it is not an interactive terminal.
+    
+    When output is piped (CI, Docker log drivers, `| tee`), each print() otherwise
+    costs a write syscall once line buffering or PYTHONUNBUFFERED is in effect.
+    Terminals keep line buffering so progress still shows up live.
+    """
+    if sys.stdout.isatty():
+        return
+    try:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError):
+        # Replaced stream (e.g. StreamlitLogger's StringIO) - nothing to tune
+        pass
+
+
+def write_json_report(output_file: Union[str, Path], results: Any) -> None:
+    """
+    Write a test/batch results dict as indented JSON.
+    
+    Uses orjson when installed (several times faster than json's pure-Python
+    indenting encoder on large reports), otherwise json. Values neither
+    encoder understands are written via str(), as with json's default=str.
+    
+    Args:
+        output_file: Path of the JSON file to write
+        results: JSON-serializable results
+    """
+    if ORJSON_AVAILABLE:
+        Path(output_file).write_bytes(orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        ))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+
+
+class StepLog:
+    """
+    Append-only NDJSON log of pipeline steps, one JSON object per line.
+    
+    Each record is written and flushed as soon as its step finishes, so a long
+    run can be followed with `tail -f` and a crash keeps the steps already done.
+    """
+    
+    def __init__(self, output_file: Union[str, Path]):
+        self.path = Path(output_file)
+        self._file = open(self.path, 'ab')
+    
+    def write(self, step: str, data: Any = None) -> None:
+        """
+        Append one step record.
+        
+        Args:
+            step: Step name (e.g. 'download', 'transcription')
+            data: JSON-serializable step results; other values are written via str()
+        """
+        record = {'step': step, 'timestamp': datetime.now().isoformat(), 'data': data}
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY, default=str)
+        else:
+            line = json.dumps(record, default=str).encode()
+        self._file.write(line + b'\n')
+        self._file.flush()
+    
+    def close(self) -> None:
+        self._file.close()
+    
+    def __enter__(self) -> 'StepLog':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -6,6 +6,9 @@ from typing import Dict, List, Optional, Any
 import duckdb
 from pathlib import Path
 
+# Transcript segments written per multi-row INSERT
+TRANSCRIPT_INSERT_BATCH = 1000
+
 
 class P3Database:
     def __init__(self, db_path: str = "db/opp.duckdb"):
@@ -93,6 +96,14 @@ class P3Database:
             )
         """)
 
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                transcript_hash VARCHAR PRIMARY KEY,  -- sha256 of model + transcript text
+                summary JSON NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
     def add_podcast(self, title: str, rss_url: str, category: str = None) -> int:
         """Add new podcast feed."""
         # Get the next ID first
@@ -159,6 +170,17 @@ class P3Database:
             }
         return None
 
+    def get_episode_ids_by_status(self, status: str) -> List[int]:
+        """Get just the IDs of episodes with a processing status, in get_episodes_by_status order."""
+        results = self.conn.execute("""
+            SELECT e.id
+            FROM episodes e 
+            JOIN podcasts p ON e.podcast_id = p.id 
+            WHERE e.status = ?
+            ORDER BY e.date DESC
+        """, (status,)).fetchall()
+        return [row[0] for row in results]
+
     def get_episodes_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get episodes by processing status."""
         results = self.conn.execute("""
@@ -185,6 +207,32 @@ class P3Database:
             })
         return episodes
 
+    def get_first_episode_by_status(self, status: str) -> Optional[Dict[str, Any]]:
+        """Get the lowest-ID episode with the given processing status."""
+        result = self.conn.execute("""
+            SELECT e.*, p.title as podcast_title 
+            FROM episodes e 
+            JOIN podcasts p ON e.podcast_id = p.id 
+            WHERE e.status = ?
+            ORDER BY e.id
+            LIMIT 1
+        """, (status,)).fetchone()
+        
+        if result:
+            return {
+                "id": result[0],
+                "podcast_id": result[1],
+                "title": result[2],
+                "date": result[3],
+                "url": result[4],
+                "file_path": result[5],
+                "duration_seconds": result[6],
+                "status": result[7],
+                "created_at": result[8],
+                "podcast_title": result[9]
+            }
+        return None
+
     def update_episode_status(self, episode_id: int, status: str):
         """Update episode processing status."""
         self.conn.execute(
@@ -193,19 +241,30 @@ class P3Database:
         )
 
     def add_transcript_segments(self, episode_id: int, segments: List[Dict[str, Any]]):
-        """Add transcript segments for an episode."""
-        for segment in segments:
-            self.conn.execute("""
-                INSERT INTO transcripts (episode_id, speaker, timestamp_start, timestamp_end, text, confidence) 
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+        """
+        Add transcript segments for an episode.
+        
+        Segments are written with multi-row INSERTs of up to
+        TRANSCRIPT_INSERT_BATCH rows, rather than one statement per segment.
+        """
+        rows = [
+            (
                 episode_id,
                 segment.get("speaker"),
                 segment.get("start"),
                 segment.get("end"),
                 segment.get("text"),
                 segment.get("confidence")
-            ))
+            )
+            for segment in segments
+        ]
+        for start in range(0, len(rows), TRANSCRIPT_INSERT_BATCH):
+            batch = rows[start:start + TRANSCRIPT_INSERT_BATCH]
+            placeholders = ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(batch))
+            self.conn.execute(f"""
+                INSERT INTO transcripts (episode_id, speaker, timestamp_start, timestamp_end, text, confidence) 
+                VALUES {placeholders}
+            """, [value for row in batch for value in row])
 
     def get_transcripts_for_episode(self, episode_id: int) -> List[Dict[str, Any]]:
         """Get all transcript segments for an episode."""
@@ -327,6 +386,24 @@ class P3Database:
             return json.loads(result[0])
         return None
 
+    def get_cached_summary(self, transcript_hash: str) -> Optional[Dict[str, Any]]:
+        """Get cached LLM summary for a transcript hash."""
+        import json
+        result = self.conn.execute(
+            "SELECT summary FROM summary_cache WHERE transcript_hash = ?", (transcript_hash,)
+        ).fetchone()
+        if result:
+            return json.loads(result[0])
+        return None
+
+    def save_cached_summary(self, transcript_hash: str, summary: Dict[str, Any]):
+        """Cache LLM summary for a transcript hash."""
+        import json
+        self.conn.execute("""
+            INSERT OR REPLACE INTO summary_cache (transcript_hash, summary)
+            VALUES (?, ?)
+        """, (transcript_hash, json.dumps(summary)))
+
     def close(self):
         """Close database connection."""
         if self.conn:
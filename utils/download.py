@@ -3,6 +3,8 @@ Download utilities for fetching podcast episodes.
 Extracted from Streamlit pages.
 """
 
+import copy
+import functools
 from typing import List, Dict, Optional
 from pathlib import Path
 import yaml
@@ -10,10 +12,23 @@ from utils.downloader import PodcastDownloader
 from utils.postgres_db import PostgresDB
 
 
+# Prefer the libyaml C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_feeds_config_cached(config_path: str, mtime_ns: int) -> Dict:
+    """Parse feeds.yaml; cached per (path, mtime) so edits to the file are picked up."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def load_feeds_config(config_path: Optional[Path] = None) -> Dict:
     """
     Load feeds configuration from YAML file.
     
+    The parsed file is cached and only re-read when its modification time changes.
+    
     Args:
         config_path: Path to feeds.yaml (defaults to config/feeds.yaml)
         
@@ -22,6 +37,7 @@ def load_feeds_config(config_path: Optional[Path] = None) -> Dict:
     """
     if config_path is None:
         config_path = Path("config/feeds.yaml")
+    config_path = Path(config_path)
     
     if not config_path.exists():
         # Create default config
@@ -37,8 +53,9 @@ def load_feeds_config(config_path: Optional[Path] = None) -> Dict:
             yaml.dump(default_config, f, default_flow_style=False)
         return default_config
     
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    config = _load_feeds_config_cached(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+    # Hand out a copy so callers can't mutate the cached config
+    return copy.deepcopy(config)
 
 
 def download_feeds(
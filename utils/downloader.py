@@ -1,17 +1,91 @@
 """Podcast episode downloader and RSS feed processor."""
 
+import hashlib
+import json
 import os
-import requests
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 import feedparser
+import requests
 # from pydub import AudioSegment  # Disabled due to Python 3.13 compatibility
 import subprocess
 import re
 
 from utils.postgres_db import PostgresDB
+from utils.http_client import get_session
+from utils.rss_fast import stream_first_episodes, STREAM_PARSE_MAX_ITEMS
+
+# Read size for streaming episode downloads (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Read size for stream-parsing RSS feeds
+RSS_CHUNK_SIZE = 64 << 10
+
+# Concurrent downloads allowed against a single podcast host
+MAX_DOWNLOADS_PER_HOST = 2
+
+# Files at least this large are fetched as parallel byte ranges when the server allows it
+RANGE_DOWNLOAD_MIN_BYTES = 8 << 20
+RANGE_DOWNLOAD_PARTS = 6
+
+# Concurrent downloads allowed in total, across all hosts
+MAX_CONCURRENT_DOWNLOADS = 6
+
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+_download_slots = threading.BoundedSemaphore(MAX_CONCURRENT_DOWNLOADS)
+
+
+def _host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """Get the semaphore limiting concurrent downloads from the URL's host."""
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(MAX_DOWNLOADS_PER_HOST)
+        return _host_semaphores[host]
+
+
+def drop_page_cache(path) -> None:
+    """
+    Ask the kernel to evict a file's pages from the page cache.
+    
+    No-op on platforms without posix_fadvise (e.g. Windows/macOS).
+    
+    Args:
+        path: Path to the file
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+# Characters not allowed in episode filenames (keeps letters, digits, '_', ' ' and '-')
+_UNSAFE_TITLE_CHARS = re.compile(r'[^\w \-]+')
+
+
+def sanitize_title(title: str) -> str:
+    """
+    Strip characters that are unsafe in filenames from an episode title.
+    
+    Args:
+        title: Episode title
+        
+    Returns:
+        Title containing only letters, digits, underscores, spaces and hyphens
+    """
+    return _UNSAFE_TITLE_CHARS.sub('', title).rstrip()
 
 
 def create_slug(text: str, max_length: int = 100) -> str:
@@ -48,6 +122,7 @@ class PodcastDownloader:
         self.data_dir = Path(data_dir)
         self.audio_dir = self.data_dir / "audio"
         self.audio_dir.mkdir(parents=True, exist_ok=True)
+        self.feed_cache_dir = self.data_dir / ".feed_cache"
         self.max_episodes = max_episodes
         self.audio_format = audio_format
 
@@ -58,30 +133,117 @@ class PodcastDownloader:
         if existing:
             return existing["id"]
         # Create a placeholder entry to track the feed
-        # We use a special episode_url pattern to identify feed entries
-        feed_episode_url = f"__feed__:{url}"
-        existing_feed = self.db.get_podcast_by_url(feed_episode_url)
-        if existing_feed:
-            return existing_feed["id"]
+        # (save_podcast upserts on episode_url, so a concurrent add reuses the same row)
+        return self.db.save_podcast(**self._feed_placeholder(name, url, category))
+
+    def add_feeds(self, feeds: List[Dict]) -> List[Dict]:
+        """
+        Register several new feeds in one transaction.
+        
+        Unlike add_feed this does not look for existing rows first; callers pass
+        feeds they already know are missing (re-adding one just updates its
+        placeholder).
         
-        # Create new feed entry
-        podcast_id = self.db.save_podcast(
-            title=f"Feed: {name}",
-            feed_url=url,
-            episode_url=feed_episode_url,  # Special marker for feed entries
-            podcast_feed_name=name,
-            podcast_category=category,
-            status='downloaded'
-        )
-        return podcast_id
+        Args:
+            feeds: Feed configs with 'name', 'url' and optional 'category'
+            
+        Returns:
+            Placeholder episode dicts, in the same order as feeds
+        """
+        rows = [self._feed_placeholder(f['name'], f['url'], f.get('category')) for f in feeds]
+        return self.db.save_podcasts_bulk(rows, return_episodes=True)
+
+    @staticmethod
+    def _feed_placeholder(name: str, url: str, category: str = None) -> Dict:
+        """Podcast row that tracks a feed; a special episode_url pattern identifies feed entries."""
+        return {
+            'title': f"Feed: {name}",
+            'feed_url': url,
+            'episode_url': f"__feed__:{url}",  # Special marker for feed entries
+            'podcast_feed_name': name,
+            'podcast_category': category,
+            'status': 'downloaded'
+        }
+
+    def _feed_cache_path(self, rss_url: str) -> Path:
+        """Path of the conditional-GET cache file for a feed."""
+        return self.feed_cache_dir / f"{hashlib.sha1(rss_url.encode('utf-8')).hexdigest()}.json"
+
+    def _load_feed_cache(self, rss_url: str, limit: int) -> Optional[Dict]:
+        """Load a feed's cached validators and episodes, if they cover at least limit episodes."""
+        try:
+            with open(self._feed_cache_path(rss_url), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('url') != rss_url or cached.get('limit', 0) < limit:
+            return None
+        for episode in cached['episodes']:
+            if episode.get('date'):
+                episode['date'] = datetime.fromisoformat(episode['date'])
+        return cached
+
+    def _save_feed_cache(self, rss_url: str, limit: int, response, episodes: List[Dict]) -> None:
+        """Remember a feed's ETag/Last-Modified and parsed episodes for the next fetch."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return  # Server can't answer conditional GETs; nothing worth caching
+        cached = {
+            'url': rss_url,
+            'limit': limit,
+            'etag': etag,
+            'last_modified': last_modified,
+            'episodes': [
+                {**ep, 'date': ep['date'].isoformat() if ep.get('date') else None}
+                for ep in episodes
+            ]
+        }
+        try:
+            self.feed_cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = self._feed_cache_path(rss_url)
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Could not write feed cache for {rss_url}: {e}")
 
     def fetch_episodes(self, rss_url: str, limit: int = None) -> List[Dict]:
-        """Fetch episode metadata from RSS feed."""
+        """
+        Fetch episode metadata from RSS feed.
+        
+        Uses a conditional GET (ETag / Last-Modified) against the feed cache in
+        data/.feed_cache, so an unchanged feed costs one 304 round trip and is
+        not downloaded or parsed again. Small limits are stream-parsed and stop
+        reading the feed after the first items; other feeds go through feedparser.
+        """
         if limit is None:
             limit = self.max_episodes
 
         try:
-            feed = feedparser.parse(rss_url)
+            cached = self._load_feed_cache(rss_url, limit)
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
+            response = get_session().get(rss_url, headers=headers, timeout=60, stream=True)
+            with response:
+                if cached and response.status_code == 304:
+                    return cached['episodes'][:limit]
+                response.raise_for_status()
+                
+                # For the newest few episodes, stop reading the feed after the first items
+                body = None
+                if limit <= STREAM_PARSE_MAX_ITEMS:
+                    episodes, body = stream_first_episodes(response.iter_content(chunk_size=RSS_CHUNK_SIZE), limit)
+                    if body is None:
+                        self._save_feed_cache(rss_url, limit, response, episodes)
+                        return episodes
+                feed = feedparser.parse(body if body is not None else response.content)
             episodes = []
             
             for entry in feed.entries[:limit]:
@@ -110,25 +272,193 @@ class PodcastDownloader:
                     'guid': entry.get('id', audio_url)
                 })
             
+            self._save_feed_cache(rss_url, limit, response, episodes)
             return episodes
             
         except Exception as e:
             print(f"Error fetching RSS feed {rss_url}: {e}")
             return []
 
+    def fetch_all_episodes(self, feed_urls: List[str], limit: int = None, max_workers: int = 8) -> List[List[Dict]]:
+        """
+        Fetch episode metadata from several RSS feeds concurrently.
+        
+        Args:
+            feed_urls: RSS feed URLs
+            limit: Maximum episodes per feed (defaults to max_episodes)
+            max_workers: Maximum number of feeds fetched at once
+            
+        Returns:
+            List of episode lists, in the same order as feed_urls
+        """
+        if len(feed_urls) <= 1:
+            return [self.fetch_episodes(url, limit=limit) for url in feed_urls]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(feed_urls))) as executor:
+            return list(executor.map(lambda url: self.fetch_episodes(url, limit=limit), feed_urls))
+
+    def download_episodes(self, jobs: List[Tuple[str, str]], max_workers: int = MAX_CONCURRENT_DOWNLOADS) -> List[Optional[str]]:
+        """
+        Download several episodes concurrently.
+        
+        Each download still holds a per-host slot while streaming, so no more than
+        MAX_DOWNLOADS_PER_HOST downloads hit the same podcast host at once (each may
+        use up to RANGE_DOWNLOAD_PARTS connections), and no more than
+        MAX_CONCURRENT_DOWNLOADS stream at once in the whole process.
+        
+        Args:
+            jobs: (episode_url, filename) pairs, as passed to download_episode
+            max_workers: Maximum number of downloads in flight
+            
+        Returns:
+            List of output file paths (None for failures), in the same order as jobs
+        """
+        if len(jobs) <= 1:
+            return [self.download_episode(url, filename) for url, filename in jobs]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            return list(executor.map(lambda job: self.download_episode(*job), jobs))
+
+    def _download_stream(self, response, tmp_path: Path, total_size: Optional[int]) -> int:
+        """
+        Write a streaming response body to tmp_path over a single connection.
+        
+        Args:
+            response: Streaming requests response
+            tmp_path: Destination file
+            total_size: Content-Length, if known
+            
+        Returns:
+            Number of bytes written
+        """
+        downloaded_bytes = 0
+        # Per-chunk progress only makes sense on a terminal; piped logs get 10% steps
+        live_progress = sys.stdout.isatty()
+        next_report_pct = 10
+        with open(tmp_path, 'wb') as tmp_file:
+            # Reserve the full size up front so the filesystem can lay out the file contiguously
+            if total_size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(tmp_file.fileno(), 0, total_size)
+                except OSError:
+                    pass
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                tmp_file.write(chunk)
+                downloaded_bytes += len(chunk)
+                if total_size:  # Print roughly every MB
+                    progress = (downloaded_bytes / total_size) * 100
+                    if live_progress:
+                        print(f"     Progress: {progress:.1f}% ({downloaded_bytes / (1024*1024):.1f} MB)", end='\r')
+                    elif progress >= next_report_pct:
+                        print(f"     Progress: {progress:.1f}% ({downloaded_bytes / (1024*1024):.1f} MB)")
+                        next_report_pct = (int(progress) // 10 + 1) * 10
+            # Drop any preallocated tail if the body was shorter than advertised
+            tmp_file.truncate(downloaded_bytes)
+        return downloaded_bytes
+
+    def _download_ranges(self, url: str, tmp_path: Path, total_size: int) -> Optional[int]:
+        """
+        Download a file as RANGE_DOWNLOAD_PARTS concurrent byte ranges.
+        
+        Each part is written at its own offset in a preallocated file, so parts
+        can finish in any order.
+        
+        Args:
+            url: Audio URL (after redirects)
+            tmp_path: Destination file
+            total_size: Content-Length of the file
+            
+        Returns:
+            Number of bytes written, or None if the server did not honour a
+            range request (the caller should fall back to a single GET)
+        """
+        part_size = -(-total_size // RANGE_DOWNLOAD_PARTS)
+        ranges = [(start, min(start + part_size, total_size) - 1)
+                  for start in range(0, total_size, part_size)]
+        
+        progress_lock = threading.Lock()
+        downloaded = [0]
+        next_report_pct = [10]
+        
+        def fetch_range(fd: int, start: int, end: int) -> bool:
+            # Any failed part (HTTP error, dropped connection, non-206 reply) makes the
+            # caller fall back to a single GET, e.g. for signed or one-use CDN URLs
+            try:
+                response = get_session().get(
+                    url, headers={'Range': f'bytes={start}-{end}'}, stream=True, timeout=300
+                )
+                with response:
+                    if response.status_code != 206:
+                        return False
+                    offset = start
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        # Don't write past this part if the server sent more than asked for
+                        chunk = chunk[:end + 1 - offset]
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                        with progress_lock:
+                            downloaded[0] += len(chunk)
+                            progress = (downloaded[0] / total_size) * 100
+                            if progress >= next_report_pct[0]:
+                                print(f"     Progress: {progress:.1f}% ({downloaded[0] / (1024*1024):.1f} MB)")
+                                next_report_pct[0] = (int(progress) // 10 + 1) * 10
+                        if offset > end:
+                            break
+                    return offset == end + 1
+            except requests.RequestException:
+                return False
+        
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, total_size)
+                except OSError:
+                    os.ftruncate(fd, total_size)
+            else:
+                os.ftruncate(fd, total_size)
+            
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                results = list(executor.map(lambda r: fetch_range(fd, *r), ranges))
+        finally:
+            os.close(fd)
+        
+        if not all(results):
+            return None
+        return total_size
+
     def download_episode(self, episode_url: str, filename: str) -> Optional[str]:
         """Download and normalize audio episode."""
+        return self.download_episode_with_size(episode_url, filename)[0]
+
+    def download_episode_with_size(self, episode_url: str, filename: str) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Download and normalize an audio episode, also returning the output file's size.
+        
+        The size comes from the stat the downloader already does for its own
+        report, so callers don't need to stat the file again.
+        
+        Args:
+            episode_url: Audio URL
+            filename: Output filename without extension
+            
+        Returns:
+            Tuple of (output file path, size in bytes); (None, None) on failure
+        """
         import time
         
         try:
             # Check if output file already exists
             output_path = self.audio_dir / f"{filename}.{self.audio_format}"
-            if output_path.exists():
-                file_size_mb = output_path.stat().st_size / (1024 * 1024)
+            try:
+                existing_size = output_path.stat().st_size
+            except FileNotFoundError:
+                existing_size = None
+            if existing_size is not None:
                 print(f"  ℹ️  File already exists: {output_path.name}")
-                print(f"     Size: {file_size_mb:.2f} MB")
+                print(f"     Size: {existing_size / (1024 * 1024):.2f} MB")
                 print(f"     Skipping download")
-                return str(output_path)
+                return str(output_path), existing_size
             
             download_start = time.time()
             
@@ -136,34 +466,42 @@ class PodcastDownloader:
             print(f"  📥 Downloading audio from URL...")
             print(f"     URL: {episode_url[:80]}...")
             
-            response = requests.get(episode_url, stream=True, timeout=300)
-            response.raise_for_status()
-            
-            # Get content length if available
-            content_length = response.headers.get('Content-Length')
-            total_size = int(content_length) if content_length else None
-            
-            if total_size:
-                total_size_mb = total_size / (1024 * 1024)
-                print(f"     File size: {total_size_mb:.2f} MB")
-            
-            # Save to temporary file with slug-based name
-            print(f"     Saving to temporary file...")
-            # Create slug from filename for temp file
-            slug = create_slug(filename)
-            temp_dir = self.audio_dir / "temp"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            tmp_path = temp_dir / f"{slug}_downloaded.tmp"
-            
-            downloaded_bytes = 0
-            with open(tmp_path, 'wb') as tmp_file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    tmp_file.write(chunk)
-                    downloaded_bytes += len(chunk)
-                    if total_size:
-                        progress = (downloaded_bytes / total_size) * 100
-                        if downloaded_bytes % (1024 * 1024) == 0:  # Print every MB
-                            print(f"     Progress: {progress:.1f}% ({downloaded_bytes / (1024*1024):.1f} MB)", end='\r')
+            # Hold a per-host slot (then a global one) only while streaming; ffmpeg runs outside them
+            with _host_semaphore(episode_url), _download_slots:
+                response = get_session().get(episode_url, stream=True, timeout=300)
+                response.raise_for_status()
+                
+                # Get content length if available
+                content_length = response.headers.get('Content-Length')
+                total_size = int(content_length) if content_length else None
+                
+                if total_size:
+                    total_size_mb = total_size / (1024 * 1024)
+                    print(f"     File size: {total_size_mb:.2f} MB")
+                
+                # Save to temporary file with slug-based name
+                print(f"     Saving to temporary file...")
+                # Create slug from filename for temp file
+                slug = create_slug(filename)
+                temp_dir = self.audio_dir / "temp"
+                temp_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = temp_dir / f"{slug}_downloaded.tmp"
+                
+                downloaded_bytes = None
+                # Servers that accept byte ranges are fetched over several connections,
+                # which gets around per-connection throttling on podcast CDNs
+                if (total_size and total_size >= RANGE_DOWNLOAD_MIN_BYTES and hasattr(os, 'pwrite')
+                        and response.headers.get('Accept-Ranges', '').lower() == 'bytes'):
+                    response.close()
+                    print(f"     Downloading in {RANGE_DOWNLOAD_PARTS} parallel ranges...")
+                    downloaded_bytes = self._download_ranges(response.url, tmp_path, total_size)
+                    if downloaded_bytes is None:
+                        print("     ⚠️  Range requests not honoured, falling back to a single download")
+                        response = get_session().get(episode_url, stream=True, timeout=300)
+                        response.raise_for_status()
+                
+                if downloaded_bytes is None:
+                    downloaded_bytes = self._download_stream(response, tmp_path, total_size)
             
             print(f"     Temp file: {tmp_path.name}")
             
@@ -175,9 +513,12 @@ class PodcastDownloader:
 
             # Convert and normalize with ffmpeg
             # output_path already defined above, but check again in case it was created
-            if output_path.exists():
+            try:
+                existing_size = output_path.stat().st_size
                 print(f"\n  ℹ️  Output file already exists, skipping processing")
-                return str(output_path)
+                return str(output_path), existing_size
+            except FileNotFoundError:
+                pass
             
             print(f"\n  🎵 Processing audio with ffmpeg...")
             print(f"     Input: {tmp_path}")
@@ -214,7 +555,14 @@ class PodcastDownloader:
                 print(f"     {result.stderr[:500]}")
                 print(f"     Trying fallback conversion...")
                 # Fallback to simpler conversion
-                return self._fallback_conversion(tmp_path, output_path)
+                output = self._fallback_conversion(tmp_path, output_path)
+                drop_page_cache(tmp_path)
+                if not output:
+                    return None, None
+                return output, os.stat(output).st_size
+            
+            # The raw download is only kept for debugging; don't let it crowd the page cache
+            drop_page_cache(tmp_path)
             
             # Show ffmpeg output for diagnostics
             if result.stdout:
@@ -226,10 +574,9 @@ class PodcastDownloader:
             
             print(f"     ✅ Audio processing complete ({ffmpeg_time:.1f}s)")
             
-            # Get output file size
-            if output_path.exists():
-                output_size_mb = output_path.stat().st_size / (1024 * 1024)
-                print(f"     Output size: {output_size_mb:.2f} MB")
+            # Get output file size (returned to the caller as well)
+            output_size = output_path.stat().st_size
+            print(f"     Output size: {output_size / (1024 * 1024):.2f} MB")
             
             # Keep temp file for debugging (no cleanup)
             print(f"     ℹ️  Temp file kept: {tmp_path}")
@@ -238,13 +585,13 @@ class PodcastDownloader:
             print(f"\n  ✅ Download and processing complete!")
             print(f"     Total time: {int(total_time//60)}m{int(total_time%60)}s ({total_time:.1f}s)")
             
-            return str(output_path)
+            return str(output_path), output_size
             
         except Exception as e:
             print(f"  ❌ Error downloading {episode_url}: {e}")
             import traceback
             traceback.print_exc()
-            return None
+            return None, None
 
     def _fallback_conversion(self, input_path: str, output_path: Path) -> str:
         """Fallback audio conversion using ffmpeg directly."""
@@ -300,17 +647,12 @@ class PodcastDownloader:
             print(f"Downloading: {ep_data['title']}")
             
             # Generate safe filename
-            safe_title = "".join(c for c in ep_data['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_title = sanitize_title(ep_data['title'])
             filename = f"{podcast['id']}_{safe_title[:50]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
             # Download episode
-            file_path = self.download_episode(ep_data['url'], filename)
+            file_path, file_size_bytes = self.download_episode_with_size(ep_data['url'], filename)
             if file_path:
-                # Calculate file size
-                file_size_bytes = None
-                if Path(file_path).exists():
-                    file_size_bytes = Path(file_path).stat().st_size
-                
                 # Add to PostgreSQL database
                 episode_id = self.db.save_podcast(
                     title=ep_data['title'],
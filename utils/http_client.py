@@ -0,0 +1,68 @@
+"""
+Shared HTTP connection pools.
+Reusing one pool per process lets repeated RSS, audio and API requests to the
+same hosts skip the TCP/TLS handshake.
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of distinct hosts to keep pools for, and connections kept per host
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Retries for failed connections/reads (idempotent methods only, exponential backoff)
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+
+# Some podcast hosts reject the default python-requests agent
+USER_AGENT = "open-podcast-processor (+https://github.com/kaljuvee/open-podcast-processor)"
+
+_session: requests.Session = None
+_httpx_client = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared requests session (created on first use).
+
+    Returns:
+        requests.Session with pooled keep-alive connections, retries on
+        transient connection errors and a fixed User-Agent
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                session.headers['User-Agent'] = USER_AGENT
+                retries = Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR)
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                                      max_retries=retries)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
+
+def get_httpx_client():
+    """
+    Get the shared httpx client for OpenAI-compatible SDK clients (created on first use).
+
+    Returns:
+        httpx.Client with pooled keep-alive connections
+    """
+    global _httpx_client
+    if _httpx_client is None:
+        with _lock:
+            if _httpx_client is None:
+                import httpx
+                _httpx_client = httpx.Client(
+                    timeout=httpx.Timeout(600.0, connect=30.0),
+                    limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_CONNECTIONS),
+                    follow_redirects=True
+                )
+    return _httpx_client
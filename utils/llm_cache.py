@@ -0,0 +1,50 @@
+"""
+Optional response cache for LangChain chat model calls.
+When LLM_CACHE_PATH is set, identical prompts (same model, parameters and
+messages) are answered from a local SQLite file instead of calling Groq.
+"""
+
+import threading
+from pathlib import Path
+from typing import Optional
+
+from utils.config import get_llm_cache_path
+
+_cache_lock = threading.Lock()
+_cache_path: Optional[str] = None
+
+
+def enable_llm_cache(path: Optional[str] = None) -> bool:
+    """
+    Install a process-wide SQLite cache for LangChain LLM calls.
+    
+    Safe to call repeatedly (e.g. from every TranscriptCleaner); the cache is
+    installed once per process. Without a path and with LLM_CACHE_PATH unset
+    this does nothing.
+    
+    Args:
+        path: SQLite cache file (defaults to LLM_CACHE_PATH)
+        
+    Returns:
+        True if a cache is active
+    """
+    global _cache_path
+    
+    path = path or get_llm_cache_path()
+    if not path:
+        return _cache_path is not None
+    
+    with _cache_lock:
+        if _cache_path is not None:
+            return True
+        try:
+            from langchain_community.cache import SQLiteCache
+            from langchain_core.globals import set_llm_cache
+        except ImportError:
+            print("⚠️  langchain-community not installed; LLM response cache disabled")
+            return False
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        set_llm_cache(SQLiteCache(database_path=path))
+        _cache_path = path
+        return True
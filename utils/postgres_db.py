@@ -3,16 +3,26 @@ PostgreSQL database utility for storing processed podcast data.
 Uses SQLAlchemy ORM for database interactions.
 """
 
+import hashlib
+import io
 import json
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from sqlalchemy import create_engine, text, inspect, Column, Integer, String, Text, BigInteger, DateTime, JSON
+from typing import Dict, Iterator, List, Optional, Any, Union
+from sqlalchemy import create_engine, text, inspect, case, func, update, Column, Integer, String, Text, BigInteger, DateTime, JSON
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, ProgrammingError
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 
-from utils.config import get_db_url, get_db_schema
+from utils.config import get_db_url, get_db_schema, get_db_prepared_statements
+
+# Optional orjson for faster JSONB encoding/decoding of large transcripts
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Create base class for declarative models
 Base = declarative_base()
@@ -21,6 +31,8 @@ Base = declarative_base()
 class Podcast(Base):
     """SQLAlchemy ORM model for podcasts table."""
     __tablename__ = 'podcasts'
+    # Fetch server-generated columns (e.g. updated_at) via RETURNING instead of a follow-up SELECT
+    __mapper_args__ = {'eager_defaults': True}
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(500), nullable=False)
@@ -41,6 +53,102 @@ class Podcast(Base):
     updated_at = Column(DateTime, server_default=text('CURRENT_TIMESTAMP'), onupdate=text('CURRENT_TIMESTAMP'))
 
 
+# Hot single-row lookups, PREPAREd once per pooled connection so Postgres can
+# skip parse/plan on repeat calls ({table} is filled with the schema-qualified name)
+_PREPARED_LOOKUPS = {
+    'get_by_id': "SELECT * FROM {table} WHERE id = $1",
+    'get_by_url': "SELECT * FROM {table} WHERE episode_url = $1 LIMIT 1",
+    'get_by_feed_url': "SELECT * FROM {table} WHERE feed_url = $1 LIMIT 1",
+}
+
+# Hot single-row writes, prepared the same way; committed after they run
+_PREPARED_UPDATES = {
+    # Mirrors update_podcast(status=...): processed_at is stamped the first time status becomes 'processed'.
+    # $2 is cast explicitly so both uses deduce the same parameter type.
+    'set_status': """
+        UPDATE {table} SET
+            status = $2::text,
+            processed_at = CASE WHEN $2::text = 'processed' THEN COALESCE(processed_at, CURRENT_TIMESTAMP) ELSE processed_at END,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = $1
+        RETURNING *
+    """,
+}
+
+# Engines are shared per database URL so repeated PostgresDB() instances reuse
+# pooled connections instead of opening a new TCP/TLS/auth handshake each time
+_engines: Dict[str, Engine] = {}
+_ensured_schemas = set()
+_engines_lock = threading.Lock()
+
+# (db_url, schema) pairs whose podcasts table lacks the unique episode_url index
+# that INSERT ... ON CONFLICT needs; save_podcast falls back to select-then-write there
+_upsert_unsupported = set()
+
+# Columns save_podcast overwrites on an existing episode (only with non-None values)
+_UPSERT_UPDATABLE = ('title', 'description', 'duration_seconds', 'audio_file_path',
+                     'file_size_bytes', 'status', 'transcript', 'summary')
+
+# Columns written by copy_upsert_podcasts, in COPY order
+_COPY_COLUMNS = ('title', 'description', 'feed_url', 'episode_url', 'published_at', 'duration_seconds',
+                 'audio_file_path', 'file_size_bytes', 'status', 'transcript', 'summary',
+                 'podcast_feed_name', 'podcast_category')
+
+
+def _copy_csv_field(value: Any) -> str:
+    """Format one value for COPY ... WITH (FORMAT csv): unquoted empty is NULL, everything else is quoted."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode() \
+            if ORJSON_AVAILABLE else json.dumps(value, default=str)
+    else:
+        value = str(value)
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _orjson_serializer(obj: Any) -> str:
+    """Serialize a JSONB value with orjson (non-str keys are stringified, as json.dumps does)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _get_engine(db_url: str) -> Engine:
+    """Get (or create) the shared engine for a database URL."""
+    with _engines_lock:
+        engine = _engines.get(db_url)
+        if engine is None:
+            # Transcripts can hold thousands of segments; orjson encodes/decodes them several times faster
+            json_options = {'json_serializer': _orjson_serializer, 'json_deserializer': orjson.loads} if ORJSON_AVAILABLE else {}
+            engine = create_engine(db_url, pool_pre_ping=True, pool_size=5, max_overflow=11, **json_options)
+            _engines[db_url] = engine
+        return engine
+
+
+def _jsonb_array_length(expr):
+    """jsonb_array_length() that yields NULL instead of raising when the value isn't an array."""
+    return case((func.jsonb_typeof(expr) == 'array', func.jsonb_array_length(expr)), else_=None)
+
+
+def _jsonb_present(expr):
+    """True when a JSONB column holds a value; SQL NULL and JSON null (how None is stored) both count as absent."""
+    return func.coalesce(func.jsonb_typeof(expr), 'null') != 'null'
+
+
+def dispose_engines():
+    """Close all pooled connections held by shared engines."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _ensured_schemas.clear()
+
+
 class PostgresDB:
     """PostgreSQL database interface for podcast storage."""
     
@@ -54,14 +162,52 @@ class PostgresDB:
         """
         self.db_url = db_url or get_db_url()
         self.schema = schema or get_db_schema()
-        self.engine = create_engine(self.db_url, pool_pre_ping=True)
+        self.engine = _get_engine(self.db_url)
+        self.use_prepared_statements = get_db_prepared_statements()
         self.SessionLocal = sessionmaker(bind=self.engine)
-        self._ensure_schema()
+        if (self.db_url, self.schema) not in _ensured_schemas:
+            self._ensure_schema()
+            _ensured_schemas.add((self.db_url, self.schema))
         
         # Set schema for models if not public
         if self.schema != 'public':
             Podcast.__table__.schema = self.schema
     
+    def _table_name(self) -> str:
+        """Schema-qualified podcasts table name."""
+        return f"{self.schema}.podcasts" if self.schema != 'public' else "podcasts"
+    
+    def _execute_prepared(self, name: str, *params: Any) -> Optional[Dict[str, Any]]:
+        """
+        Run a statement from _PREPARED_LOOKUPS or _PREPARED_UPDATES as a server-side prepared statement.
+        
+        The statement is prepared lazily on each pooled connection (tracked in
+        the connection's info dict, so reconnects re-prepare automatically).
+        
+        Args:
+            name: Key in _PREPARED_LOOKUPS or _PREPARED_UPDATES
+            params: Values for $1, $2, ...
+            
+        Returns:
+            Podcast dictionary or None
+        """
+        is_update = name in _PREPARED_UPDATES
+        stmt_name = f"{name}_{self.schema}"
+        with self.engine.connect() as conn:
+            prepared = conn.info.setdefault('prepared_statements', set())
+            if stmt_name not in prepared:
+                sql = (_PREPARED_UPDATES if is_update else _PREPARED_LOOKUPS)[name].format(table=self._table_name())
+                conn.exec_driver_sql(f"PREPARE {stmt_name} AS {sql}")
+                conn.commit()
+                prepared.add(stmt_name)
+            placeholders = ', '.join(['%s'] * len(params))
+            row = conn.exec_driver_sql(f"EXECUTE {stmt_name}({placeholders})", params).mappings().first()
+            if is_update:
+                conn.commit()
+            if row:
+                return {column.name: row[column.name] for column in Podcast.__table__.columns}
+            return None
+    
     def _ensure_schema(self):
         """Ensure the schema exists."""
         try:
@@ -72,14 +218,42 @@ class PostgresDB:
         except Exception as e:
             print(f"Warning: Could not ensure schema exists: {e}")
     
-    def execute_sql_file(self, sql_file_path: str):
+    def _schema_file_applied(self, file_name: str, content_hash: str) -> bool:
+        """Check schema_meta for this exact SQL file content having been applied already."""
+        meta_table = f"{self.schema}.schema_meta"
+        try:
+            with self.engine.connect() as conn:
+                # A dropped podcasts table means the file must run again whatever the hash says
+                meta_oid, podcasts_oid = conn.execute(
+                    text("SELECT to_regclass(:meta), to_regclass(:podcasts)"),
+                    {'meta': meta_table, 'podcasts': f"{self.schema}.podcasts"}
+                ).one()
+                if meta_oid is None or podcasts_oid is None:
+                    return False
+                applied_hash = conn.execute(
+                    text(f"SELECT content_hash FROM {meta_table} WHERE file_name = :name"),
+                    {'name': file_name}
+                ).scalar()
+                return applied_hash == content_hash
+        except SQLAlchemyError:
+            return False
+    
+    def execute_sql_file(self, sql_file_path: str, skip_if_unchanged: bool = False) -> bool:
         """
         Execute SQL file to create schema.
         Uses psycopg2 directly to handle dollar-quoted strings properly.
         Sets the search_path to use the correct schema.
         
+        Each successful run records the file's hash in {schema}.schema_meta, so
+        with skip_if_unchanged a file that was already applied unchanged costs
+        one lookup instead of re-running every statement.
+        
         Args:
             sql_file_path: Path to SQL file
+            skip_if_unchanged: Skip the file if this exact content was already applied
+            
+        Returns:
+            True if the file was executed, False if it was skipped as unchanged
         """
         from pathlib import Path
         import psycopg2
@@ -96,6 +270,10 @@ class PostgresDB:
         if '{schema}' in sql_content:
             sql_content = sql_content.replace('{schema}', self.schema)
         
+        content_hash = hashlib.sha256(sql_content.encode('utf-8')).hexdigest()
+        if skip_if_unchanged and self._schema_file_applied(sql_path.name, content_hash):
+            return False
+        
         try:
             # Parse database URL and use psycopg2 directly for better SQL file handling
             parsed = urlparse(self.db_url)
@@ -125,6 +303,20 @@ class PostgresDB:
                 # With autocommit, each statement commits independently
                 try:
                     cursor.execute(sql_content)
+                    # Remember what was applied so unchanged files can be skipped next time
+                    cursor.execute(f"""
+                        CREATE TABLE IF NOT EXISTS {self.schema}.schema_meta (
+                            file_name VARCHAR(255) PRIMARY KEY,
+                            content_hash CHAR(64) NOT NULL,
+                            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                    """)
+                    cursor.execute(f"""
+                        INSERT INTO {self.schema}.schema_meta (file_name, content_hash)
+                        VALUES (%s, %s)
+                        ON CONFLICT (file_name) DO UPDATE
+                        SET content_hash = EXCLUDED.content_hash, applied_at = CURRENT_TIMESTAMP
+                    """, (sql_path.name, content_hash))
                 except Exception as e:
                     # Some errors are expected (e.g., table/index already exists)
                     error_msg = str(e)
@@ -139,6 +331,7 @@ class PostgresDB:
             print(f"Warning: Error executing SQL file: {e}")
             print("Schema may already exist or some statements may have failed")
             # Don't raise - allow the test to continue
+        return True
     
     def save_podcast(
         self,
@@ -154,8 +347,9 @@ class PostgresDB:
         transcript: Dict[str, Any] = None,
         summary: Dict[str, Any] = None,
         podcast_feed_name: str = None,
-        podcast_category: str = None
-    ) -> int:
+        podcast_category: str = None,
+        return_episode: bool = False
+    ) -> Union[int, Dict[str, Any]]:
         """
         Save or update a podcast episode using SQLAlchemy ORM.
         
@@ -173,10 +367,35 @@ class PostgresDB:
             summary: Summary data (will be stored as JSONB)
             podcast_feed_name: Name of the podcast feed
             podcast_category: Category of the podcast
+            return_episode: Return the saved episode dict instead of its ID, saving a re-read
             
         Returns:
-            int: Podcast ID
+            int: Podcast ID (or the episode dictionary when return_episode is True)
         """
+        if episode_url and (self.db_url, self.schema) not in _upsert_unsupported:
+            values = {
+                'title': title,
+                'description': description,
+                'feed_url': feed_url,
+                'episode_url': episode_url,
+                'published_at': published_at,
+                'duration_seconds': duration_seconds,
+                'audio_file_path': audio_file_path,
+                'file_size_bytes': file_size_bytes,
+                'status': status,
+                'transcript': transcript,
+                'summary': summary,
+                'podcast_feed_name': podcast_feed_name,
+                'podcast_category': podcast_category
+            }
+            try:
+                return self._upsert_podcast(values, return_episode)
+            except ProgrammingError as e:
+                # 42P10: no unique index on episode_url (schema.sql not re-applied yet)
+                if getattr(e.orig, 'pgcode', None) != '42P10':
+                    raise
+                _upsert_unsupported.add((self.db_url, self.schema))
+        
         session = self.SessionLocal()
         try:
             # Check if podcast already exists (by episode_url)
@@ -205,8 +424,7 @@ class PostgresDB:
                 if status == 'processed' and existing.processed_at is None:
                     existing.processed_at = datetime.now()
                 
-                session.commit()
-                return existing.id
+                podcast = existing
             else:
                 # Insert new podcast
                 new_podcast = Podcast(
@@ -225,12 +443,199 @@ class PostgresDB:
                     podcast_category=podcast_category
                 )
                 session.add(new_podcast)
-                session.commit()
-                session.refresh(new_podcast)
-                return new_podcast.id
+                podcast = new_podcast
+            
+            # Read the result from the flushed row (INSERT/UPDATE ... RETURNING);
+            # after commit every attribute is expired and would cost another SELECT
+            session.flush()
+            result = self._podcast_to_dict(podcast) if return_episode else podcast.id
+            session.commit()
+            return result
         finally:
             session.close()
     
+    def _upsert_podcast(self, values: Dict[str, Any], return_episode: bool) -> Union[int, Dict[str, Any]]:
+        """
+        Insert or update a podcast by episode_url in one INSERT ... ON CONFLICT statement.
+        
+        Follows the same rules as save_podcast's update path: only non-None values
+        overwrite existing ones, feed/category columns keep their original values,
+        and processed_at is stamped the first time status becomes 'processed'.
+        
+        Args:
+            values: Column values as passed to save_podcast
+            return_episode: Return the saved episode dict instead of its ID
+            
+        Returns:
+            Podcast ID, or the episode dictionary when return_episode is True
+        """
+        table = Podcast.__table__
+        # Omitted columns insert as SQL NULL/defaults and leave existing values untouched
+        stmt = pg_insert(table).values({k: v for k, v in values.items() if v is not None})
+        excluded = stmt.excluded
+        updates = {name: func.coalesce(excluded[name], table.c[name]) for name in _UPSERT_UPDATABLE}
+        updates['processed_at'] = case(
+            ((excluded.status == 'processed') & table.c.processed_at.is_(None), func.now()),
+            else_=table.c.processed_at
+        )
+        updates['updated_at'] = text('CURRENT_TIMESTAMP')
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.episode_url],
+            set_=updates
+        ).returning(*table.columns)
+        
+        with self.engine.begin() as conn:
+            row = conn.execute(stmt).mappings().one()
+        return dict(row) if return_episode else row['id']
+    
+    def save_podcasts_bulk(self, rows: List[Dict[str, Any]], return_episodes: bool = False) -> List[Union[int, Dict[str, Any]]]:
+        """
+        Save or update many podcast episodes in a single transaction.
+        
+        Each row takes the same keys as save_podcast(). Existing episodes are
+        matched by episode_url in one query, and new rows are inserted together
+        so SQLAlchemy can batch the INSERT ... RETURNING.
+        
+        Args:
+            rows: List of podcast field dictionaries
+            return_episodes: Return the saved episode dicts instead of IDs, saving a re-read
+            
+        Returns:
+            List of podcast IDs (or episode dictionaries), in the same order as rows
+        """
+        if not rows:
+            return []
+        
+        session = self.SessionLocal()
+        try:
+            urls = [row['episode_url'] for row in rows if row.get('episode_url')]
+            existing_by_url = {}
+            if urls:
+                existing_by_url = {
+                    p.episode_url: p
+                    for p in session.query(Podcast).filter(Podcast.episode_url.in_(urls)).all()
+                }
+            
+            podcasts = []
+            for row in rows:
+                row = {'status': 'downloaded', **row}
+                existing = existing_by_url.get(row.get('episode_url'))
+                if existing:
+                    for key in _UPSERT_UPDATABLE:
+                        if row.get(key) is not None:
+                            setattr(existing, key, row[key])
+                    if row['status'] == 'processed' and existing.processed_at is None:
+                        existing.processed_at = datetime.now()
+                    podcasts.append(existing)
+                else:
+                    new_podcast = Podcast(**row)
+                    session.add(new_podcast)
+                    podcasts.append(new_podcast)
+                    if row.get('episode_url'):
+                        # Later duplicates in the same batch update this row instead
+                        existing_by_url[row['episode_url']] = new_podcast
+            
+            session.flush()
+            if return_episodes:
+                result = [self._podcast_to_dict(p) for p in podcasts]
+            else:
+                result = [p.id for p in podcasts]
+            session.commit()
+            return result
+        finally:
+            session.close()
+    
+    def copy_upsert_podcasts(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Bulk insert-or-update podcast episodes with COPY instead of one INSERT per row.
+        
+        Rows are streamed with COPY ... FROM STDIN into a temporary table, then
+        merged into podcasts with one INSERT ... SELECT ... ON CONFLICT
+        (episode_url) DO UPDATE. The merge follows save_podcast's rules: only
+        non-NULL values overwrite existing ones, feed/category columns keep their
+        original values, and processed_at is stamped the first time status
+        becomes 'processed'.
+        
+        Rows without an episode_url, or a database still missing the unique
+        episode_url index, go through save_podcasts_bulk() instead. Within one
+        call, later rows for the same episode_url override earlier ones.
+        
+        Args:
+            rows: List of podcast field dictionaries (same keys as save_podcast())
+            
+        Returns:
+            Number of episodes written
+        """
+        if not rows:
+            return 0
+        
+        # ON CONFLICT can't touch the same row twice in one statement, so merge duplicates first
+        by_url: Dict[str, Dict[str, Any]] = {}
+        without_url = []
+        for row in rows:
+            url = row.get('episode_url')
+            if not url:
+                without_url.append(row)
+                continue
+            merged = by_url.setdefault(url, {})
+            merged.update({k: v for k, v in row.items() if v is not None})
+        
+        written = 0
+        if without_url:
+            written += len(self.save_podcasts_bulk(without_url))
+        if not by_url:
+            return written
+        if (self.db_url, self.schema) in _upsert_unsupported:
+            return written + len(self.save_podcasts_bulk(list(by_url.values())))
+        
+        columns = _COPY_COLUMNS
+        buffer = io.StringIO()
+        for row in by_url.values():
+            row = {'status': 'downloaded', **row}
+            buffer.write(','.join(_copy_csv_field(row.get(name)) for name in columns))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        column_list = ', '.join(columns)
+        updates = ', '.join(f"{name} = COALESCE(EXCLUDED.{name}, p.{name})" for name in _UPSERT_UPDATABLE)
+        raw = self.engine.raw_connection()
+        cursor = None
+        try:
+            cursor = raw.cursor()
+            # Only the COPY columns, with their types but no defaults or constraints:
+            # copying id's nextval() default would burn a sequence value per staged row
+            cursor.execute(
+                f"CREATE TEMP TABLE tmp_podcasts_copy ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {self.schema}.podcasts WITH NO DATA"
+            )
+            cursor.copy_expert(f"COPY tmp_podcasts_copy ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+            cursor.execute(f"""
+                INSERT INTO {self.schema}.podcasts AS p ({column_list}, processed_at)
+                SELECT {column_list}, CASE WHEN status = 'processed' THEN CURRENT_TIMESTAMP END
+                FROM tmp_podcasts_copy
+                ON CONFLICT (episode_url) DO UPDATE SET
+                    {updates},
+                    processed_at = CASE
+                        WHEN EXCLUDED.status = 'processed' AND p.processed_at IS NULL THEN CURRENT_TIMESTAMP
+                        ELSE p.processed_at
+                    END,
+                    updated_at = CURRENT_TIMESTAMP
+            """)
+            raw.commit()
+        except Exception as e:
+            raw.rollback()
+            # 42P10: no unique index on episode_url (schema.sql not re-applied yet)
+            if getattr(e, 'pgcode', None) != '42P10':
+                raise
+            _upsert_unsupported.add((self.db_url, self.schema))
+            return written + len(self.save_podcasts_bulk(list(by_url.values())))
+        finally:
+            if cursor is not None:
+                cursor.close()
+            raw.close()
+        
+        return written + len(by_url)
+    
     def update_podcast(
         self,
         podcast_id: int,
@@ -243,9 +648,12 @@ class PostgresDB:
         transcript: Dict[str, Any] = None,
         summary: Dict[str, Any] = None,
         processed_at: datetime = None
-    ):
+    ) -> Optional[Dict[str, Any]]:
         """
-        Update an existing podcast using SQLAlchemy ORM.
+        Update an existing podcast with a single UPDATE ... RETURNING.
+        
+        Only non-None arguments are written. Setting status to 'processed' also
+        stamps processed_at the first time, unless processed_at is given.
         
         Args:
             podcast_id: Podcast ID
@@ -258,47 +666,47 @@ class PostgresDB:
             transcript: Transcript data
             summary: Summary data
             processed_at: Processing timestamp
+            
+        Returns:
+            Updated podcast dictionary, or None if the podcast was not found
         """
-        session = self.SessionLocal()
+        table = Podcast.__table__
+        fields = {
+            'title': title,
+            'description': description,
+            'duration_seconds': duration_seconds,
+            'audio_file_path': audio_file_path,
+            'file_size_bytes': file_size_bytes,
+            'status': status,
+            'transcript': transcript,
+            'summary': summary,
+            'processed_at': processed_at
+        }
+        values = {k: v for k, v in fields.items() if v is not None}
+        if processed_at is None and status == 'processed':
+            values['processed_at'] = func.coalesce(table.c.processed_at, func.now())
+        
+        # One UPDATE ... RETURNING round trip: no SELECT first, and the old
+        # transcript/summary JSONB is never shipped to the client
+        stmt = update(table).where(table.c.id == podcast_id).values(values).returning(*table.columns)
         try:
-            podcast = session.query(Podcast).filter(Podcast.id == podcast_id).first()
-            if not podcast:
-                print(f"⚠️  Warning: Podcast {podcast_id} not found for update")
-                return
-            
-            if title is not None:
-                podcast.title = title
-            if description is not None:
-                podcast.description = description
-            if duration_seconds is not None:
-                podcast.duration_seconds = duration_seconds
-            if audio_file_path is not None:
-                podcast.audio_file_path = audio_file_path
-            if file_size_bytes is not None:
-                podcast.file_size_bytes = file_size_bytes
-            if status is not None:
-                podcast.status = status
-            if transcript is not None:
-                podcast.transcript = transcript
-            if summary is not None:
-                podcast.summary = summary
-            if processed_at is not None:
-                podcast.processed_at = processed_at
-            elif status == 'processed' and podcast.processed_at is None:
-                podcast.processed_at = datetime.now()
-            
-            session.commit()
+            with self.engine.begin() as conn:
+                row = conn.execute(stmt).mappings().first()
         except Exception as e:
-            session.rollback()
             print(f"❌ Error updating podcast {podcast_id}: {e}")
             import traceback
             traceback.print_exc()
             raise
-        finally:
-            session.close()
+        
+        if row is None:
+            print(f"⚠️  Warning: Podcast {podcast_id} not found for update")
+            return None
+        return dict(row)
     
     def get_podcast_by_id(self, podcast_id: int) -> Optional[Dict[str, Any]]:
         """Get podcast by ID using SQLAlchemy ORM."""
+        if self.use_prepared_statements:
+            return self._execute_prepared('get_by_id', podcast_id)
         session = self.SessionLocal()
         try:
             podcast = session.query(Podcast).filter(Podcast.id == podcast_id).first()
@@ -310,6 +718,8 @@ class PostgresDB:
     
     def get_podcast_by_url(self, episode_url: str) -> Optional[Dict[str, Any]]:
         """Get podcast by episode URL using SQLAlchemy ORM."""
+        if self.use_prepared_statements:
+            return self._execute_prepared('get_by_url', episode_url)
         session = self.SessionLocal()
         try:
             podcast = session.query(Podcast).filter(Podcast.episode_url == episode_url).first()
@@ -372,6 +782,36 @@ class PostgresDB:
         finally:
             session.close()
     
+    def get_recent_podcasts(self, limit: int = 6) -> List[Dict[str, Any]]:
+        """
+        Get the most recent podcasts for display, without their JSONB payloads.
+        
+        Uses the same ordering as get_all_podcasts(), with LIMIT applied in
+        PostgreSQL, so showing a few rows doesn't load the whole table.
+        
+        Args:
+            limit: Number of podcasts to return
+            
+        Returns:
+            List of dictionaries with 'id', 'title', 'status', 'has_transcript'
+            and 'has_summary'
+        """
+        session = self.SessionLocal()
+        try:
+            rows = session.query(
+                Podcast.id,
+                Podcast.title,
+                Podcast.status,
+                _jsonb_present(Podcast.transcript).label('has_transcript'),
+                _jsonb_present(Podcast.summary).label('has_summary')
+            ).order_by(
+                Podcast.published_at.desc().nullslast(),
+                Podcast.created_at.desc()
+            ).limit(limit).all()
+            return [dict(row._mapping) for row in rows]
+        finally:
+            session.close()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get podcast statistics."""
         view_name = f"{self.schema}.podcast_stats" if self.schema != 'public' else "podcast_stats"
@@ -382,8 +822,25 @@ class PostgresDB:
                 return dict(row._mapping)
             return {}
     
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        Count episodes per status in one aggregate query.
+        
+        Returns:
+            Dictionary mapping status to episode count (statuses with no
+            episodes are absent)
+        """
+        session = self.SessionLocal()
+        try:
+            rows = session.query(Podcast.status, func.count(Podcast.id)).group_by(Podcast.status).all()
+            return {status: count for status, count in rows}
+        finally:
+            session.close()
+    
     def get_podcast_by_feed_url(self, feed_url: str) -> Optional[Dict[str, Any]]:
         """Get podcast by feed URL (RSS URL)."""
+        if self.use_prepared_statements:
+            return self._execute_prepared('get_by_feed_url', feed_url)
         session = self.SessionLocal()
         try:
             podcast = session.query(Podcast).filter(Podcast.feed_url == feed_url).first()
@@ -395,6 +852,8 @@ class PostgresDB:
     
     def episode_exists(self, episode_url: str) -> bool:
         """Check if episode already exists by episode URL."""
+        if self.use_prepared_statements:
+            return self._execute_prepared('get_by_url', episode_url) is not None
         session = self.SessionLocal()
         try:
             podcast = session.query(Podcast).filter(Podcast.episode_url == episode_url).first()
@@ -415,10 +874,211 @@ class PostgresDB:
         """
         return self.get_all_podcasts(status=status, limit=limit)
     
+    def get_episode_ids_by_status(self, status: str) -> List[int]:
+        """
+        Get just the IDs of episodes with the given status.
+        
+        Args:
+            status: Status filter
+            
+        Returns:
+            Episode IDs, in the same order as get_episodes_by_status
+        """
+        session = self.SessionLocal()
+        try:
+            rows = session.query(Podcast.id).filter(Podcast.status == status).order_by(
+                Podcast.published_at.desc().nullslast(),
+                Podcast.created_at.desc()
+            ).all()
+            return [row[0] for row in rows]
+        finally:
+            session.close()
+    
+    def get_episode_listing(self, statuses: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get episodes in any of the given statuses in one query, without their JSONB payloads.
+        
+        Meant for listings and pipeline bookkeeping that only need the scalar
+        columns, so no transcripts or summaries are transferred.
+        
+        Args:
+            statuses: Status values to include
+            
+        Returns:
+            Episode dictionaries without 'transcript'/'summary', in the same
+            order as get_episodes_by_status
+        """
+        if not statuses:
+            return []
+        scalar_columns = [c for c in Podcast.__table__.columns if c.name not in ('transcript', 'summary')]
+        session = self.SessionLocal()
+        try:
+            rows = session.query(*scalar_columns).filter(Podcast.status.in_(statuses)).order_by(
+                Podcast.published_at.desc().nullslast(),
+                Podcast.created_at.desc()
+            ).all()
+            return [dict(row._mapping) for row in rows]
+        finally:
+            session.close()
+    
+    def iter_episodes_by_status(self, status: str, batch_size: int = 200,
+                                with_audio_only: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream episodes with the given status through a server-side cursor.
+        
+        Rows arrive in batches of batch_size, so memory stays bounded however many
+        episodes match. The connection is held until the iterator is exhausted or
+        closed, so avoid slow per-row work (e.g. transcription) inside the loop.
+        
+        Args:
+            status: Status filter
+            batch_size: Rows fetched per round trip
+            with_audio_only: Only episodes with an audio_file_path, filtered in
+                PostgreSQL (served by the idx_podcasts_status_with_audio partial index)
+            
+        Yields:
+            Episode dictionaries, in the same order as get_episodes_by_status
+        """
+        session = self.SessionLocal()
+        try:
+            query = session.query(Podcast).filter(Podcast.status == status)
+            if with_audio_only:
+                query = query.filter(Podcast.audio_file_path.isnot(None))
+            query = query.order_by(
+                Podcast.published_at.desc().nullslast(),
+                Podcast.created_at.desc()
+            )
+            for podcast in query.yield_per(batch_size):
+                yield self._podcast_to_dict(podcast)
+        finally:
+            session.close()
+    
+    def get_latest_episode_by_feed_url(self, feed_url: str, status: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent episode of a feed, optionally filtered by status.
+        
+        Args:
+            feed_url: RSS feed URL
+            status: Status filter (optional)
+            
+        Returns:
+            Episode dictionary or None
+        """
+        session = self.SessionLocal()
+        try:
+            query = session.query(Podcast).filter(Podcast.feed_url == feed_url)
+            if status:
+                query = query.filter(Podcast.status == status)
+            podcast = query.order_by(
+                Podcast.published_at.desc().nullslast(),
+                Podcast.created_at.desc()
+            ).first()
+            if podcast:
+                return self._podcast_to_dict(podcast)
+            return None
+        finally:
+            session.close()
+    
+    def get_episodes_by_feed_urls(self, feed_urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get every stored row (episodes and feed placeholders) for several feeds in one query.
+        
+        Transcript and summary JSONB are left out, so the result stays small
+        however much content the feeds already have.
+        
+        Args:
+            feed_urls: RSS feed URLs
+            
+        Returns:
+            List of episode dictionaries without 'transcript'/'summary', ordered by ID
+        """
+        if not feed_urls:
+            return []
+        columns = [c for c in Podcast.__table__.columns if c.name not in ('transcript', 'summary')]
+        session = self.SessionLocal()
+        try:
+            rows = session.query(*columns).filter(Podcast.feed_url.in_(feed_urls)).order_by(Podcast.id).all()
+            return [dict(row._mapping) for row in rows]
+        finally:
+            session.close()
+    
+    def get_first_episode_by_status(self, status: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the lowest-ID episode with the given status.
+        
+        Cheaper than get_episodes_by_status when only one row is needed.
+        
+        Args:
+            status: Status filter
+            
+        Returns:
+            Episode dictionary or None
+        """
+        session = self.SessionLocal()
+        try:
+            podcast = session.query(Podcast).filter(Podcast.status == status).order_by(Podcast.id).first()
+            if podcast:
+                return self._podcast_to_dict(podcast)
+            return None
+        finally:
+            session.close()
+    
     def get_episode_by_id(self, episode_id: int) -> Optional[Dict[str, Any]]:
         """Get episode by ID (alias for get_podcast_by_id)."""
         return self.get_podcast_by_id(episode_id)
     
+    def get_episodes_by_ids(self, episode_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get several episodes in one query.
+        
+        Args:
+            episode_ids: Episode IDs (unknown IDs are skipped)
+            
+        Returns:
+            List of episode dictionaries, ordered by ID
+        """
+        if not episode_ids:
+            return []
+        session = self.SessionLocal()
+        try:
+            podcasts = session.query(Podcast).filter(Podcast.id.in_(episode_ids)).order_by(Podcast.id).all()
+            return [self._podcast_to_dict(p) for p in podcasts]
+        finally:
+            session.close()
+    
+    def get_episode_stats(self, episode_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get an episode's columns with transcript/summary sizes computed in PostgreSQL.
+        
+        The JSONB payloads themselves are not returned, so verifying a long
+        episode transfers a few bytes instead of the whole transcript.
+        
+        Args:
+            episode_id: Episode ID
+            
+        Returns:
+            Episode dictionary without 'transcript'/'summary', plus 'segment_count',
+            'transcript_chars', 'key_topic_count' and 'theme_count' (None when
+            absent), or None if the episode was not found
+        """
+        scalar_columns = [c for c in Podcast.__table__.columns if c.name not in ('transcript', 'summary')]
+        session = self.SessionLocal()
+        try:
+            row = session.query(
+                *scalar_columns,
+                _jsonb_array_length(Podcast.transcript['segments']).label('segment_count'),
+                func.length(Podcast.transcript['text'].astext).label('transcript_chars'),
+                _jsonb_array_length(Podcast.summary['key_topics']).label('key_topic_count'),
+                _jsonb_array_length(Podcast.summary['themes']).label('theme_count')
+            ).filter(Podcast.id == episode_id).first()
+            return dict(row._mapping) if row else None
+        finally:
+            session.close()
+    
+    def get_episode_by_url(self, episode_url: str) -> Optional[Dict[str, Any]]:
+        """Get episode by episode URL (alias for get_podcast_by_url)."""
+        return self.get_podcast_by_url(episode_url)
+    
     def get_transcripts_for_episode(self, episode_id: int) -> List[Dict[str, Any]]:
         """
         Get transcript segments for an episode.
@@ -453,20 +1113,18 @@ class PostgresDB:
             return result
         return []
     
-    def add_transcript_segments(self, episode_id: int, segments: List[Dict[str, Any]]):
+    def add_transcript_segments(self, episode_id: int, segments: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """
         Add transcript segments to an episode.
-        Updates the transcript JSONB field.
+        Updates the transcript JSONB field and sets status to 'transcribed'.
         
         Args:
             episode_id: Episode ID
             segments: List of segment dictionaries
+            
+        Returns:
+            Updated episode dictionary, or None if the episode was not found
         """
-        episode = self.get_podcast_by_id(episode_id)
-        if not episode:
-            print(f"⚠️  Warning: Episode {episode_id} not found in database")
-            return
-        
         # Prepare transcript data
         full_text = " ".join(seg.get('text', '') for seg in segments)
         transcript_data = {
@@ -479,12 +1137,14 @@ class PostgresDB:
         
         # Update episode with transcript
         try:
-            self.update_podcast(
+            episode = self.update_podcast(
                 podcast_id=episode_id,
                 status='transcribed',
                 transcript=transcript_data
             )
-            print(f"   ✅ Transcript saved: {len(segments)} segments, {len(full_text):,} characters")
+            if episode:
+                print(f"   ✅ Transcript saved: {len(segments)} segments, {len(full_text):,} characters")
+            return episode
         except Exception as e:
             print(f"   ❌ Error saving transcript: {e}")
             import traceback
@@ -493,10 +1153,10 @@ class PostgresDB:
     
     def add_summary(self, episode_id: int, key_topics: List[str], themes: List[str],
                    quotes: List[str], startups: List[str], full_summary: str,
-                   digest_date: datetime = None):
+                   digest_date: datetime = None) -> Optional[Dict[str, Any]]:
         """
         Add summary to an episode.
-        Updates the summary JSONB field.
+        Updates the summary JSONB field and sets status to 'processed'.
         
         Args:
             episode_id: Episode ID
@@ -506,6 +1166,9 @@ class PostgresDB:
             startups: List of startups/companies
             full_summary: Full summary text
             digest_date: Digest date (optional)
+            
+        Returns:
+            Updated episode dictionary, or None if the episode was not found
         """
         summary_data = {
             'key_topics': key_topics,
@@ -516,16 +1179,21 @@ class PostgresDB:
         }
         
         # Update episode with summary
-        self.update_podcast(
+        return self.update_podcast(
             podcast_id=episode_id,
             status='processed',
             summary=summary_data,
             processed_at=digest_date or datetime.now()
         )
     
-    def update_episode_status(self, episode_id: int, status: str):
-        """Update episode status (alias for update_podcast)."""
-        self.update_podcast(podcast_id=episode_id, status=status)
+    def update_episode_status(self, episode_id: int, status: str) -> Optional[Dict[str, Any]]:
+        """Update episode status (same result as update_podcast(podcast_id=episode_id, status=status))."""
+        if not self.use_prepared_statements:
+            return self.update_podcast(podcast_id=episode_id, status=status)
+        episode = self._execute_prepared('set_status', episode_id, status)
+        if episode is None:
+            print(f"⚠️  Warning: Podcast {episode_id} not found for update")
+        return episode
     
     def get_or_create_user(self, email: str, name: str = None) -> int:
         """
@@ -711,6 +1379,11 @@ class PostgresDB:
         return feed_id
     
     def close(self):
-        """Close database connection."""
-        self.engine.dispose()
+        """
+        Release this instance.
+        
+        Connections stay in the shared pool for the next PostgresDB(); use
+        dispose_engines() to actually close them. Sessions are already closed
+        by each method, so there is nothing else to release here.
+        """
 
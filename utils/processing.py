@@ -3,59 +3,93 @@ Processing utilities for transcribing and summarizing episodes.
 Extracted from Streamlit pages.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from utils.postgres_db import PostgresDB
 from utils.transcriber_groq import AudioTranscriber
 from utils.cleaner_groq import TranscriptCleaner
 from utils.config import get_groq_api_key
 
 
-def transcribe_episode(episode_id: int, db: PostgresDB) -> Tuple[bool, Optional[str]]:
+def transcribe_episodes_batch(episode_ids: List[int], db: PostgresDB) -> Iterator[Tuple[int, bool, Optional[str], Optional[Dict]]]:
+    """
+    Transcribe several episodes with one shared transcriber.
+    
+    The API key, model settings and HTTP session are set up once for the whole
+    batch instead of once per episode. Results are yielded as each episode
+    finishes, so callers can report progress (or stop early) between episodes.
+    
+    Args:
+        episode_ids: IDs of the episodes to transcribe, in order
+        db: Database instance
+        
+    Yields:
+        Tuple of (episode_id, success: bool, error_message: Optional[str],
+        updated episode dict or None)
+    """
+    try:
+        transcriber = AudioTranscriber(db, api_key=get_groq_api_key())
+    except Exception as e:
+        for episode_id in episode_ids:
+            yield episode_id, False, str(e), None
+        return
+    
+    for episode_id in episode_ids:
+        transcriber.last_saved_episode = None
+        try:
+            if transcriber.transcribe_episode(episode_id):
+                yield episode_id, True, None, transcriber.last_saved_episode
+            else:
+                yield episode_id, False, "Transcription failed", None
+        except Exception as e:
+            yield episode_id, False, str(e), None
+
+
+def transcribe_episode(episode_id: int, db: PostgresDB, return_episode: bool = False) -> Tuple:
     """
     Transcribe a single episode.
     
     Args:
         episode_id: ID of the episode to transcribe
         db: Database instance
+        return_episode: Also return the updated episode dict, saving a re-read
         
     Returns:
-        Tuple of (success: bool, error_message: Optional[str])
+        Tuple of (success: bool, error_message: Optional[str]), with the updated
+        episode dict (or None) appended when return_episode is True
     """
-    try:
-        api_key = get_groq_api_key()
-        transcriber = AudioTranscriber(db, api_key=api_key)
-        success = transcriber.transcribe_episode(episode_id)
-        
-        if success:
-            return True, None
-        else:
-            return False, "Transcription failed"
-    except Exception as e:
-        return False, str(e)
+    _, success, error, episode = next(transcribe_episodes_batch([episode_id], db))
+    result = (success, error)
+    return result + (episode,) if return_episode else result
 
 
-def summarize_episode(episode_id: int, db: PostgresDB) -> Tuple[bool, Optional[str], Optional[Dict]]:
+def summarize_episode(episode_id: int, db: PostgresDB, return_episode: bool = False) -> Tuple:
     """
     Summarize a single episode.
     
     Args:
         episode_id: ID of the episode to summarize
         db: Database instance
+        return_episode: Also return the updated episode dict, saving a re-read
         
     Returns:
-        Tuple of (success: bool, error_message: Optional[str], summary: Optional[Dict])
+        Tuple of (success: bool, error_message: Optional[str], summary: Optional[Dict]),
+        with the updated episode dict (or None) appended when return_episode is True
     """
+    episode = None
     try:
         api_key = get_groq_api_key()
         cleaner = TranscriptCleaner(db, api_key=api_key)
         summary = cleaner.generate_summary(episode_id)
         
         if summary:
-            return True, None, summary
+            result = (True, None, summary)
+            episode = cleaner.last_saved_episode
         else:
-            return False, "Summarization failed", None
+            result = (False, "Summarization failed", None)
     except Exception as e:
-        return False, str(e), None
+        result = (False, str(e), None)
+    
+    return result + (episode,) if return_episode else result
 
 
 def process_all_episodes(db: PostgresDB) -> Dict[str, int]:
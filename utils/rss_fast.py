@@ -0,0 +1,116 @@
+"""
+Streaming RSS parsing for callers that only need the newest few episodes.
+feedparser builds the whole document before returning; this stops reading the
+response as soon as the requested number of <item>s has been parsed.
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# feedparser's own description sanitizer, so both parse paths return the same HTML
+try:
+    from feedparser.sanitizer import _sanitize_html
+except ImportError:
+    _sanitize_html = None
+
+# Largest episode limit worth stream-parsing; bigger requests go through feedparser
+STREAM_PARSE_MAX_ITEMS = 5
+
+
+def _parse_pub_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 822 pubDate into a UTC datetime (to the second, like feedparser)."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _item_to_episode(item: ET.Element) -> Optional[Dict]:
+    """
+    Convert an RSS 2.0 <item> to the episode dict returned by fetch_episodes.
+
+    Only un-namespaced children are read, so itunes:title and friends don't
+    shadow the plain RSS fields. The description is run through feedparser's
+    HTML sanitizer so it matches entry.summary from the feedparser path.
+
+    Returns:
+        Episode dictionary, or None if the item has no audio enclosure
+    """
+    fields = {}
+    audio_url = None
+    for child in item:
+        if child.tag == 'enclosure':
+            if audio_url is None and 'audio' in (child.get('type') or ''):
+                audio_url = child.get('url')
+        elif child.tag in ('title', 'description', 'pubDate', 'guid') and child.tag not in fields:
+            fields[child.tag] = (child.text or '').strip()
+
+    if not audio_url:
+        return None
+
+    description = fields.get('description', '')
+    if description and _sanitize_html is not None:
+        description = _sanitize_html(description, 'utf-8', 'text/html')
+
+    return {
+        'title': fields.get('title') or 'Unknown Title',
+        'url': audio_url,
+        'date': _parse_pub_date(fields.get('pubDate')),
+        'description': description,
+        'guid': fields.get('guid') or audio_url
+    }
+
+
+def stream_first_episodes(chunks: Iterable[bytes], limit: int) -> Tuple[List[Dict], Optional[bytes]]:
+    """
+    Parse the first `limit` RSS items from a stream of response chunks.
+
+    Reading stops once `limit` items have been seen, as with
+    feedparser's entries[:limit] (items without audio are skipped, not replaced).
+    Feeds this parser can't handle (Atom, RSS 1.0, malformed XML) are read to
+    the end and returned as raw bytes for feedparser instead.
+
+    Args:
+        chunks: Response body chunks (e.g. response.iter_content())
+        limit: Number of items to read
+
+    Returns:
+        Tuple of (episodes, None) when parsed here, or ([], body) when the
+        caller should fall back to feedparser.parse(body)
+    """
+    parser = ET.XMLPullParser(events=('end',))
+    body = bytearray()
+    episodes = []
+    items_seen = 0
+    chunk_iter = iter(chunks)
+
+    try:
+        for chunk in chunk_iter:
+            body += chunk
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag != 'item':
+                    continue
+                items_seen += 1
+                episode = _item_to_episode(elem)
+                elem.clear()
+                if episode:
+                    episodes.append(episode)
+                if items_seen >= limit:
+                    return episodes, None
+        parser.close()
+    except ET.ParseError:
+        for chunk in chunk_iter:
+            body += chunk
+        return [], bytes(body)
+
+    if items_seen == 0:
+        return [], bytes(body)
+    return episodes, None
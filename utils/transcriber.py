@@ -4,10 +4,12 @@ import json
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
+import numpy as np
 import whisper
 
 from utils.database import P3Database
+from utils.audio import load_audio
 
 # Optional Parakeet MLX support
 try:
@@ -39,13 +41,13 @@ class AudioTranscriber:
             print(f"Loading Parakeet model: {self.parakeet_model}")
             self.parakeet = parakeet_from_pretrained(self.parakeet_model)
 
-    def transcribe_with_whisper(self, audio_path: str) -> Dict[str, Any]:
-        """Transcribe audio using OpenAI Whisper."""
+    def transcribe_with_whisper(self, audio: Union[str, np.ndarray]) -> Dict[str, Any]:
+        """Transcribe audio using OpenAI Whisper (file path or 16kHz mono float32 array)."""
         self._load_whisper()
         
         try:
             result = self.whisper.transcribe(
-                audio_path,
+                audio,
                 word_timestamps=True,
                 verbose=False
             )
@@ -125,7 +127,9 @@ class AudioTranscriber:
         if self.use_parakeet:
             result = self.transcribe_with_parakeet(episode['file_path'])
         else:
-            result = self.transcribe_with_whisper(episode['file_path'])
+            # Decode up front so Whisper skips its own ffmpeg load; fall back to the path
+            audio = load_audio(episode['file_path'])
+            result = self.transcribe_with_whisper(audio if audio is not None else episode['file_path'])
         
         if not result:
             return False
@@ -3,11 +3,11 @@
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-import requests
 import time
 from datetime import timedelta
 
 from utils.postgres_db import PostgresDB
+from utils.http_client import get_session
 from utils.config import get_groq_api_key, get_groq_whisper_model
 from utils.audio_chunking import chunk_audio_file, cleanup_chunks, get_audio_size_mb, get_audio_duration, MAX_CHUNK_SIZE_MB
 
@@ -25,6 +25,8 @@ class AudioTranscriber:
         self.api_key = api_key or get_groq_api_key()
         self.base_url = "https://api.groq.com/openai/v1"
         self.model = get_groq_whisper_model()
+        # Episode row as written by the last successful transcribe_episode() call
+        self.last_saved_episode = None
 
     def transcribe_audio_chunk(self, audio_path: Path, offset_seconds: float = 0.0, chunk_info: str = "") -> Optional[Dict[str, Any]]:
         """
@@ -83,7 +85,7 @@ class AudioTranscriber:
                 }
                 
                 print(f"     🔄 Sending request to Groq API...")
-                response = requests.post(url, files=files, data=data, headers=headers, timeout=600)
+                response = get_session().post(url, files=files, data=data, headers=headers, timeout=600)
                 upload_time = time.time() - upload_start
                 
                 print(f"     ✅ Upload complete ({upload_time:.1f}s)")
@@ -291,12 +293,9 @@ class AudioTranscriber:
             print(f"\n❌ Transcription failed for episode {episode_id}")
             return False
 
-        # Store transcript segments in PostgreSQL
+        # Store transcript segments in PostgreSQL (also sets status to 'transcribed')
         print(f"\n💾 Saving transcript to PostgreSQL...")
-        self.db.add_transcript_segments(episode_id, result['segments'])
-        
-        # Update episode status
-        self.db.update_episode_status(episode_id, 'transcribed')
+        self.last_saved_episode = self.db.add_transcript_segments(episode_id, result['segments'])
         
         total_time = time.time() - episode_start_time
         print(f"\n{'='*70}")
@@ -1,6 +1,7 @@
 """Audio transcription using XAI API with LangChain and chunking support."""
 
 import os
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from langchain_openai import ChatOpenAI
@@ -8,26 +9,35 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from utils.database import P3Database
 from utils.config import get_api_key
+from utils.http_client import get_httpx_client
 from utils.audio_chunking import chunk_audio_file, cleanup_chunks, get_audio_size_mb, MAX_CHUNK_SIZE_MB
 
+# Maximum number of in-flight XAI transcription requests across all threads
+MAX_CONCURRENT_REQUESTS = 5
+_api_semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
 
 class AudioTranscriber:
-    def __init__(self, db: P3Database, api_key: str = None):
+    def __init__(self, db: P3Database, api_key: str = None, http_client=None):
         """
         Initialize XAI transcriber with LangChain.
         
         Args:
             db: Database instance
             api_key: XAI API key (defaults to environment/secrets)
+            http_client: httpx.Client to send requests through (defaults to the shared pool)
         """
         self.db = db
         self.api_key = api_key or get_api_key()
+        # Serializes database access when episodes are transcribed from worker threads
+        self._db_lock = threading.Lock()
         
         # Initialize OpenAI-compatible client for XAI (still needed for audio)
         from openai import OpenAI
         self.client = OpenAI(
             api_key=self.api_key,
-            base_url="https://api.x.ai/v1"
+            base_url="https://api.x.ai/v1",
+            http_client=http_client or get_httpx_client()
         )
 
     def transcribe_audio_chunk(self, audio_path: Path, offset_seconds: float = 0.0) -> Optional[Dict[str, Any]]:
@@ -48,7 +58,7 @@ class AudioTranscriber:
             if file_size_mb > MAX_CHUNK_SIZE_MB:
                 print(f"Warning: Chunk {audio_path.name} is {file_size_mb:.1f}MB, may still be too large")
             
-            with open(audio_path, 'rb') as audio_file:
+            with _api_semaphore, open(audio_path, 'rb') as audio_file:
                 response = self.client.audio.transcriptions.create(
                     model="whisper-1",
                     file=audio_file,
@@ -165,7 +175,8 @@ class AudioTranscriber:
     def transcribe_episode(self, episode_id: int) -> bool:
         """Transcribe a single episode and store results."""
         # Get episode by ID (works for any status)
-        episode = self.db.get_episode_by_id(episode_id)
+        with self._db_lock:
+            episode = self.db.get_episode_by_id(episode_id)
         
         if not episode:
             print(f"Episode {episode_id} not found")
@@ -187,11 +198,12 @@ class AudioTranscriber:
         if not result:
             return False
 
-        # Store transcript segments in database
-        self.db.add_transcript_segments(episode_id, result['segments'])
-        
-        # Update episode status
-        self.db.update_episode_status(episode_id, 'transcribed')
+        with self._db_lock:
+            # Store transcript segments in database
+            self.db.add_transcript_segments(episode_id, result['segments'])
+            
+            # Update episode status
+            self.db.update_episode_status(episode_id, 'transcribed')
         
         print(f"✓ Transcribed: {episode['title']}")
         return True